@@ -12,5 +12,13 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MySurvey.settings')
+os.environ.setdefault('DJANGO_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
+
+# Replay submissions journaled before a crash or restart
+from django.conf import settings  # noqa: E402
+
+if settings.SURVEY_WRITE_BEHIND:
+    from app.journal import start_drainer
+    start_drainer()
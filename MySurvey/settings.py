@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 from pathlib import Path
 import os
+import tempfile
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -26,7 +27,7 @@ SECRET_KEY = 'django-insecure-=)im$oe7g&dpane3r(mxe!izu_sls1(^rlcrsf0kx6%k+0^z_0
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = False
 
-ALLOWED_HOSTS = ['']
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',')
 
 
 # Application definition
@@ -65,6 +66,8 @@ CRISPY_ALLOWED_TEMPLATE_PACKS = ("bulma",)
 CRISPY_TEMPLATE_PACK = "bulma"
 
 MIDDLEWARE = [
+    'app.metrics.MetricsMiddleware',
+    'app.query_detector.QueryGrowthMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -88,7 +91,8 @@ ROOT_URLCONF = 'MySurvey.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates with render times recorded for /metrics
+        'BACKEND': 'app.metrics.InstrumentedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -104,17 +108,101 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'MySurvey.wsgi.application'
 
+# Route the respondent and statistics pages to the async views in
+# app/async_views.py. MySurvey/asgi.py turns this on; under WSGI the sync
+# views are faster.
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS', '') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
+# DB_ENGINE selects the backend: 'sqlite' (default) or 'postgresql'.
+# DB_CONN_MAX_AGE keeps connections open between requests; put PgBouncer in
+# front of PostgreSQL for pooling and set DB_PGBOUNCER=1 when it runs in
+# transaction mode (server-side cursors don't survive it).
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'mysurvey'),
+            'USER': os.environ.get('DB_USER', 'mysurvey'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_PGBOUNCER', '') == '1',
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'TEST': {
+                # A file, not the usual in-memory database, so the worker
+                # processes of app.report_batch can open it too; one per run
+                'NAME': os.environ.get(
+                    'DB_TEST_NAME', os.path.join(tempfile.gettempdir(), f'mysurvey-test-{os.getpid()}.sqlite3'),
+                ),
+            },
+            'OPTIONS': {
+                # Seconds to wait for the writer lock; app/signals.py also
+                # switches on WAL and synchronous=NORMAL per connection
+                'timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 20)),
+            },
+        }
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Local memory by default; point DJANGO_CACHE_BACKEND/DJANGO_CACHE_LOCATION at
+# a shared cache (e.g. redis) when running more than one process.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', 'mysurvey'),
     }
 }
 
+# Survey definitions are invalidated on every write, the timeout only bounds
+# how long another process with its own local memory cache can lag behind
+SURVEY_DEFINITION_CACHE_TIMEOUT = int(os.environ.get('SURVEY_DEFINITION_CACHE_TIMEOUT', 300))
+
+# Write-behind mode: survey_list journals validated submissions to disk and a
+# background thread commits them in batches (see app/journal.py)
+SURVEY_WRITE_BEHIND = os.environ.get('SURVEY_WRITE_BEHIND', '') == '1'
+SURVEY_JOURNAL_DIR = os.environ.get('SURVEY_JOURNAL_DIR', BASE_DIR / 'journal')
+SURVEY_JOURNAL_BATCH_SIZE = int(os.environ.get('SURVEY_JOURNAL_BATCH_SIZE', 200))
+SURVEY_JOURNAL_DRAIN_INTERVAL = float(os.environ.get('SURVEY_JOURNAL_DRAIN_INTERVAL', 0.5))
+
+# Batch uploads from kiosks (app/api.py); with a token set, clients must send
+# "Authorization: Bearer <token>". Client timestamps are ignored without one.
+SURVEY_INGEST_TOKEN = os.environ.get('SURVEY_INGEST_TOKEN', '')
+SURVEY_INGEST_MAX_BATCH = int(os.environ.get('SURVEY_INGEST_MAX_BATCH', 1000))
+
+# Rendered respondent pages that don't depend on the request
+PAGE_CACHE_TIMEOUT = int(os.environ.get('PAGE_CACHE_TIMEOUT', 3600))
+
+# Where the statistics page and PDF report get star counts from: 'rollup'
+# (the QuestionStarRollup table) or 'numpy' (in-memory columns, see
+# app/analytics.py), keeping at most SURVEY_ANALYTICS_MAX_SURVEYS surveys
+SURVEY_STATISTICS_BACKEND = os.environ.get('SURVEY_STATISTICS_BACKEND', 'rollup')
+SURVEY_ANALYTICS_MAX_SURVEYS = int(os.environ.get('SURVEY_ANALYTICS_MAX_SURVEYS', 16))
+
+# Incremental statistics keep a mark on SurveyResponse.id. Outside SQLite an
+# id can become visible after higher ones, so the ids this far below the mark
+# are checked again; keep it above the number of responses saved while the
+# longest insert transaction (e.g. a batch upload) is open
+SURVEY_RESPONSE_ID_WINDOW = int(os.environ.get('SURVEY_RESPONSE_ID_WINDOW', 5000))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -152,12 +240,60 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 
-STATICFILES_DIRS = [
-    BASE_DIR / "app/static",
-]
-
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# collectstatic (or build_static_assets) writes content-hashed names plus
+# gzip/brotli copies; app.static_assets.serve_static sends them from STATIC_ROOT
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'app.static_assets.PrecompressedManifestStaticFilesStorage'},
+}
+
+# PDF reports are rendered by a small background thread pool and cached on
+# disk; the threads share the web process's GIL, so more workers add little
+PDF_REPORT_CACHE_DIR = os.environ.get('PDF_REPORT_CACHE_DIR', BASE_DIR / 'report_cache')
+PDF_REPORT_WORKERS = int(os.environ.get('PDF_REPORT_WORKERS', 2))
+# Responses per xhtml2pdf run; the layout's memory grows with this, not the
+# survey (merging the parts still grows with the page count, see app/reports.py)
+PDF_REPORT_CHUNK_SIZE = int(os.environ.get('PDF_REPORT_CHUNK_SIZE', 500))
+# Worker processes for batches of reports (build_survey_reports, admin action)
+PDF_REPORT_BATCH_WORKERS = int(os.environ.get('PDF_REPORT_BATCH_WORKERS', os.cpu_count() or 1))
+
+# Survey QR codes are rendered once into SURVEY_QR_DIR; they encode
+# SURVEY_QR_BASE_URL followed by the survey's respondent URL
+SURVEY_QR_DIR = os.environ.get('SURVEY_QR_DIR', BASE_DIR / 'qr_codes')
+SURVEY_QR_BASE_URL = os.environ.get('SURVEY_QR_BASE_URL', 'http://192.168.0.37:8000')
+
+# Prometheus metrics at /metrics, for scrapers on these addresses only
+METRICS_ALLOWED_IPS = os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+
+# Log a warning when a request runs the same query once per row (N+1);
+# on by default in development
+QUERY_DETECTOR_ENABLED = os.environ.get('QUERY_DETECTOR_ENABLED', '1' if DEBUG else '') == '1'
+QUERY_DETECTOR_THRESHOLD = int(os.environ.get('QUERY_DETECTOR_THRESHOLD', 5))
+
+# JSON log lines on stderr. The app's debug logs are sampled: set
+# SURVEY_LOG_LEVEL=DEBUG and SURVEY_LOG_SAMPLE_RATE (0-1) to turn them on.
+SURVEY_LOG_SAMPLE_RATE = float(os.environ.get('SURVEY_LOG_SAMPLE_RATE', 0.1))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {'()': 'app.logs.JsonFormatter'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'json'},
+    },
+    'loggers': {
+        'app': {
+            'handlers': ['console'],
+            'level': os.environ.get('SURVEY_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -16,6 +16,8 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from app.metrics import metrics_view
+from app.static_assets import serve_static
 from app.views import SurveyManagementView, CustomLoginView
 
 urlpatterns = [
@@ -25,4 +27,6 @@ urlpatterns = [
     path('accounts/login/', CustomLoginView.as_view(), name='account_login'),
     path('accounts/', include('allauth.urls')),
     path('surveys/', include('app.urls')),  # Include other survey-related URLs
+    path('metrics', metrics_view, name='metrics'),
+    path('static/<path:path>', serve_static, name='static'),
 ]
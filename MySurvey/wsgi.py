@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MySurvey.settings')
 
 application = get_wsgi_application()
+
+# Replay submissions journaled before a crash or restart
+from django.conf import settings  # noqa: E402
+
+if settings.SURVEY_WRITE_BEHIND:
+    from app.journal import start_drainer
+    start_drainer()
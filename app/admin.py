@@ -1,10 +1,241 @@
 # admin.py
+import calendar
+from datetime import datetime
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from .keyset import CURSOR_PARAMS, keyset_page, parse_cursor_params
 from .models import Department, Survey, SurveyQuestion, AnswerChoice, SurveyResponse, SurveyResponseAnswer
+from .report_batch import iter_survey_reports_zip, last_month, report_period
+from .streaming import streaming_content
+
+# Exact counts stop here; beyond it the admin shows an estimate or this many
+EXACT_COUNT_LIMIT = 10000
+
+
+def estimated_row_count(model):
+    """A cheap estimate of the rows in the model's table.
+
+    PostgreSQL keeps one in pg_class. Elsewhere the id range is used, which
+    only overestimates by the rows that were deleted.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+            row = cursor.fetchone()
+        # -1 until the table has been vacuumed or analyzed
+        if row and row[0] >= 0:
+            return row[0]
+    # Two queries: SQLite seeks MIN() or MAX() alone, but scans for both at once
+    ids = model._default_manager.values_list('pk', flat=True)
+    first, last = ids.order_by('pk').first(), ids.order_by('-pk').first()
+    return last - first + 1 if last is not None else 0
+
+
+def _is_id(search_term):
+    # isdigit() also passes "²", which int() rejects; the database binds 64 bits at most
+    return search_term.isdecimal() and int(search_term) < 2 ** 63
+
+
+class EstimatedCountPaginator(Paginator):
+    """A paginator that never counts more than EXACT_COUNT_LIMIT rows.
+
+    An unfiltered changelist of a big table is estimated from table
+    statistics. A filtered one is counted exactly up to the limit, which
+    caps the number of pages offered.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset.model)
+            if estimate > EXACT_COUNT_LIMIT:
+                return estimate
+        return queryset.order_by()[:EXACT_COUNT_LIMIT].count()
+
+
+def last_month_reports_zip(surveys):
+    """A streamed ZIP of last month's PDF report of every survey, rendered by the batch worker pool."""
+    start_date, end_date = last_month()
+    response = StreamingHttpResponse(
+        streaming_content(iter_survey_reports_zip(surveys, *report_period(start_date, end_date))),
+        content_type='application/zip',
+    )
+    response['Content-Disposition'] = f'attachment; filename="survey_reports_{start_date:%Y-%m}.zip"'
+    return response
+
+
+@admin.register(Department)
+class DepartmentAdmin(admin.ModelAdmin):
+    list_display = ('name',)
+    search_fields = ('name',)
+    actions = ('download_last_month_reports',)
+
+    @admin.action(description="Download last month's PDF reports of their surveys (ZIP)")
+    def download_last_month_reports(self, request, queryset):
+        return last_month_reports_zip(Survey.objects.filter(department__in=queryset))
+
+
+@admin.register(Survey)
+class SurveyAdmin(admin.ModelAdmin):
+    list_display = ('name', 'department')
+    list_select_related = ('department',)
+    actions = ('download_last_month_reports',)
+
+    @admin.action(description="Download last month's PDF reports (ZIP)")
+    def download_last_month_reports(self, request, queryset):
+        return last_month_reports_zip(Survey.objects.filter(pk__in=queryset.values('pk')))
+
+
+@admin.register(SurveyQuestion)
+class SurveyQuestionAdmin(admin.ModelAdmin):
+    list_display = ('question_text', 'survey')
+    list_select_related = ('survey',)
+
+
+@admin.register(AnswerChoice)
+class AnswerChoiceAdmin(admin.ModelAdmin):
+    list_display = ('question', 'choice_value')
+    list_select_related = ('question',)
+
+
+class KeysetChangeList(ChangeList):
+    """A changelist that reads one keyset page (app.keyset), newest first.
+
+    There is no COUNT and no OFFSET, so every page costs the same. The
+    cursor parameters are taken off the request in
+    KeysetPaginationMixin.changelist_view, before ChangeList would read them
+    as field lookups.
+    """
+
+    def get_results(self, request):
+        page = keyset_page(self.queryset, per_page=self.list_per_page, descending=True, **request.keyset_params)
+        self.keyset_links = page.links(request.keyset_query)
+        self.result_list = page.object_list
+        self.result_count = len(page)
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = None
+
+
+class KeysetPaginationMixin:
+    # For models with timestamp and id; column sorting would fight the cursor order
+    sortable_by = ()
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    def changelist_view(self, request, extra_context=None):
+        request.keyset_query = request.GET
+        request.keyset_params = parse_cursor_params(request.GET)
+        request.GET = request.GET.copy()
+        for name in CURSOR_PARAMS:
+            request.GET.pop(name, None)
+        return super().changelist_view(request, extra_context)
+
+
+class TimestampHierarchyFilter(admin.SimpleListFilter):
+    """Year, then month drill-down on timestamp, backed by its index.
+
+    Django's date_hierarchy lists the years and months that have rows with
+    SELECT DISTINCT over a truncated timestamp, which reads every row. Here
+    the years come from two index seeks (first and last timestamp) and a
+    selected year offers all its months, so the cost doesn't grow with the
+    table.
+    """
+    title = 'date'
+    parameter_name = 'date'
+
+    def _range(self):
+        # Naive local [start, end) of the selected year or month, or None
+        value = self.value() or ''
+        try:
+            if len(value) == 4:
+                return datetime(int(value), 1, 1), datetime(int(value) + 1, 1, 1)
+            year, month = map(int, value.split('-'))
+            return datetime(year, month, 1), datetime(year + month // 12, month % 12 + 1, 1)
+        except ValueError:
+            return None
+
+    def lookups(self, request, model_admin):
+        timestamps = model_admin.get_queryset(request).values_list('timestamp', flat=True)
+        first, last = timestamps.order_by('timestamp').first(), timestamps.order_by('-timestamp').first()
+        if first is None:
+            return []
+        years = range(timezone.localtime(last).year, timezone.localtime(first).year - 1, -1)
+        choices = [(str(year), str(year)) for year in years]
+
+        selected = (self.value() or '')[:4]
+        if selected.isdecimal():
+            index = next((i for i, (value, _) in enumerate(choices) if value == selected), len(choices) - 1)
+            months = [(f'{selected}-{month:02d}', f'{calendar.month_abbr[month]} {selected}') for month in range(1, 13)]
+            choices[index + 1:index + 1] = months
+        return choices
+
+    def queryset(self, request, queryset):
+        bounds = self._range()
+        if bounds is None:
+            return queryset
+        start, end = bounds
+        return queryset.filter(timestamp__gte=timezone.make_aware(start), timestamp__lt=timezone.make_aware(end))
+
+
+@admin.register(SurveyResponse)
+class SurveyResponseAdmin(KeysetPaginationMixin, admin.ModelAdmin):
+    list_display = ('id', 'survey', 'timestamp', 'ip_address')
+    list_select_related = ('survey',)
+    # Both walk the (survey, timestamp) or (timestamp, id) index
+    list_filter = ('survey', TimestampHierarchyFilter)
+    # A select of every survey on the change form; the id is enough
+    raw_id_fields = ('survey',)
+    search_fields = ('=idempotency_key',)
+    search_help_text = 'A response id or idempotency key.'
+
+    def get_search_results(self, request, queryset, search_term):
+        # Exact matches on unique columns only; a LIKE would scan the table
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if _is_id(search_term):
+            return queryset.filter(pk=int(search_term)), False
+        return queryset.filter(idempotency_key=search_term), False
+
+
+@admin.register(SurveyResponseAnswer)
+class SurveyResponseAnswerAdmin(admin.ModelAdmin):
+    list_display = ('id', 'response', 'question', 'answer')
+    # The response, question and choice are shown on every row
+    list_select_related = ('response', 'question', 'answer')
+    raw_id_fields = ('response', 'question', 'answer')
+    list_filter = ('response__survey',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    search_fields = ('=response__id',)
+    search_help_text = 'A response id.'
+
+    def get_ordering(self, request):
+        # Answers of one survey are found through the (survey, timestamp)
+        # index of their responses, so they are listed in that order; by
+        # id alone, all of the survey's answers would be sorted for a page
+        if 'response__survey__id__exact' in request.GET:
+            return ('-response__timestamp', '-response__id', '-id')
+        return super().get_ordering(request)
 
-admin.site.register(Department)
-admin.site.register(Survey)
-admin.site.register(SurveyQuestion)
-admin.site.register(AnswerChoice)
-admin.site.register(SurveyResponse)
-admin.site.register(SurveyResponseAnswer)
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if not _is_id(search_term):
+            return queryset.none(), False
+        return queryset.filter(response_id=int(search_term)), False
@@ -0,0 +1,148 @@
+# aggregates.py
+"""All-time answer count, sum and sum of squares per question, maintained incrementally.
+
+Each survey has a high-water mark on SurveyResponse.id, and QuestionAggregate
+holds the answers of its responses up to the mark. Outside SQLite an id is
+taken before its transaction commits, so ids can become visible out of
+order: the mark only moves up to SURVEY_RESPONSE_ID_WINDOW ids below the
+survey's newest response, and the answers of the responses above it are
+summed on every read instead. Backfill or repair with
+`manage.py refresh_question_aggregates [--rebuild]`.
+
+Deleting responses or answers subtracts the ones at or below the mark (the
+models' and querysets' delete() call subtract_answers()). Deleting a
+question or survey cascades to its QuestionAggregate rows. An edit resets
+the survey's aggregates and the next read recomputes them.
+"""
+import math
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BigIntegerField, Case, Count, F, Max, OuterRef, Subquery, Sum, Value, When
+
+from .models import QuestionAggregate, SurveyAggregateMark, SurveyResponse, SurveyResponseAnswer
+
+
+def _sums(answers):
+    return (
+        answers.values('question_id')
+        .annotate(
+            count=Count('id'),
+            total=Sum('answer__choice_value'),
+            total_squares=Sum(F('answer__choice_value') * F('answer__choice_value')),
+        )
+        .order_by()
+    )
+
+
+def _apply(rows, sign, survey_id=None):
+    # One UPDATE for all questions: field = field + CASE question_id WHEN ... END
+    rows = list(rows)
+    if not rows:
+        return
+    if survey_id is not None:
+        QuestionAggregate.objects.bulk_create(
+            [QuestionAggregate(survey_id=survey_id, question_id=row['question_id']) for row in rows],
+            ignore_conflicts=True,
+        )
+
+    def delta(field):
+        return Case(
+            *[When(question_id=row['question_id'], then=Value(sign * row[field])) for row in rows],
+            default=Value(0),
+            output_field=BigIntegerField(),
+        )
+
+    QuestionAggregate.objects.filter(question_id__in=[row['question_id'] for row in rows]).update(
+        count=F('count') + delta('count'),
+        total=F('total') + delta('total'),
+        total_squares=F('total_squares') + delta('total_squares'),
+    )
+
+
+def refresh_question_aggregates(survey_id):
+    """Fold in the answers of the survey's settled responses. Returns the number of answers."""
+    with transaction.atomic():
+        # The insert takes SQLite's write lock up front, select_for_update the row lock elsewhere
+        SurveyAggregateMark.objects.bulk_create([SurveyAggregateMark(survey_id=survey_id)], ignore_conflicts=True)
+        mark = SurveyAggregateMark.objects.select_for_update().get(survey_id=survey_id)
+        latest = SurveyResponse.objects.filter(survey_id=survey_id).aggregate(latest=Max('id'))['latest'] or 0
+        settled = latest - settings.SURVEY_RESPONSE_ID_WINDOW
+        if settled <= mark.last_response_id:
+            return 0
+
+        rows = list(_sums(SurveyResponseAnswer.objects.filter(
+            response__survey_id=survey_id, response_id__gt=mark.last_response_id, response_id__lte=settled,
+        )))
+        _apply(rows, 1, survey_id)
+        mark.last_response_id = settled
+        mark.save(update_fields=['last_response_id'])
+        return sum(row['count'] for row in rows)
+
+
+def subtract_answers(answers):
+    """Take answers that are about to be deleted back out of the aggregates.
+
+    Only answers at or below their survey's mark were ever folded in; the
+    rest are summed on read.
+    """
+    marks = SurveyAggregateMark.objects.filter(survey_id=OuterRef('response__survey_id')).values('last_response_id')
+    _apply(_sums(answers.filter(response_id__lte=Subquery(marks))), -1)
+
+
+def reset_question_aggregates(survey_ids):
+    """Drop the surveys' aggregates so the next read recomputes them from scratch."""
+    QuestionAggregate.objects.filter(survey_id__in=survey_ids).delete()
+    SurveyAggregateMark.objects.filter(survey_id__in=survey_ids).delete()
+
+
+def get_question_aggregates(survey_id):
+    """Return {question_id: {'count', 'avg', 'std'}} for the survey's answered questions.
+
+    Two queries: the folded rows, and the sums of the answers above the mark.
+    Once the newest of those is a window past the mark, they are folded in
+    for the next read.
+    """
+    # The mark is read with the rows, so a concurrent refresh can't count
+    # answers twice; without rows nothing was folded in yet
+    marks = SurveyAggregateMark.objects.filter(survey_id=survey_id).values('last_response_id')
+    folded = list(
+        QuestionAggregate.objects.filter(survey_id=survey_id)
+        .annotate(mark=Subquery(marks))
+        .values('question_id', 'count', 'total', 'total_squares', 'mark')
+    )
+    mark = folded[0]['mark'] if folded else 0
+    sums = {row['question_id']: row for row in folded}
+    latest = mark
+    for row in _sums(SurveyResponseAnswer.objects.filter(response__survey_id=survey_id, response_id__gt=mark)).annotate(
+        latest=Max('response_id'),
+    ):
+        latest = max(latest, row['latest'])
+        previous = sums.get(row['question_id'])
+        sums[row['question_id']] = row if previous is None else {
+            field: previous[field] + row[field] for field in ('count', 'total', 'total_squares')
+        }
+    if latest - settings.SURVEY_RESPONSE_ID_WINDOW > mark:
+        refresh_question_aggregates(survey_id)
+
+    aggregates = {}
+    for question_id, row in sums.items():
+        if not row['count']:
+            continue
+        mean = row['total'] / row['count']
+        aggregates[question_id] = {
+            'count': row['count'],
+            'avg': mean,
+            'std': math.sqrt(max(row['total_squares'] / row['count'] - mean * mean, 0.0)),
+        }
+    return aggregates
+
+
+def set_question_aggregates(survey_id, questions):
+    """Set avg_rating and std_rating of the survey's questions from their all-time aggregates."""
+    aggregates = get_question_aggregates(survey_id)
+    for question in questions:
+        aggregate = aggregates.get(question.id)
+        question.avg_rating = aggregate['avg'] if aggregate else None
+        question.std_rating = aggregate['std'] if aggregate else None
+    return questions
@@ -0,0 +1,303 @@
+# analytics.py
+"""Columnar, in-memory survey statistics on NumPy arrays.
+
+Each survey's answers are held as parallel arrays sorted by response time:
+timestamp (int64 microseconds since the epoch), question index (int16) and
+star value (int8). A date range becomes two `searchsorted` calls and every
+statistic is a `bincount` over that slice. New answers are appended by
+response id on each use. Outside SQLite a response id is taken before its
+transaction commits, so a lower id can show up after a higher one was read:
+each use also counts the survey's responses in the last
+SURVEY_RESPONSE_ID_WINDOW ids below the mark and, if the snapshot is missing
+any, reads their answers as well. Edits and deletes bump the survey's row in
+SurveyAnswersGeneration in the same transaction (see app/signals.py and the
+models' delete()), so every process sees it and rebuilds its arrays on the
+next use.
+
+SURVEY_STATISTICS_BACKEND picks 'numpy' or the 'rollup' table for the
+statistics page and the PDF report.
+"""
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import numpy as np
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .aggregates import set_question_aggregates
+from .models import SurveyAnswersGeneration, SurveyQuestion, SurveyResponse, SurveyResponseAnswer
+from .rollup import (
+    STAR_VALUES, aget_question_star_counts, get_question_star_counts as rollup_star_counts,
+    get_surveys_question_star_counts as rollup_surveys_star_counts,
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+_columns = OrderedDict()
+_lock = threading.Lock()
+
+
+def to_micros(value):
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def local_midnight_micros(date):
+    return to_micros(timezone.make_aware(datetime.combine(date, datetime.min.time())))
+
+
+def get_generation(survey_id):
+    """The survey's answers generation; 0 until something is edited or deleted."""
+    return SurveyAnswersGeneration.objects.filter(survey_id=survey_id).values_list('generation', flat=True).first() or 0
+
+
+def invalidate_survey_columns(survey_ids):
+    """Bump the surveys' generations; call it in the transaction that edits or deletes their answers."""
+    survey_ids = list(survey_ids)
+    if not survey_ids:
+        return
+    SurveyAnswersGeneration.objects.bulk_create(
+        [SurveyAnswersGeneration(survey_id=survey_id) for survey_id in survey_ids], ignore_conflicts=True,
+    )
+    SurveyAnswersGeneration.objects.filter(survey_id__in=survey_ids).update(generation=F('generation') + 1)
+
+
+class SurveyColumns:
+    """One immutable snapshot of a survey's answers."""
+
+    def __init__(self, survey_id, generation, question_ids, timestamps, questions, stars, last_response_id,
+                 recent_response_ids=frozenset()):
+        self.survey_id = survey_id
+        self.generation = generation
+        # question index -> SurveyQuestion id
+        self.question_ids = question_ids
+        self.timestamps = timestamps
+        self.questions = questions
+        self.stars = stars
+        self.last_response_id = last_response_id
+        # Responses read in the SURVEY_RESPONSE_ID_WINDOW ids up to the mark
+        self.recent_response_ids = recent_response_ids
+
+    @classmethod
+    def empty(cls, survey_id, generation):
+        return cls(
+            survey_id, generation, [],
+            np.empty(0, np.int64), np.empty(0, np.int16), np.empty(0, np.int8), 0,
+        )
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def with_rows(self, rows, response_ids=()):
+        """Return a new snapshot with (response_id, timestamp, question_id, star) rows added.
+
+        `response_ids` are further responses that were read, e.g. ones without answers.
+        """
+        response_ids = {row[0] for row in rows}.union(response_ids)
+        if not response_ids:
+            return self
+        last_response_id = max(self.last_response_id, *response_ids)
+        floor = last_response_id - settings.SURVEY_RESPONSE_ID_WINDOW
+        recent_response_ids = frozenset(
+            response_id for response_id in self.recent_response_ids.union(response_ids) if response_id > floor
+        )
+        if not rows:
+            return SurveyColumns(
+                self.survey_id, self.generation, self.question_ids, self.timestamps, self.questions, self.stars,
+                last_response_id, recent_response_ids,
+            )
+
+        question_ids = list(self.question_ids)
+        index = {question_id: i for i, question_id in enumerate(question_ids)}
+        for _, _, question_id, _ in rows:
+            if question_id not in index:
+                index[question_id] = len(question_ids)
+                question_ids.append(question_id)
+
+        timestamps = np.fromiter((to_micros(row[1]) for row in rows), np.int64, len(rows))
+        questions = np.fromiter((index[row[2]] for row in rows), np.int16, len(rows))
+        stars = np.fromiter((row[3] for row in rows), np.int8, len(rows))
+
+        timestamps = np.concatenate([self.timestamps, timestamps])
+        questions = np.concatenate([self.questions, questions])
+        stars = np.concatenate([self.stars, stars])
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            # Response ids and timestamps disagree for back-dated responses,
+            # e.g. ones replayed from the journal or imported with a timestamp
+            order = np.argsort(timestamps, kind='stable')
+            timestamps, questions, stars = timestamps[order], questions[order], stars[order]
+
+        return SurveyColumns(
+            self.survey_id, self.generation, question_ids, timestamps, questions, stars,
+            last_response_id, recent_response_ids,
+        )
+
+    def bounds(self, start_date=None, end_date=None):
+        """Slice bounds for inclusive local dates; None leaves that end open."""
+        lo = 0 if start_date is None else np.searchsorted(self.timestamps, local_midnight_micros(start_date), 'left')
+        hi = (
+            len(self.timestamps) if end_date is None or end_date == datetime.max.date()
+            else np.searchsorted(self.timestamps, local_midnight_micros(end_date + timedelta(days=1)), 'left')
+        )
+        return lo, hi
+
+
+def _new_rows(columns):
+    """Answer rows the snapshot is missing and the ids of the late responses among them.
+
+    That is every answer above the mark, plus those of responses in the
+    window below it that committed after the mark passed them. Counting the
+    window is one index range scan; its ids are only read on a mismatch.
+    """
+    answers = (
+        SurveyResponseAnswer.objects.filter(response__survey_id=columns.survey_id)
+        .order_by('response_id')
+        .values_list('response_id', 'response__timestamp', 'question_id', 'answer__choice_value')
+    )
+    rows = list(answers.filter(response_id__gt=columns.last_response_id).iterator(chunk_size=10000))
+    late = set()
+    if columns.last_response_id:
+        window = SurveyResponse.objects.filter(
+            survey_id=columns.survey_id,
+            id__gt=columns.last_response_id - settings.SURVEY_RESPONSE_ID_WINDOW,
+            id__lte=columns.last_response_id,
+        )
+        if window.count() != len(columns.recent_response_ids):
+            late = set(window.values_list('id', flat=True)) - columns.recent_response_ids
+            if late:
+                rows += answers.filter(response_id__in=late)
+    return rows, late
+
+
+def get_survey_columns(survey_id):
+    """Return the up-to-date SurveyColumns for a survey."""
+    generation = get_generation(survey_id)
+    with _lock:
+        columns = _columns.get(survey_id)
+    if columns is None or columns.generation != generation:
+        columns = SurveyColumns.empty(survey_id, generation)
+    # Snapshots are immutable, so the query runs without the lock; threads
+    # that read the same survey at once each fetch the new rows
+    columns = columns.with_rows(*_new_rows(columns))
+
+    with _lock:
+        current = _columns.get(survey_id)
+        # Keep whichever snapshot is newer if another thread got further
+        if current is None or (current.generation, current.last_response_id, len(current.recent_response_ids)) <= (
+            generation, columns.last_response_id, len(columns.recent_response_ids)
+        ):
+            _columns[survey_id] = columns
+        _columns.move_to_end(survey_id)
+        while len(_columns) > settings.SURVEY_ANALYTICS_MAX_SURVEYS:
+            _columns.popitem(last=False)
+    return columns
+
+
+def star_statistics(columns, start_date=None, end_date=None):
+    """Per-question star histograms and rating moments for a date range.
+
+    Returns {question_id: {'counts': {star: n}, 'answered': n, 'avg': x,
+    'std': x}}; avg and std are None for unanswered questions.
+    """
+    lo, hi = columns.bounds(start_date, end_date)
+    questions = columns.questions[lo:hi].astype(np.intp)
+    stars = columns.stars[lo:hi].astype(np.float64)
+    size = len(columns.question_ids)
+
+    answered = np.bincount(questions, minlength=size)
+    totals = np.bincount(questions, weights=stars, minlength=size)
+    squares = np.bincount(questions, weights=stars * stars, minlength=size)
+    bins = max(STAR_VALUES) + 1
+    in_range = (stars >= min(STAR_VALUES)) & (stars <= max(STAR_VALUES))
+    histogram = np.bincount(
+        questions[in_range] * bins + stars[in_range].astype(np.intp), minlength=size * bins,
+    ).reshape(size, bins)
+
+    statistics = {}
+    for i, question_id in enumerate(columns.question_ids):
+        count = int(answered[i])
+        mean = float(totals[i] / count) if count else None
+        statistics[question_id] = {
+            'counts': {star_value: int(histogram[i, star_value]) for star_value in STAR_VALUES},
+            'answered': count,
+            'avg': mean,
+            'std': float(np.sqrt(max(squares[i] / count - mean * mean, 0.0))) if count else None,
+        }
+    return statistics
+
+
+def bucket_trend(columns, start_date, end_date, bucket_starts):
+    """Answer count and average star value per question per bucket of local days.
+
+    `bucket_starts` are the first days of consecutive buckets, the first one
+    on or before start_date. Returns (question_ids, counts, averages); counts
+    and averages are (buckets, questions) arrays and averages are NaN where
+    nothing was answered.
+    """
+    edges = np.array([local_midnight_micros(date) for date in bucket_starts], np.int64)
+    lo, hi = columns.bounds(start_date, end_date)
+
+    buckets = np.searchsorted(edges, columns.timestamps[lo:hi], 'right') - 1
+    cells = buckets * len(columns.question_ids) + columns.questions[lo:hi].astype(np.intp)
+    shape = (len(bucket_starts), len(columns.question_ids))
+    counts = np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape)
+    totals = np.bincount(cells, weights=columns.stars[lo:hi], minlength=shape[0] * shape[1]).reshape(shape)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        averages = totals / counts
+    return list(columns.question_ids), counts, averages
+
+
+def daily_trend(columns, start_date, end_date):
+    """bucket_trend() with a bucket per local day; returns (dates, question_ids, counts, averages)."""
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    return (dates, *bucket_trend(columns, start_date, end_date, dates))
+
+
+def _set_statistics(questions, statistics):
+    for question in questions:
+        question_statistics = statistics.get(question.id)
+        for star_value in STAR_VALUES:
+            setattr(question, f'star_counts_{star_value}', question_statistics['counts'][star_value] if question_statistics else 0)
+        question.avg_rating = question_statistics['avg'] if question_statistics else None
+        question.std_rating = question_statistics['std'] if question_statistics else None
+    return questions
+
+
+def numpy_star_counts(survey, start_date=None, end_date=None):
+    """get_question_star_counts() computed from the in-memory columns; also sets std_rating."""
+    statistics = star_statistics(get_survey_columns(survey.id), start_date, end_date)
+    return _set_statistics(list(SurveyQuestion.objects.filter(survey=survey)), statistics)
+
+
+def question_star_counts(survey, start_date=None, end_date=None):
+    """Star counts, averages and standard deviations per question from the configured statistics backend."""
+    if settings.SURVEY_STATISTICS_BACKEND == 'numpy':
+        return numpy_star_counts(survey, start_date, end_date)
+    questions = rollup_star_counts(survey, start_date, end_date)
+    if start_date is None and end_date is None:
+        # All-time moments come from the running aggregates (app/aggregates.py)
+        set_question_aggregates(survey.id, questions)
+    return questions
+
+
+def surveys_question_star_counts(survey_ids, start_date=None, end_date=None):
+    """question_star_counts() for several surveys with one questions query; returns {survey_id: questions}."""
+    if settings.SURVEY_STATISTICS_BACKEND != 'numpy':
+        return rollup_surveys_star_counts(survey_ids, start_date, end_date)
+    by_survey = {survey_id: [] for survey_id in survey_ids}
+    for question in SurveyQuestion.objects.filter(survey_id__in=survey_ids).order_by('id'):
+        by_survey[question.survey_id].append(question)
+    for survey_id, questions in by_survey.items():
+        _set_statistics(questions, star_statistics(get_survey_columns(survey_id), start_date, end_date))
+    return by_survey
+
+
+async def aquestion_star_counts(survey, start_date=None, end_date=None):
+    if settings.SURVEY_STATISTICS_BACKEND == 'numpy':
+        return await sync_to_async(numpy_star_counts)(survey, start_date, end_date)
+    questions = await aget_question_star_counts(survey, start_date, end_date)
+    if start_date is None and end_date is None:
+        await sync_to_async(set_question_aggregates)(survey.id, questions)
+    return questions
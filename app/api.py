@@ -0,0 +1,357 @@
+# api.py
+"""JSON API for dashboards and kiosks.
+
+Bodies are encoded with orjson and compressed with brotli (when installed)
+or gzip if the client accepts it. The statistics ETag is derived from the
+survey's latest response id, its definition version and its answers
+generation (bumped by edits and deletes), so a matching If-None-Match is
+answered with 304 after one indexed query and no aggregation. The
+encoded body is also cached under the ETag.
+
+survey_trend_api returns the answer count and average rating of every
+question per day, week or month (app.trends), cached the same way.
+
+Kiosks that collect responses offline upload them in batches through
+survey_responses_api, which validates every item against the cached survey
+definition and stores the valid ones in one transaction.
+"""
+import gzip
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import OuterRef, Subquery
+from django.http import Http404, HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from .analytics import question_star_counts
+from .ingest import save_survey_responses
+from .keyset import parse_cursor_params
+from .models import Survey, SurveyResponse
+from .remarks import get_remarks_page
+from .rollup import STAR_VALUES
+from .survey_cache import get_survey_definition
+from .trends import check_bucket_count, get_survey_trend, parse_granularity, trend_range
+from .views import _filter_statistics_responses, _parse_statistics_dates
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only
+    brotli = None
+
+# Bodies smaller than this aren't worth compressing
+MIN_COMPRESS_LENGTH = 200
+STATISTICS_API_VERSION = 1
+# Kiosk clocks drift; timestamps further ahead than this are rejected
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+# Nor is anything older than the app; a kiosk with a reset clock reports 1970
+MIN_TIMESTAMP = datetime(2000, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _accepted_encoding(request):
+    accepted = {part.split(';')[0].strip() for part in request.headers.get('Accept-Encoding', '').split(',')}
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def _compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    # mtime=0 keeps the bytes, and so the strong ETag, the same for the same body
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def _tagged(etag, encoding):
+    # A strong ETag must change with the bytes, so compressed variants carry the encoding
+    return f'"{etag}-{encoding}"' if encoding else f'"{etag}"'
+
+
+def json_response(request, body, status=200, etag=None):
+    """An orjson-encoded body, compressed if the client accepts it.
+
+    Responses with an etag are always negotiated, small or not, so the
+    ETag checked before the body exists matches the one sent with it.
+    """
+    encoding = _accepted_encoding(request) if etag is not None or len(body) >= MIN_COMPRESS_LENGTH else None
+    response = HttpResponse(_compress(body, encoding) if encoding else body, content_type='application/json', status=status)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    if etag is not None:
+        response['ETag'] = _tagged(etag, encoding)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def _statistics_etag(survey_id, definition_version, query):
+    # The latest response id and the answers generation in one query
+    latest = SurveyResponse.objects.filter(survey_id=OuterRef('pk')).order_by('-id').values('id')[:1]
+    version = Survey.objects.filter(pk=survey_id).values_list(Subquery(latest), 'surveyanswersgeneration__generation').first()
+    data = repr((STATISTICS_API_VERSION, survey_id, version, definition_version, sorted(query.lists())))
+    return hashlib.md5(data.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def survey_statistics_payload(request, survey, start_date, end_date):
+    """What survey_statistics shows, as a dict ready for orjson."""
+    responses = _filter_statistics_responses(survey.get_responses(), start_date, end_date)
+    questions = question_star_counts(
+        survey,
+        start_date.date() if start_date else None,
+        end_date.date() if end_date else None,
+    )
+    remarks_page = get_remarks_page(responses, **parse_cursor_params(request.GET))
+    links = remarks_page.links(request.GET)
+    return {
+        'survey': {'id': survey.id, 'name': survey.name},
+        'start_date': start_date.date() if start_date else None,
+        'end_date': end_date.date() if end_date else None,
+        'total_responses': responses.count(),
+        'questions': [
+            {
+                'id': question.id,
+                'text': question.question_text,
+                'star_counts': {str(star): getattr(question, f'star_counts_{star}') for star in STAR_VALUES},
+                'average': question.avg_rating,
+            }
+            for question in questions
+        ],
+        'remarks': {
+            'results': [
+                {'id': row['id'], 'timestamp': row['timestamp'], 'remark': row['remark'], 'answers': row['count']}
+                for row in remarks_page
+            ],
+            # Relative, so the cached body doesn't depend on the host
+            **{name: request.path + link if link else None for name, link in links.items()},
+        },
+    }
+
+
+def survey_statistics_api(request, survey_id):
+    try:
+        definition = get_survey_definition(survey_id)
+        start_date, end_date = _parse_statistics_dates(request.GET.get('start_date', ''), request.GET.get('end_date', ''))
+    except Survey.DoesNotExist:
+        raise Http404('No such survey.')
+    except ValueError:
+        return json_response(request, orjson.dumps({'error': 'Invalid date format. Please use YYYY-MM-DD format.'}), 400)
+
+    etag = _statistics_etag(definition.survey.id, definition.version, request.GET)
+    tagged = _tagged(etag, _accepted_encoding(request))
+    not_modified = get_conditional_response(request, etag=tagged)
+    if not_modified is not None:
+        not_modified['ETag'] = tagged
+        patch_vary_headers(not_modified, ('Accept-Encoding',))
+        return not_modified
+
+    key = f'survey_statistics_json:{etag}'
+    body = cache.get(key)
+    if body is None:
+        body = orjson.dumps(survey_statistics_payload(request, definition.survey, start_date, end_date))
+        cache.set(key, body, timeout=settings.PAGE_CACHE_TIMEOUT)
+    return json_response(request, body, etag=etag)
+
+
+def survey_trend_api(request, survey_id):
+    """Answer counts and averages per question and bucket.
+
+    ?granularity=day|week|month (default week) with the optional start_date
+    and end_date of survey_statistics; an open range ends today and starts
+    DEFAULT_BUCKETS buckets back. A range with more than MAX_BUCKETS is a 400.
+    """
+    try:
+        definition = get_survey_definition(survey_id)
+        start_date, end_date = _parse_statistics_dates(request.GET.get('start_date', ''), request.GET.get('end_date', ''))
+    except Survey.DoesNotExist:
+        raise Http404('No such survey.')
+    except ValueError:
+        return json_response(request, orjson.dumps({'error': 'Invalid date format. Please use YYYY-MM-DD format.'}), 400)
+    try:
+        granularity = parse_granularity(request.GET.get('granularity'))
+    except ValueError as exc:
+        return json_response(request, orjson.dumps({'error': str(exc)}), 400)
+    start_date, end_date = trend_range(
+        start_date.date() if start_date else None, end_date.date() if end_date else None, granularity,
+    )
+    try:
+        check_bucket_count(start_date, end_date, granularity)
+    except ValueError as exc:
+        return json_response(request, orjson.dumps({'error': str(exc)}), 400)
+
+    # The range is resolved first so an open one gets a new ETag every day
+    query = request.GET.copy()
+    query.update({'start_date': str(start_date), 'end_date': str(end_date), 'granularity': granularity})
+    etag = _statistics_etag(definition.survey.id, definition.version, query)
+    tagged = _tagged(etag, _accepted_encoding(request))
+    not_modified = get_conditional_response(request, etag=tagged)
+    if not_modified is not None:
+        not_modified['ETag'] = tagged
+        patch_vary_headers(not_modified, ('Accept-Encoding',))
+        return not_modified
+
+    key = f'survey_trend_json:{etag}'
+    body = cache.get(key)
+    if body is None:
+        buckets, questions = get_survey_trend(definition.survey, start_date, end_date, granularity)
+        body = orjson.dumps({
+            'survey': {'id': definition.survey.id, 'name': definition.survey.name},
+            'granularity': granularity,
+            'start_date': start_date,
+            'end_date': end_date,
+            'buckets': [{'start': first_day, 'end': last_day} for first_day, last_day in buckets],
+            'questions': [
+                {
+                    'id': question.id,
+                    'text': question.question_text,
+                    'counts': [count for count, _ in question.trend],
+                    'averages': [average for _, average in question.trend],
+                }
+                for question in questions
+            ],
+        })
+        cache.set(key, body, timeout=settings.PAGE_CACHE_TIMEOUT)
+    return json_response(request, body, etag=etag)
+
+
+def validate_submission(item, definition, now, accept_timestamp=True):
+    """Return (submission, errors) for one uploaded response; submission is None if it is invalid.
+
+    The rules are those of SurveyResponseForm: every question of the survey
+    needs a star value and remarks are optional. Without accept_timestamp
+    the item's timestamp is ignored and the response gets the server time.
+    """
+    if not isinstance(item, dict):
+        return None, {'__all__': 'Expected an object.'}
+
+    errors = {}
+    answers = item.get('answers')
+    values = {}
+    if not isinstance(answers, dict):
+        errors['answers'] = 'Expected an object of question id to star value.'
+    else:
+        question_ids = {question.id for question in definition.questions}
+        unknown = sorted(key for key in answers if not key.isdecimal() or int(key) not in question_ids)
+        if unknown:
+            errors['answers'] = f'Unknown questions: {", ".join(map(str, unknown))}.'
+        for question_id in sorted(question_ids):
+            value = answers.get(str(question_id))
+            if value is None:
+                errors[f'question_{question_id}'] = 'This field is required.'
+            elif type(value) is not int or value not in STAR_VALUES:
+                errors[f'question_{question_id}'] = 'Expected a star value from 1 to 5.'
+            else:
+                values[question_id] = value
+
+    remarks = item.get('remarks') or ''
+    if not isinstance(remarks, str):
+        errors['remarks'] = 'Expected a string.'
+
+    key = item.get('idempotency_key')
+    if key is not None and (not isinstance(key, str) or not 0 < len(key) <= 64):
+        errors['idempotency_key'] = 'Expected a string of 1 to 64 characters.'
+
+    timestamp = None
+    if accept_timestamp and item.get('timestamp') is not None:
+        try:
+            timestamp = parse_datetime(item['timestamp']) if isinstance(item['timestamp'], str) else None
+        except ValueError:
+            # Well formed but impossible, e.g. February 30th
+            timestamp = None
+        if timestamp is None:
+            errors['timestamp'] = 'Expected an ISO 8601 date and time.'
+        else:
+            if timezone.is_naive(timestamp):
+                timestamp = timezone.make_aware(timestamp)
+            if timestamp > now + MAX_CLOCK_SKEW:
+                errors['timestamp'] = 'Timestamp is in the future.'
+            elif timestamp < MIN_TIMESTAMP:
+                errors['timestamp'] = f'Timestamp is before {MIN_TIMESTAMP.date()}.'
+
+    if errors:
+        return None, errors
+    return {
+        'survey_id': definition.survey.id,
+        'answers': values,
+        'remarks': remarks,
+        'timestamp': timestamp,
+        'idempotency_key': key,
+    }, None
+
+
+def _authorized(request):
+    token = settings.SURVEY_INGEST_TOKEN
+    if not token:
+        return True
+    return hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}')
+
+
+@csrf_exempt
+@require_POST
+def survey_responses_api(request, survey_id):
+    """Store a batch of uploaded responses.
+
+    The body is {"responses": [{"answers": {"<question id>": 1-5}, "remarks":
+    "...", "timestamp": "<ISO 8601>", "idempotency_key": "..."}, ...]}, where
+    all but answers are optional. Invalid items are reported and skipped, the rest are stored together.
+    Items whose idempotency_key is already stored are reported as
+    duplicates, so a kiosk can safely replay a batch that timed out.
+    Timestamps are only taken from authenticated clients: without a
+    SURVEY_INGEST_TOKEN anyone could backdate responses, so they are ignored.
+    """
+    if not _authorized(request):
+        return json_response(request, orjson.dumps({'error': 'Invalid or missing token.'}), 401)
+    try:
+        definition = get_survey_definition(survey_id)
+    except Survey.DoesNotExist:
+        raise Http404('No such survey.')
+    try:
+        items = orjson.loads(request.body)['responses']
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return json_response(request, orjson.dumps({'error': 'Expected {"responses": [...]}.'}), 400)
+    if not isinstance(items, list):
+        return json_response(request, orjson.dumps({'error': 'Expected {"responses": [...]}.'}), 400)
+    if len(items) > settings.SURVEY_INGEST_MAX_BATCH:
+        return json_response(request, orjson.dumps({
+            'error': f'At most {settings.SURVEY_INGEST_MAX_BATCH} responses per request.',
+        }), 413)
+
+    now = timezone.now()
+    results = []
+    submissions = []
+    for item in items:
+        submission, errors = validate_submission(item, definition, now, accept_timestamp=bool(settings.SURVEY_INGEST_TOKEN))
+        if errors:
+            results.append({'status': 'invalid', 'errors': errors})
+        else:
+            submission['ip_address'] = request.META.get('REMOTE_ADDR')
+            submissions.append((len(results), submission))
+            results.append(None)
+
+    created = save_survey_responses(
+        [submission for _, submission in submissions], known_choice_ids=definition.choice_ids,
+    )
+
+    # Stored keys come back on their response; anything else with a key was
+    # a duplicate, and responses without a key are returned in order
+    by_key = {response.idempotency_key: response for response in created if response.idempotency_key}
+    unkeyed = iter(response for response in created if not response.idempotency_key)
+    for index, submission in submissions:
+        key = submission['idempotency_key']
+        response = by_key.pop(key, None) if key else next(unkeyed)
+        results[index] = {'status': 'created', 'id': response.id} if response else {'status': 'duplicate'}
+
+    statuses = [result['status'] for result in results]
+    return json_response(request, orjson.dumps({
+        'created': statuses.count('created'),
+        'duplicates': statuses.count('duplicate'),
+        'invalid': statuses.count('invalid'),
+        'results': results,
+    }))
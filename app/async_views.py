@@ -0,0 +1,125 @@
+# async_views.py
+"""Native async versions of the respondent and statistics views.
+
+app/urls.py routes to these when settings.ASYNC_VIEWS is on, which
+MySurvey/asgi.py does by default. Under WSGI the sync views in views.py are
+used instead, since every async view would need its own event loop there.
+Reads go through the async ORM and cache APIs. The submission write runs in
+one sync_to_async call because the async ORM has no transactions.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.http import HttpResponse
+from django.shortcuts import redirect, render
+from django.urls import reverse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from .analytics import aquestion_star_counts
+from .forms import SurveyResponseForm
+from .ingest import get_answer_values, save_survey_response
+from .journal import append_submission, start_drainer
+from .keyset import parse_cursor_params
+from .models import Survey
+from .page_cache import asurvey_form_response, athank_you_page_cached, thank_you_page_cached
+from .remarks import aget_remarks_page
+from .survey_cache import aget_survey_definition
+from .trends import aget_survey_trend, fit_trend_range, granularity_links, parse_granularity
+from .views import _filter_statistics_responses, _parse_statistics_dates
+
+
+async def survey_list(request, survey_id=None):
+    if request.method == 'POST':
+        survey_id = request.POST.get('survey')
+
+        definition = await aget_survey_definition(survey_id)
+        form = SurveyResponseForm(request.POST, questions=definition.questions)
+
+        if form.is_valid():
+            if settings.SURVEY_WRITE_BEHIND:
+                # The fsync must not block the event loop
+                await sync_to_async(append_submission, thread_sensitive=False)(
+                    definition.survey.id, get_answer_values(definition.questions, form.cleaned_data),
+                    form.cleaned_data.get('remarks'), request.META.get('REMOTE_ADDR'),
+                )
+                start_drainer()
+            else:
+                await sync_to_async(save_survey_response)(
+                    definition.survey, definition.questions, form.cleaned_data,
+                    request.META.get('REMOTE_ADDR'), known_choice_ids=definition.choice_ids,
+                )
+
+            return redirect('thank_you_page')
+
+    elif survey_id is None:
+        return redirect('survey_selection')
+
+    definition = await aget_survey_definition(survey_id)
+    return await asurvey_form_response(request, definition)
+
+
+@cache_control(public=True, max_age=3600)
+@condition(
+    etag_func=lambda request: thank_you_page_cached()['etag'],
+    last_modified_func=lambda request: thank_you_page_cached()['last_modified'],
+)
+async def thank_you_page(request):
+    return HttpResponse((await athank_you_page_cached())['content'])
+
+
+async def survey_statistics(request, survey_id=0):
+    try:
+        survey = await Survey.objects.aget(pk=survey_id)
+    except Survey.DoesNotExist:
+        messages.warning(request, 'Invalid survey ID. Please select a valid survey.')
+        return redirect(reverse('survey_selection') + '?' + request.GET.urlencode())
+
+    start_date_str = request.GET.get('start_date', '')
+    end_date_str = request.GET.get('end_date', '')
+    try:
+        start_date, end_date = _parse_statistics_dates(start_date_str, end_date_str)
+    except ValueError:
+        messages.error(request, 'Invalid date format. Please use YYYY-MM-DD format.')
+        return redirect('survey_statistics_with_id', survey_id=survey_id)
+    try:
+        granularity = parse_granularity(request.GET.get('granularity'))
+    except ValueError as exc:
+        messages.error(request, str(exc))
+        return redirect('survey_statistics_with_id', survey_id=survey_id)
+    responses = _filter_statistics_responses(survey.get_responses(), start_date, end_date)
+
+    question_counts = await aquestion_star_counts(
+        survey,
+        start_date.date() if start_date else None,
+        end_date.date() if end_date else None,
+    )
+    # A range with too many buckets is shown at a coarser granularity
+    trend_start, trend_end, granularity = fit_trend_range(
+        start_date.date() if start_date else None,
+        end_date.date() if end_date else None,
+        granularity,
+    )
+    trend_buckets, _ = await aget_survey_trend(survey, trend_start, trend_end, granularity, questions=question_counts)
+
+    # The navbar checks user.is_authenticated; resolve the user here so the
+    # template doesn't load the session synchronously
+    request.user = await request.auser()
+
+    remarks_page = await aget_remarks_page(responses, **parse_cursor_params(request.GET))
+    context = {
+        'survey': survey,
+        'remarks_page': remarks_page,
+        'remarks_links': remarks_page.links(request.GET),
+        'total_responses': await responses.acount(),
+        'question_counts': question_counts,
+        'question_averages': question_counts,
+        'trend_granularity': granularity,
+        'trend_buckets': trend_buckets,
+        'trend_start': trend_start,
+        'trend_end': trend_end,
+        'trend_links': granularity_links(request.GET),
+        'start_date': start_date_str,
+        'end_date': end_date_str,
+    }
+    return render(request, 'survey_statistics.html', context)
@@ -0,0 +1,188 @@
+# benchmark.py
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from datetime import timedelta
+
+from django.db import connection, connections
+from django.test import Client
+from django.utils import timezone
+
+from .keyset import decode_cursor
+from .models import AnswerChoice, Department, Survey, SurveyQuestion, SurveyResponse, SurveyResponseAnswer
+from .remarks import get_remarks_page
+
+
+@contextmanager
+def scratch_database():
+    """Run the block against a freshly migrated throwaway database.
+
+    SQLite gets a file on disk instead of the usual in-memory test database so
+    that commit and fsync costs show up in the numbers.
+    """
+    old_name = connection.settings_dict['NAME']
+    old_test_name = connection.settings_dict['TEST']['NAME']
+    tmp_dir = None
+    if connection.vendor == 'sqlite':
+        tmp_dir = tempfile.mkdtemp(prefix='mysurvey-bench-')
+        connection.settings_dict['TEST']['NAME'] = os.path.join(tmp_dir, 'bench.sqlite3')
+
+    try:
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+    finally:
+        # settings.DATABASES shares this dict; a later test database must not get the scratch name
+        connection.settings_dict['TEST']['NAME'] = old_test_name
+        if tmp_dir:
+            os.rmdir(tmp_dir)
+
+
+def create_survey(question_count, name='Benchmark survey'):
+    department, _ = Department.objects.get_or_create(name='Benchmark')
+    survey = Survey.objects.create(name=name, description=name, department=department)
+    SurveyQuestion.objects.bulk_create([
+        SurveyQuestion(survey=survey, question_text=f'Question {i + 1}')
+        for i in range(question_count)
+    ])
+    return survey
+
+
+def seed_responses(survey, count, first=0, batch_size=5000):
+    """Bulk insert `count` responses with an answer to every question, one minute apart.
+
+    Faster than app.synthetic, but skips the rollup. `first`
+    continues the numbering (and timestamps) of an earlier call.
+    """
+    questions = list(survey.surveyquestion_set.all())
+    choices = {}
+    for question in questions:
+        for value in range(1, 6):
+            choices[question.id, value] = AnswerChoice.objects.get_or_create(question=question, choice_value=value)[0].id
+
+    start = timezone.now() - timedelta(days=365)
+    for offset in range(first, first + count, batch_size):
+        responses = SurveyResponse.objects.bulk_create([
+            SurveyResponse(
+                survey=survey,
+                ip_address='127.0.0.1',
+                timestamp=start + timedelta(minutes=i),
+                remarks=f'Remark {i}' if i % 3 else '',
+            )
+            for i in range(offset, min(offset + batch_size, first + count))
+        ])
+        SurveyResponseAnswer.objects.bulk_create([
+            SurveyResponseAnswer(
+                response_id=response.id,
+                question_id=question.id,
+                answer_id=choices[question.id, (response.id + question.id) % 5 + 1],
+            )
+            for response in responses
+            for question in questions
+        ], batch_size=batch_size)
+
+
+def remarks_page_params(survey, pages):
+    """Query parameters of the first `pages` remarks pages, as a reader following Next sends them.
+
+    The pages are addressed by cursor (app.keyset), so a benchmark that
+    wants more than the first page has to walk them once up front.
+    """
+    params, after = [{}], None
+    while len(params) < pages:
+        page = get_remarks_page(survey.get_responses(), after=after)
+        if page.next_cursor is None:
+            break
+        params.append({'after': page.next_cursor})
+        after = decode_cursor(page.next_cursor)
+    return params
+
+
+def measure(func, iterations):
+    """Call func(i) iterations times and return (elapsed seconds, calls per second)."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    elapsed = time.perf_counter() - start
+    return elapsed, iterations / elapsed if elapsed else float('inf')
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies, elapsed, errors=0, queries=None):
+    """Throughput, latency percentiles (in milliseconds) and, if given, queries per request."""
+    latencies = sorted(latencies)
+    summary = {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+    }
+    if queries:
+        summary['queries_mean'] = round(sum(queries) / len(queries), 2)
+        summary['queries_max'] = max(queries)
+    return summary
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def run_concurrently(make_request, total, clients=1, client_factory=Client):
+    """Call make_request(client, i) `total` times from `clients` threads and summarize().
+
+    Each thread gets its own test Client from client_factory. A response with a
+    4xx/5xx status or an exception counts as an error. Queries are counted
+    on the calling thread's connection.
+    """
+    local = threading.local()
+    latencies = []
+    queries = []
+    errors = []
+
+    def worker(i):
+        if not hasattr(local, 'client'):
+            local.client = client_factory()
+        counter = QueryCounter()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(counter):
+                response = make_request(local.client, i)
+            ok = response.status_code < 400
+        except Exception:
+            ok = False
+        elapsed = time.perf_counter() - start
+        if clients > 1:
+            connections.close_all()
+        if ok:
+            latencies.append(elapsed)
+            queries.append(counter.count)
+        else:
+            errors.append(elapsed)
+
+    start = time.perf_counter()
+    if clients > 1:
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            list(pool.map(worker, range(total)))
+    else:
+        for i in range(total):
+            worker(i)
+    return summarize(latencies, time.perf_counter() - start, errors=len(errors), queries=queries)
@@ -0,0 +1,73 @@
+# export.py
+import csv
+
+import orjson
+from django.utils import timezone
+
+from .models import SurveyQuestion, SurveyResponseAnswer
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def iter_response_rows(responses):
+    """Yield (response_id, timestamp, remarks, {question_id: star value}) per response.
+
+    Responses and answers are read with two server-side cursors, both ordered
+    by response id, and merged as they stream, so memory use does not depend
+    on the number of responses.
+    """
+    response_rows = (
+        responses.order_by('id')
+        .values_list('id', 'timestamp', 'remarks')
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    answer_rows = (
+        SurveyResponseAnswer.objects.filter(response__in=responses.values('id'))
+        .order_by('response_id', 'id')
+        .values_list('response_id', 'question_id', 'answer__choice_value')
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+    pending = next(answer_rows, None)
+    for response_id, timestamp, remarks in response_rows:
+        ratings = {}
+        while pending is not None and pending[0] <= response_id:
+            if pending[0] == response_id:
+                ratings[pending[1]] = pending[2]
+            pending = next(answer_rows, None)
+        yield response_id, timezone.localtime(timestamp), remarks, ratings
+
+
+class Echo:
+    # csv.writer only needs an object with a write() method
+    def write(self, value):
+        return value
+
+
+def iter_csv(survey, responses):
+    questions = list(SurveyQuestion.objects.filter(survey=survey).order_by('id'))
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(['response_id', 'timestamp'] + [q.question_text for q in questions] + ['remarks'])
+    for response_id, timestamp, remarks, ratings in iter_response_rows(responses):
+        yield writer.writerow(
+            [response_id, timestamp.isoformat()]
+            + [ratings.get(q.id, '') for q in questions]
+            + [remarks or '']
+        )
+
+
+def iter_ndjson(survey, responses):
+    for response_id, timestamp, remarks, ratings in iter_response_rows(responses):
+        yield orjson.dumps({
+            'response_id': response_id,
+            'timestamp': timestamp.isoformat(),
+            'ratings': {str(question_id): value for question_id, value in ratings.items()},
+            'remarks': remarks,
+        }) + b'\n'
+
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', iter_csv),
+    'ndjson': ('application/x-ndjson', iter_ndjson),
+}
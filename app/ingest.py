@@ -0,0 +1,145 @@
+# ingest.py
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import AnswerChoice, SurveyResponse, SurveyResponseAnswer
+from .rollup import record_star_counts
+from .survey_cache import invalidate_survey_definition
+
+
+def resolve_answer_choices(wanted):
+    """Map (question_id, choice_value) pairs to {pair: AnswerChoice id}.
+
+    Every existing choice is read with one query and the missing ones are
+    created with one bulk insert.
+    """
+    wanted = set(wanted)
+    if not wanted:
+        return {}
+
+    resolved = {}
+    rows = (
+        AnswerChoice.objects.filter(question_id__in={question_id for question_id, _ in wanted})
+        .order_by('id')
+        .values_list('id', 'question_id', 'choice_value')
+    )
+    for choice_id, question_id, choice_value in rows:
+        if (question_id, choice_value) in wanted:
+            resolved.setdefault((question_id, choice_value), choice_id)
+
+    missing = wanted - resolved.keys()
+    if missing:
+        # A concurrent submission may create the same choices first, so skip
+        # conflicts and read the ids back
+        AnswerChoice.objects.bulk_create(
+            [AnswerChoice(question_id=question_id, choice_value=choice_value) for question_id, choice_value in missing],
+            ignore_conflicts=True,
+        )
+        return resolve_answer_choices(wanted)
+
+    return resolved
+
+
+def get_answer_values(questions, cleaned_data):
+    """Return {question_id: choice_value} for the answered questions of a form."""
+    wanted = {}
+    for question in questions:
+        answer_choice_value = cleaned_data.get(f'question_{question.id}')
+        if answer_choice_value in (None, ''):
+            continue
+        wanted[question.id] = int(answer_choice_value)
+    return wanted
+
+
+def save_survey_response(survey, questions, cleaned_data, ip_address, known_choice_ids=None):
+    """Store a validated SurveyResponseForm submission.
+
+    The response row (with its remarks) is inserted once, all answer rows are
+    bulk-inserted and the star-count rollup is updated, all inside one
+    transaction. `known_choice_ids` is an optional {(question_id,
+    choice_value): AnswerChoice id} map, e.g. from the survey definition
+    cache; when it covers every answer no lookup query is needed.
+    """
+    responses = save_survey_responses([{
+        'survey_id': survey.id,
+        'answers': get_answer_values(questions, cleaned_data),
+        'remarks': cleaned_data.get('remarks'),
+        'ip_address': ip_address,
+    }], known_choice_ids)
+    return responses[0]
+
+
+def save_survey_responses(submissions, known_choice_ids=None):
+    """Store many already validated submissions in one transaction.
+
+    Each submission is a dict with survey_id, answers ({question_id:
+    choice_value}), remarks, ip_address and optionally timestamp and
+    idempotency_key. Submissions whose idempotency_key is already stored are
+    skipped. Returns the created SurveyResponse objects.
+    """
+    known_choice_ids = known_choice_ids or {}
+
+    with transaction.atomic():
+        keys = [s['idempotency_key'] for s in submissions if s.get('idempotency_key')]
+        if keys:
+            seen = set(SurveyResponse.objects.filter(idempotency_key__in=keys).values_list('idempotency_key', flat=True))
+            fresh = []
+            for submission in submissions:
+                key = submission.get('idempotency_key')
+                if key in seen:
+                    continue
+                if key:
+                    seen.add(key)
+                fresh.append(submission)
+            submissions = fresh
+        if not submissions:
+            return []
+
+        wanted = {
+            (question_id, choice_value)
+            for submission in submissions
+            for question_id, choice_value in submission['answers'].items()
+        }
+        choice_ids = {pair: known_choice_ids.get(pair) for pair in wanted}
+        if None in choice_ids.values():
+            choice_ids = resolve_answer_choices(wanted)
+            # The cached definitions don't know the new choices yet
+            survey_ids = {s['survey_id'] for s in submissions}
+            transaction.on_commit(lambda: [invalidate_survey_definition(survey_id) for survey_id in survey_ids])
+
+        now = timezone.now()
+        responses = [
+            SurveyResponse(
+                survey_id=submission['survey_id'],
+                ip_address=submission['ip_address'],
+                timestamp=submission.get('timestamp') or now,
+                remarks=submission.get('remarks'),
+                idempotency_key=submission.get('idempotency_key') or None,
+            )
+            for submission in submissions
+        ]
+        if len(responses) == 1 or not connection.features.can_return_rows_from_bulk_insert:
+            for response in responses:
+                response.save(force_insert=True)
+        else:
+            SurveyResponse.objects.bulk_create(responses)
+
+        answers = []
+        star_counts = defaultdict(list)
+        for response, submission in zip(responses, submissions):
+            date = timezone.localdate(response.timestamp)
+            for question_id, choice_value in submission['answers'].items():
+                answers.append(SurveyResponseAnswer(
+                    response_id=response.id,
+                    question_id=question_id,
+                    answer_id=choice_ids[question_id, choice_value],
+                ))
+                star_counts[response.survey_id].append((question_id, date, choice_value))
+        SurveyResponseAnswer.objects.bulk_create(answers, batch_size=1000)
+
+        for survey_id, counts in star_counts.items():
+            record_star_counts(survey_id, counts)
+
+    return responses
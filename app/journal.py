@@ -0,0 +1,284 @@
+# journal.py
+"""Write-behind journal for survey submissions.
+
+With SURVEY_WRITE_BEHIND enabled, survey_list validates the form, appends the
+submission to an fsync'ed JSON-lines file and redirects straight away. A
+background drainer commits the journal to the database in batched
+transactions and records how far it got in an offset file. Every entry
+carries an idempotency key, so replaying after a crash never stores a
+response twice. Entries that can't be parsed or stored are set aside in a
+rejected file; when the database itself is unavailable (locked, or the
+connection is down) the drain stops where it is and the next one retries.
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import orjson
+from django.conf import settings
+from django.db import InterfaceError, OperationalError, close_old_connections
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .ingest import save_survey_responses
+from .survey_cache import get_survey_definition
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of one process are serialised
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Errors that say nothing about the entry being stored; its batch is retried
+TRANSIENT_ERRORS = (OperationalError, InterfaceError)
+
+_append_lock = threading.Lock()
+_drain_lock = threading.Lock()
+_drainer = None
+
+
+def journal_path():
+    return Path(settings.SURVEY_JOURNAL_DIR) / 'submissions.jsonl'
+
+
+def _offset_path():
+    return Path(settings.SURVEY_JOURNAL_DIR) / 'submissions.offset'
+
+
+def _rejected_path():
+    return Path(settings.SURVEY_JOURNAL_DIR) / 'submissions.rejected.jsonl'
+
+
+@contextmanager
+def _locked(handle, blocking=True):
+    # Yields False when blocking is off and another process holds the lock
+    if fcntl is None:
+        yield True
+        return
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+    except BlockingIOError:
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def append_submission(survey_id, answers, remarks, ip_address):
+    """Durably journal one validated submission; it is committed later by the drainer."""
+    line = orjson.dumps({
+        'key': uuid.uuid4().hex,
+        'survey_id': int(survey_id),
+        'answers': {str(question_id): value for question_id, value in answers.items()},
+        'remarks': remarks,
+        'ip_address': ip_address,
+        'timestamp': timezone.now().isoformat(),
+    }) + b'\n'
+
+    path = journal_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _append_lock, open(path, 'ab') as handle, _locked(handle):
+        handle.write(line)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def _read_offset():
+    try:
+        return int(_offset_path().read_text() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def _write_offset(offset):
+    tmp_path = _offset_path().with_suffix('.tmp')
+    with open(tmp_path, 'w') as handle:
+        handle.write(str(offset))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, _offset_path())
+
+
+def _read_batch(offset, batch_size):
+    """Return (lines, new offset) for up to batch_size complete lines after offset."""
+    lines = []
+    with open(journal_path(), 'rb') as handle:
+        handle.seek(offset)
+        while len(lines) < batch_size:
+            line = handle.readline()
+            if not line.endswith(b'\n'):
+                break  # end of file, or a line that is still being written
+            offset += len(line)
+            lines.append(line)
+    return lines, offset
+
+
+def _parse(line):
+    entry = orjson.loads(line)
+    definition = get_survey_definition(entry['survey_id'])
+    question_ids = {question.id for question in definition.questions}
+    return {
+        'survey_id': entry['survey_id'],
+        # Questions deleted since the submission was journaled are dropped
+        'answers': {
+            int(question_id): int(value)
+            for question_id, value in entry['answers'].items()
+            if int(question_id) in question_ids
+        },
+        'remarks': entry['remarks'],
+        'ip_address': entry['ip_address'],
+        'timestamp': parse_datetime(entry['timestamp']),
+        'idempotency_key': entry['key'],
+    }
+
+
+def _reject(rejected):
+    with open(_rejected_path(), 'ab') as handle:
+        for line, error in rejected:
+            logger.error('Rejected journaled survey submission: %s', error)
+            handle.write(line)
+
+
+def _commit(lines):
+    """Store a batch of journal lines, setting aside the ones that fail.
+
+    TRANSIENT_ERRORS propagate, with nothing rejected, so the caller can
+    retry the whole batch; entries stored before the error are skipped then
+    by their idempotency keys.
+    """
+    submissions, rejected = [], []
+    for line in lines:
+        try:
+            submissions.append((line, _parse(line)))
+        except TRANSIENT_ERRORS:
+            raise
+        except Exception as error:
+            rejected.append((line, error))
+
+    try:
+        save_survey_responses([submission for _, submission in submissions])
+    except TRANSIENT_ERRORS:
+        raise
+    except Exception:
+        # Find the bad entries one by one so the rest still gets stored
+        for line, submission in submissions:
+            try:
+                save_survey_responses([submission])
+            except TRANSIENT_ERRORS:
+                raise
+            except Exception as error:
+                rejected.append((line, error))
+
+    if rejected:
+        _reject(rejected)
+
+
+def drain_journal(batch_size=None):
+    """Commit every complete journal entry. Returns the number of entries processed.
+
+    Only one drainer runs at a time, across threads and (where flock exists)
+    processes; the others return 0 immediately.
+    """
+    batch_size = batch_size or settings.SURVEY_JOURNAL_BATCH_SIZE
+    path = journal_path()
+    if not path.exists():
+        return 0
+
+    if not _drain_lock.acquire(blocking=False):
+        return 0
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_suffix('.lock'), 'ab') as lock_handle, _locked(lock_handle, blocking=False) as acquired:
+            if not acquired:
+                return 0
+
+            drained = 0
+            offset = _read_offset()
+            while True:
+                lines, new_offset = _read_batch(offset, batch_size)
+                if not lines:
+                    break
+                try:
+                    _commit(lines)
+                except TRANSIENT_ERRORS as error:
+                    # Keep the offset; the batch is tried again next time
+                    logger.warning('Survey journal drain paused: %s', error)
+                    return drained
+                _write_offset(new_offset)
+                offset = new_offset
+                drained += len(lines)
+
+            _compact(offset)
+            return drained
+    finally:
+        _drain_lock.release()
+
+
+def _compact(offset):
+    # Start a fresh file once everything has been committed. The offset is
+    # reset first: a crash in between replays committed entries, which their
+    # idempotency keys skip, rather than leaving an offset past the end of
+    # the new file that would hide the next submissions.
+    path = journal_path()
+    with _append_lock, open(path, 'r+b') as handle, _locked(handle):
+        size = handle.seek(0, os.SEEK_END)
+        if size and size == offset:
+            _write_offset(0)
+            handle.truncate(0)
+
+
+def recover_journal():
+    """Terminate a line left half-written by a crash so the drainer can skip past it."""
+    path = journal_path()
+    if not path.exists():
+        return
+    with _append_lock, open(path, 'r+b') as handle, _locked(handle):
+        size = handle.seek(0, os.SEEK_END)
+        if size:
+            handle.seek(size - 1)
+            if handle.read(1) != b'\n':
+                handle.write(b'\n')
+                handle.flush()
+                os.fsync(handle.fileno())
+
+
+def pending_entries():
+    """Queue depth: the number of journaled submissions not yet committed."""
+    path = journal_path()
+    if not path.exists():
+        return 0
+    pending = 0
+    with open(path, 'rb') as handle:
+        handle.seek(_read_offset())
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            pending += chunk.count(b'\n')
+    return pending
+
+
+def _drain_forever():
+    while True:
+        try:
+            drain_journal()
+        except Exception:
+            logger.exception('Survey journal drain failed')
+        finally:
+            close_old_connections()
+        time.sleep(settings.SURVEY_JOURNAL_DRAIN_INTERVAL)
+
+
+def start_drainer():
+    """Replay anything left from a previous run and start the background drainer once."""
+    global _drainer
+    with _append_lock:
+        if _drainer is not None:
+            return
+        _drainer = threading.Thread(target=_drain_forever, name='survey-journal-drainer', daemon=True)
+    recover_journal()
+    _drainer.start()
@@ -0,0 +1,141 @@
+# keyset.py
+"""Cursor (keyset) pagination on (timestamp, id).
+
+A page is read with WHERE (timestamp, id) > cursor ORDER BY timestamp, id
+LIMIT n + 1 instead of an OFFSET, so the database seeks straight to it
+through the (survey, timestamp) or (timestamp, id) index of survey_response
+and every page costs the same however deep it is. There are no page numbers:
+a page links to the first and last page and to its neighbours by cursor.
+
+A cursor is the timestamp in microseconds and the id of the row at the edge
+of a page, e.g. "1706745600000000_1234".
+"""
+from datetime import datetime, timedelta, timezone
+
+from django.db.models import Q
+from django.utils.http import urlencode
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+CURSOR_PARAMS = ('after', 'before', 'last')
+
+
+def encode_cursor(timestamp, pk):
+    return f'{(timestamp - EPOCH) // timedelta(microseconds=1)}_{pk}'
+
+
+def decode_cursor(cursor):
+    """Return (timestamp, id) for a cursor; raises ValueError if it is malformed.
+
+    A timestamp outside the range of datetime raises OverflowError.
+    """
+    microseconds, pk = cursor.split('_')
+    pk = int(pk)
+    # Ids are 64-bit integers in the database; a larger one could not even be bound
+    if not 0 <= pk < 2 ** 63:
+        raise ValueError(f'Cursor id {pk} is out of range.')
+    return EPOCH + timedelta(microseconds=int(microseconds)), pk
+
+
+def parse_cursor_params(query):
+    """keyset_page() keyword arguments from a QueryDict; malformed cursors are ignored."""
+    params = {'last': query.get('last') == '1'}
+    for name in ('after', 'before'):
+        try:
+            params[name] = decode_cursor(query[name]) if query.get(name) else None
+        except (ValueError, OverflowError):
+            params[name] = None
+    return params
+
+
+def _field(row, name):
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+class KeysetPage:
+    def __init__(self, rows, has_previous, has_next):
+        self.object_list = rows
+        self.has_previous = has_previous
+        self.has_next = has_next
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def _cursor(self, row):
+        return encode_cursor(_field(row, 'timestamp'), _field(row, 'id'))
+
+    @property
+    def previous_cursor(self):
+        return self._cursor(self.object_list[0]) if self.has_previous and self.object_list else None
+
+    @property
+    def next_cursor(self):
+        return self._cursor(self.object_list[-1]) if self.has_next and self.object_list else None
+
+    def links(self, query):
+        """Query strings for the first, previous, next and last page, keeping the other parameters of `query`."""
+        params = [(key, value) for key, values in query.lists() if key not in CURSOR_PARAMS + ('page',) for value in values]
+
+        def link(**cursor):
+            return '?' + urlencode(params + list(cursor.items()))
+
+        return {
+            'first': link() if self.has_previous else None,
+            'previous': link(before=self.previous_cursor) if self.previous_cursor else None,
+            'next': link(after=self.next_cursor) if self.next_cursor else None,
+            'last': link(last=1) if self.has_next else None,
+        }
+
+
+def _beyond(cursor, greater):
+    # (timestamp, id) > cursor, written with a plain range on timestamp so
+    # the index can seek to it
+    timestamp, pk = cursor
+    if greater:
+        return Q(timestamp__gte=timestamp) & (Q(timestamp__gt=timestamp) | Q(id__gt=pk))
+    return Q(timestamp__lte=timestamp) & (Q(timestamp__lt=timestamp) | Q(id__lt=pk))
+
+
+def _page_query(queryset, after, before, last, per_page, descending):
+    """Return (sliced queryset, whether it reads backwards)."""
+    ordering = ('-timestamp', '-id') if descending else ('timestamp', 'id')
+    if before is not None or last:
+        queryset = queryset.order_by(*(field[1:] if field.startswith('-') else f'-{field}' for field in ordering))
+        if before is not None:
+            queryset = queryset.filter(_beyond(before, greater=descending))
+        return queryset[:per_page + 1], True
+    queryset = queryset.order_by(*ordering)
+    if after is not None:
+        queryset = queryset.filter(_beyond(after, greater=not descending))
+    return queryset[:per_page + 1], False
+
+
+def _make_page(rows, per_page, backwards, cursor_given):
+    more = len(rows) > per_page
+    rows = rows[:per_page]
+    if backwards:
+        return KeysetPage(rows[::-1], has_previous=more, has_next=cursor_given)
+    return KeysetPage(rows, has_previous=cursor_given, has_next=more)
+
+
+def keyset_page(queryset, after=None, before=None, last=False, per_page=20, descending=False):
+    """Return the page of `queryset` after or before a cursor, the last page, or else the first page.
+
+    A cursor past either end falls back to the last or first page.
+    """
+    sliced, backwards = _page_query(queryset, after, before, last, per_page, descending)
+    page = _make_page(list(sliced), per_page, backwards, after is not None or before is not None)
+    if not page.object_list and (after is not None or before is not None):
+        return keyset_page(queryset, last=after is not None, per_page=per_page, descending=descending)
+    return page
+
+
+async def akeyset_page(queryset, after=None, before=None, last=False, per_page=20, descending=False):
+    """Async version of keyset_page()."""
+    sliced, backwards = _page_query(queryset, after, before, last, per_page, descending)
+    page = _make_page([row async for row in sliced], per_page, backwards, after is not None or before is not None)
+    if not page.object_list and (after is not None or before is not None):
+        return await akeyset_page(queryset, last=after is not None, per_page=per_page, descending=descending)
+    return page
@@ -0,0 +1,39 @@
+# logs.py
+"""Structured, sampled logging.
+
+Call sites guard with `sampled()` so that when the level is off or the
+sample misses, the log data is never built:
+
+    if sampled(logger):
+        logger.debug('survey submitted', extra={'data': {'survey_id': survey_id}})
+
+JsonFormatter writes one JSON object per record, with the `data` extra
+merged in.
+"""
+import logging
+import random
+
+import orjson
+from django.conf import settings
+
+
+def sampled(logger, level=logging.DEBUG, rate=None):
+    """True if a record at `level` should be logged, keeping SURVEY_LOG_SAMPLE_RATE of them."""
+    if not logger.isEnabledFor(level):
+        return False
+    rate = settings.SURVEY_LOG_SAMPLE_RATE if rate is None else rate
+    return rate >= 1 or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'data', None) or {})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
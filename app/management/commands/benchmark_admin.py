@@ -0,0 +1,67 @@
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+
+from app.benchmark import create_survey, scratch_database, seed_responses
+
+
+class Command(BaseCommand):
+    help = (
+        'Time the SurveyResponse and SurveyResponseAnswer admin changelists as the tables grow; '
+        'the latency should stay roughly flat.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--responses', type=int, nargs='+', default=[10000, 100000, 500000],
+                            help='Total responses to measure at, in increasing order.')
+        parser.add_argument('--questions', type=int, default=3)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        with scratch_database():
+            client = Client()
+            client.force_login(User.objects.create_superuser('benchmark', 'benchmark@example.com', 'benchmark'))
+            surveys = [create_survey(options['questions'], name=f'Admin {i}') for i in range(2)]
+
+            seeded = 0
+            for total in options['responses']:
+                # The second survey gets a tenth of the responses
+                for survey, share in ((surveys[0], 0.9), (surveys[1], 0.1)):
+                    count = int((total - seeded) * share)
+                    seed_responses(survey, count, first=int(seeded * share))
+                seeded = total
+
+                responses_url = reverse('admin:app_surveyresponse_changelist')
+                answers_url = reverse('admin:app_surveyresponseanswer_changelist')
+                pages = [
+                    ('responses', responses_url, {}),
+                    ('responses last page', responses_url, {'last': 1}),
+                    ('responses of survey', responses_url, {'survey__id__exact': surveys[1].id}),
+                    ('responses search', responses_url, {'q': str(total // 2)}),
+                    ('answers', answers_url, {}),
+                    ('answers of survey', answers_url, {'response__survey__id__exact': surveys[1].id}),
+                    ('answers page 50', answers_url, {'p': 50}),
+                ]
+                for label, url, params in pages:
+                    timings = []
+                    for _ in range(options['repeat']):
+                        connection.force_debug_cursor = True
+                        reset_queries()
+                        start = time.perf_counter()
+                        response = client.get(url, params)
+                        timings.append(time.perf_counter() - start)
+                        queries = len(connection.queries)
+                        connection.force_debug_cursor = False
+                        assert response.status_code == 200, (label, response.status_code)
+
+                    self.stdout.write(
+                        f'{total:>8} responses  {label:<22} {statistics.median(timings) * 1000:>8.1f} ms  '
+                        f'{queries:>3} queries'
+                    )
@@ -0,0 +1,57 @@
+import orjson
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+
+from app.benchmark import create_survey, measure, scratch_database
+
+
+class Command(BaseCommand):
+    help = 'Compare responses stored per second through the HTML form and the JSON batch upload.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--questions', type=int, default=10)
+        parser.add_argument('--responses', type=int, default=1000, help='Responses stored per path.')
+        parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 50, 500])
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        with scratch_database():
+            total = options['responses']
+            client = Client()
+
+            survey = create_survey(options['questions'], name='Form')
+            question_ids = list(survey.surveyquestion_set.values_list('id', flat=True))
+            form_url = reverse('survey_list', args=[survey.id])
+
+            def post_form(i):
+                data = {'survey': survey.id, 'remarks': f'Remark {i}'}
+                data.update({f'question_{question_id}': str((i + question_id) % 5 + 1) for question_id in question_ids})
+                client.post(form_url, data)
+
+            elapsed, rate = measure(post_form, total)
+            self.stdout.write(f'form POST          {rate:>9.1f} responses/s  ({elapsed:.2f}s)')
+
+            for batch_size in options['batch_sizes']:
+                survey = create_survey(options['questions'], name=f'Batch {batch_size}')
+                question_ids = list(survey.surveyquestion_set.values_list('id', flat=True))
+                api_url = reverse('survey_responses_api', args=[survey.id])
+
+                def upload(batch):
+                    body = orjson.dumps({'responses': [
+                        {
+                            'answers': {str(question_id): (i + question_id) % 5 + 1 for question_id in question_ids},
+                            'remarks': f'Remark {i}',
+                            'idempotency_key': f'bench:{batch_size}:{i}',
+                        }
+                        for i in range(batch * batch_size, (batch + 1) * batch_size)
+                    ]})
+                    response = client.post(api_url, body, content_type='application/json')
+                    assert response.json()['created'] == batch_size, response.content
+
+                batches = max(1, total // batch_size)
+                elapsed, rate = measure(upload, batches)
+                self.stdout.write(
+                    f'batch of {batch_size:<9} {rate * batch_size:>9.1f} responses/s  ({elapsed:.2f}s)'
+                )
@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries
+
+from app.benchmark import create_survey, measure, scratch_database
+from app.ingest import save_survey_response
+from app.models import AnswerChoice, SurveyResponse, SurveyResponseAnswer
+
+
+def legacy_save_survey_response(survey, questions, cleaned_data, ip_address):
+    # The per-question loop survey_list used before app.ingest existed
+    response = SurveyResponse(survey=survey, ip_address=ip_address)
+    response.save()
+    response.remarks = cleaned_data.get('remarks')
+    response.save()
+
+    for question in questions:
+        answer_choice_value = cleaned_data.get(f'question_{question.id}')
+        try:
+            answer_choice = AnswerChoice.objects.get(choice_value=answer_choice_value, question=question)
+        except AnswerChoice.DoesNotExist:
+            if answer_choice_value is None:
+                continue
+            answer_choice = AnswerChoice.objects.create(choice_value=answer_choice_value, question=question)
+        SurveyResponseAnswer.objects.create(response=response, question=question, answer=answer_choice)
+    return response
+
+
+class Command(BaseCommand):
+    help = 'Compare survey submissions per second of the legacy and batched ingestion paths.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--questions', type=int, nargs='+', default=[5, 20, 100])
+        parser.add_argument('--submissions', type=int, default=200)
+
+    def handle(self, *args, **options):
+        paths = [
+            ('legacy', legacy_save_survey_response),
+            ('batched', save_survey_response),
+        ]
+
+        with scratch_database():
+            for question_count in options['questions']:
+                for label, save in paths:
+                    survey = create_survey(question_count, name=f'{label} {question_count}')
+                    questions = list(survey.surveyquestion_set.all())
+
+                    def submit(i):
+                        cleaned_data = {f'question_{q.id}': str((i + q.id) % 5 + 1) for q in questions}
+                        cleaned_data['remarks'] = f'Remark {i}'
+                        save(survey, questions, cleaned_data, '127.0.0.1')
+
+                    # Warm up so that every AnswerChoice already exists
+                    measure(submit, 5)
+
+                    connection.force_debug_cursor = True
+                    reset_queries()
+                    measure(submit, 1)
+                    queries = len(connection.queries)
+                    connection.force_debug_cursor = False
+
+                    elapsed, rate = measure(submit, options['submissions'])
+                    self.stdout.write(
+                        f'{question_count:>4} questions  {label:<8} '
+                        f'{rate:>9.1f} submissions/s  {queries:>4} queries/submission  ({elapsed:.2f}s)'
+                    )
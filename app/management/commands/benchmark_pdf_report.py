@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from pypdf import PdfReader
+
+from app.benchmark import create_survey, scratch_database, seed_responses
+from app.reports import REPORT_TEMPLATE, build_report_context, render_pdf_bytes, render_report_pdf
+
+
+def _proc_status(field):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(f'{field}:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def measure_in_child(func):
+    """Run func() in a forked process and return its seconds and peak RSS in MB.
+
+    Each measurement gets a process of its own so one render's peak doesn't
+    hide the next one's. Linux only: the peak is read from /proc.
+    """
+    connections.close_all()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        result = {}
+        try:
+            # Start the high-water mark from what the child inherited
+            with open('/proc/self/clear_refs', 'w') as clear_refs:
+                clear_refs.write('5')
+            result['start_mb'] = _proc_status('VmRSS')
+            started = time.perf_counter()
+            func()
+            result['seconds'] = time.perf_counter() - started
+            result['peak_mb'] = _proc_status('VmHWM')
+        except Exception as exc:
+            result['error'] = repr(exc)
+        finally:
+            connections.close_all()
+            os.write(write_fd, json.dumps(result).encode())
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = json.loads(pipe.read() or '{}')
+    os.waitpid(pid, 0)
+    if 'error' in result:
+        raise CommandError(result['error'])
+    return result
+
+
+class Command(BaseCommand):
+    help = (
+        'Render the survey PDF report chunked and in one piece on growing scratch data, '
+        'and print the time and peak RSS of each render (Linux).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--responses', type=int, nargs='+', default=[1000, 10000, 100000])
+        parser.add_argument('--questions', type=int, default=5)
+        parser.add_argument('--chunk-size', type=int, default=settings.PDF_REPORT_CHUNK_SIZE)
+        parser.add_argument('--single-limit', type=int, default=10000,
+                            help='Skip the one-piece render above this many responses.')
+        parser.add_argument('--max-growth', type=float, default=10.0,
+                            help='Allowed peak RSS growth of the chunked render, in MB per 1000 pages, '
+                                 'between the smallest and the largest run.')
+
+    def handle(self, *args, **options):
+        if not Path('/proc/self/clear_refs').exists():
+            raise CommandError('Peak RSS is read from /proc; run this on Linux.')
+        output = Path(tempfile.mkdtemp(prefix='mysurvey-bench-pdf-')) / 'report.pdf'
+        with scratch_database():
+            survey = create_survey(options['questions'])
+            seeded = 0
+            chunked_runs = []
+            for total in sorted(options['responses']):
+                seed_responses(survey, total - seeded, first=seeded)
+                seeded = total
+
+                def chunked():
+                    render_report_pdf(survey, None, None, output, chunk_size=options['chunk_size'])
+
+                def single():
+                    output.write_bytes(render_pdf_bytes(REPORT_TEMPLATE, build_report_context(survey)))
+
+                renders = [('chunked', chunked)]
+                if total <= options['single_limit']:
+                    renders.append(('single', single))
+                for label, render in renders:
+                    result = measure_in_child(render)
+                    pages = len(PdfReader(output).pages)
+                    if label == 'chunked':
+                        chunked_runs.append((pages, result['peak_mb']))
+                    self.stdout.write(
+                        f'{total:>8} responses  {label:<8} {result["seconds"]:>7.1f} s  '
+                        f'peak RSS {result["peak_mb"]:>6.0f} MB (+{result["peak_mb"] - result["start_mb"]:.0f})  '
+                        f'{pages} pages, {output.stat().st_size / 1e6:.1f} MB'
+                    )
+        output.unlink(missing_ok=True)
+        output.parent.rmdir()
+
+        # Chunking bounds the layout, not the pypdf merge, which holds every
+        # page until the file is written: the peak still grows with the pages
+        (first_pages, first_mb), (last_pages, last_mb) = chunked_runs[0], chunked_runs[-1]
+        if last_pages > first_pages:
+            growth = (last_mb - first_mb) / (last_pages - first_pages) * 1000
+            self.stdout.write(f'chunked peak RSS grows {growth:.1f} MB per 1000 pages')
+            if growth > options['max_growth']:
+                raise CommandError(f'Chunked peak RSS grows more than {options["max_growth"]} MB per 1000 pages.')
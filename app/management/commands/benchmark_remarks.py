@@ -0,0 +1,70 @@
+import time
+
+from django.core.paginator import Paginator
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries
+
+from app.benchmark import create_survey, scratch_database, seed_responses
+from app.models import SurveyResponseAnswer
+from app.remarks import get_remarks_page
+
+
+def legacy_remarks_page(survey, page):
+    # The remarks section of survey_statistics before app.remarks existed
+    remarks = SurveyResponseAnswer.objects.filter(
+        response__survey=survey,
+    ).exclude(response__remarks__exact='').order_by('response__timestamp')
+
+    unique_remarks = []
+    for response in remarks:
+        response_id = response.response.id
+        existing_remark = next((item for item in unique_remarks if item['id'] == response_id), None)
+        if existing_remark:
+            existing_remark['count'] += 1
+            existing_remark['timestamps'].append(response.response.timestamp)
+        else:
+            unique_remarks.append({
+                'id': response_id,
+                'remark': response.response.remarks,
+                'count': 1,
+                'timestamps': [response.response.timestamp],
+            })
+    unique_remarks.sort(key=lambda x: x['timestamps'][0])
+    return Paginator(unique_remarks, 5).page(page)
+
+
+class Command(BaseCommand):
+    help = 'Time the remarks section of survey_statistics against the legacy Python de-duplication.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--responses', type=int, nargs='+', default=[10000, 100000])
+        parser.add_argument('--questions', type=int, default=3)
+        parser.add_argument('--legacy-limit', type=int, default=10000,
+                            help='Skip the quadratic legacy path above this many responses.')
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            for response_count in options['responses']:
+                survey = create_survey(options['questions'], name=f'Remarks {response_count}')
+                seed_responses(survey, response_count)
+                responses = survey.get_responses()
+
+                paths = [('keyset', lambda page: get_remarks_page(responses, last=page == 'last'))]
+                if response_count <= options['legacy_limit']:
+                    last_page = legacy_remarks_page(survey, 1).paginator.num_pages
+                    paths.insert(0, ('legacy', lambda page: legacy_remarks_page(survey, 1 if page == 1 else last_page)))
+
+                for label, remarks_page in paths:
+                    for page in (1, 'last'):
+                        connection.force_debug_cursor = True
+                        reset_queries()
+                        start = time.perf_counter()
+                        shown = list(remarks_page(page))
+                        elapsed = time.perf_counter() - start
+                        queries = len(connection.queries)
+                        connection.force_debug_cursor = False
+
+                        self.stdout.write(
+                            f'{response_count:>7} responses  {label:<8} page {str(page):<5} '
+                            f'{elapsed * 1000:>10.1f} ms  {queries:>6} queries  {len(shown)} remarks'
+                        )
@@ -0,0 +1,166 @@
+import asyncio
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import reverse
+
+from app.benchmark import create_survey, remarks_page_params, scratch_database, summarize
+from app.ingest import save_survey_responses
+
+CSRF_TOKEN_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+def server_command(server, port, threads):
+    if server == 'wsgi':
+        if importlib.util.find_spec('gunicorn') is None:
+            raise CommandError('The WSGI run needs gunicorn (pip install gunicorn).')
+        return [
+            sys.executable, '-m', 'gunicorn', 'MySurvey.wsgi:application',
+            '--worker-class', 'gthread', '--workers', '1', '--threads', str(threads),
+            '--bind', f'127.0.0.1:{port}', '--backlog', '2048', '--log-level', 'warning',
+        ]
+    return [
+        sys.executable, '-m', 'uvicorn', 'MySurvey.asgi:application',
+        '--host', '127.0.0.1', '--port', str(port), '--backlog', '2048',
+        '--log-level', 'warning', '--no-access-log',
+    ]
+
+
+async def wait_until_up(base_url, timeout=30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(reverse('thank_you_page'))
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise CommandError(f'Server at {base_url} did not start within {timeout}s')
+
+
+async def drive(base_url, survey_id, question_ids, remarks_pages, total, concurrency):
+    """Send `total` requests from `concurrency` concurrent clients; returns summarize()."""
+    submit_url = reverse('survey_list', args=[survey_id])
+    statistics_url = reverse('survey_statistics_with_id', args=[survey_id])
+    thank_you_url = reverse('thank_you_page')
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        # One GET sets the CSRF cookie that every POST below reuses
+        token = CSRF_TOKEN_RE.search((await client.get(submit_url)).text).group(1)
+
+        def request(i):
+            kind = i % 4
+            if kind == 0:
+                data = {'survey': survey_id, 'csrfmiddlewaretoken': token, 'remarks': f'Server benchmark {i}'}
+                data.update({f'question_{question_id}': str((i + question_id) % 5 + 1) for question_id in question_ids})
+                return client.post(submit_url, data=data)
+            if kind == 1:
+                return client.get(submit_url)
+            if kind == 2:
+                return client.get(statistics_url, params=remarks_pages[i % len(remarks_pages)])
+            return client.get(thank_you_url)
+
+        latencies = []
+        errors = 0
+        next_index = iter(range(total))
+
+        async def worker():
+            nonlocal errors
+            for i in next_index:
+                start = time.perf_counter()
+                try:
+                    response = await request(i)
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return summarize(latencies, time.perf_counter() - start, errors=errors)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare requests per second and p99 latency of the respondent and statistics pages '
+        'under WSGI (gunicorn, threaded worker) and ASGI (uvicorn, async views).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--servers', nargs='+', choices=['wsgi', 'asgi'], default=['wsgi', 'asgi'])
+        parser.add_argument('--concurrency', nargs='+', type=int, default=[50, 200, 1000])
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per concurrency level.')
+        parser.add_argument('--threads', type=int, default=8, help='gunicorn threads for the WSGI run.')
+        parser.add_argument('--questions', type=int, default=20)
+        parser.add_argument('--seed-responses', type=int, default=2000)
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--json', action='store_true', help='Print the raw JSON results only.')
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            survey = create_survey(options['questions'], name='Server benchmark')
+            question_ids = list(survey.surveyquestion_set.values_list('id', flat=True))
+            save_survey_responses([
+                {
+                    'survey_id': survey.id,
+                    'answers': {question_id: (i + question_id) % 5 + 1 for question_id in question_ids},
+                    'remarks': f'Seeded remark {i}' if i % 4 == 0 else '',
+                    'ip_address': '127.0.0.1',
+                }
+                for i in range(options['seed_responses'])
+            ])
+            # Statistics readers spread over the first 50 remarks pages
+            remarks_pages = remarks_page_params(survey, 50)
+            # The servers open the scratch database by name
+            database_name = str(connection.settings_dict['NAME'])
+            connection.close()
+
+            results = []
+            for server in options['servers']:
+                results.extend(self.run_server(server, survey.id, question_ids, remarks_pages, database_name, options))
+
+        if options['json']:
+            self.stdout.write(json.dumps(results))
+            return
+        self.stdout.write(f'{"server":<8}{"clients":>8}{"req/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"errors":>8}')
+        for row in results:
+            self.stdout.write(
+                f'{row["server"]:<8}{row["clients"]:>8}{row["throughput"]:>10}'
+                f'{row["p50_ms"]:>10}{row["p99_ms"]:>10}{row["errors"]:>8}'
+            )
+
+    def run_server(self, server, survey_id, question_ids, remarks_pages, database_name, options):
+        env = {
+            **os.environ,
+            'DB_NAME': database_name,
+            'DJANGO_ALLOWED_HOSTS': '127.0.0.1',
+            'DJANGO_ASYNC_VIEWS': '1' if server == 'asgi' else '0',
+        }
+        base_url = f'http://127.0.0.1:{options["port"]}'
+        process = subprocess.Popen(
+            server_command(server, options['port'], options['threads']), cwd=settings.BASE_DIR, env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            asyncio.run(wait_until_up(base_url))
+            results = []
+            for concurrency in options['concurrency']:
+                summary = asyncio.run(drive(base_url, survey_id, question_ids, remarks_pages, options['requests'], concurrency))
+                results.append({'server': server, 'clients': concurrency, **summary})
+            return results
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
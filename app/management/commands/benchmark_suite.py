@@ -0,0 +1,172 @@
+import json
+import subprocess
+import tempfile
+import time
+from datetime import timedelta
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from app.benchmark import run_concurrently, scratch_database
+from app.reports import wait_for_reports
+from app.synthetic import generate_survey_data
+
+SCENARIOS = ('submit', 'statistics', 'pdf_report', 'admin_surveys', 'admin_responses', 'admin_answers')
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, results, max_regression):
+    """Return human readable regressions of results against a baseline run."""
+    regressions = []
+    for name, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        if previous['p95_ms'] and current['p95_ms'] > previous['p95_ms'] * (1 + max_regression / 100):
+            regressions.append(f'{name}: p95 {previous["p95_ms"]} ms -> {current["p95_ms"]} ms')
+        if current.get('queries_max', 0) > previous.get('queries_max', 0):
+            regressions.append(f'{name}: queries per request {previous.get("queries_max")} -> {current["queries_max"]}')
+    return regressions
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate synthetic data in a scratch database and benchmark submissions, statistics, '
+        'PDF reports and the admin changelists. Prints the results as JSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--departments', type=int, default=2)
+        parser.add_argument('--surveys', type=int, default=2, help='Surveys per department.')
+        parser.add_argument('--questions', type=int, default=20)
+        parser.add_argument('--responses', type=int, default=5000, help='Responses per survey.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--requests', type=int, default=100, help='Requests per scenario.')
+        parser.add_argument('--pdf-requests', type=int, default=5, help='PDF reports to render.')
+        parser.add_argument('--clients', type=int, default=1, help='Concurrent clients (threads).')
+        parser.add_argument('--scenario', action='append', dest='scenarios', choices=SCENARIOS,
+                            help='Only run this scenario (can be given more than once).')
+        parser.add_argument('--output', help='Write the JSON results to this file.')
+        parser.add_argument('--baseline', help='Compare against an earlier --output file.')
+        parser.add_argument('--max-regression', type=float, default=25.0,
+                            help='Allowed p95 slowdown against the baseline, in percent.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        with scratch_database(), override_settings(PDF_REPORT_CACHE_DIR=tempfile.mkdtemp(prefix='mysurvey-bench-pdf-')):
+            started = time.perf_counter()
+            surveys = generate_survey_data(
+                departments=options['departments'], surveys=options['surveys'], questions=options['questions'],
+                responses=options['responses'], seed=options['seed'],
+            )
+            generate_seconds = time.perf_counter() - started
+            user = User.objects.create_superuser('benchmark', 'benchmark@example.com', 'benchmark')
+
+            def client_factory():
+                client = Client()
+                client.force_login(user)
+                return client
+
+            scenarios = {}
+            for name in options['scenarios'] or SCENARIOS:
+                total = options['pdf_requests'] if name == 'pdf_report' else options['requests']
+                make_request = getattr(self, f'request_{name}')(surveys[0])
+                scenarios[name] = run_concurrently(make_request, total, options['clients'], client_factory)
+                self.stderr.write(f'{name}: {scenarios[name]}')
+
+            results = {
+                'commit': git_commit(),
+                'created': timezone.now().isoformat(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'data': {
+                    key: options[key] for key in ('departments', 'surveys', 'questions', 'responses', 'seed')
+                },
+                'generate_seconds': round(generate_seconds, 2),
+                'clients': options['clients'],
+                'scenarios': scenarios,
+            }
+
+        output = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+        if options['baseline']:
+            with open(options['baseline']) as handle:
+                regressions = compare(json.load(handle), results, options['max_regression'])
+            if regressions:
+                raise CommandError('Regressions against the baseline:\n' + '\n'.join(regressions))
+
+    def request_submit(self, survey):
+        url = reverse('survey_list', args=[survey.id])
+        question_ids = list(survey.surveyquestion_set.values_list('id', flat=True))
+
+        def make_request(client, i):
+            data = {'survey': survey.id, 'remarks': f'Benchmark {i}' if i % 3 == 0 else ''}
+            data.update({f'question_{question_id}': str((i + question_id) % 5 + 1) for question_id in question_ids})
+            return client.post(url, data)
+        return make_request
+
+    def request_statistics(self, survey):
+        url = reverse('survey_statistics_with_id', args=[survey.id])
+        today = timezone.localdate()
+        ranges = [
+            {},
+            {'start_date': str(today - timedelta(days=30)), 'end_date': str(today)},
+            {'start_date': str(today - timedelta(days=60)), 'end_date': str(today - timedelta(days=30))},
+        ]
+
+        def make_request(client, i):
+            return client.get(url, {**ranges[i % len(ranges)], 'last': i % 2})
+        return make_request
+
+    def request_pdf_report(self, survey):
+        url = reverse('survey_pdf_report_with_id', args=[survey.id])
+        today = timezone.localdate()
+
+        def make_request(client, i):
+            # A new date range every time, so each request renders a fresh PDF.
+            # Instead of polling, which would add a varying number of requests
+            # to the count, wait for the render and fetch the file once: every
+            # run counts the queries of the 202 and of the download.
+            params = {'start_date': str(today - timedelta(days=90)), 'end_date': str(today - timedelta(days=i))}
+            response = client.get(url, params)
+            if response.status_code == 202:
+                wait_for_reports()
+                response = client.get(url, params)
+            return response
+        return make_request
+
+    def request_admin_surveys(self, survey):
+        return self._admin_changelist('admin:app_survey_changelist')
+
+    def request_admin_responses(self, survey):
+        return self._admin_changelist('admin:app_surveyresponse_changelist')
+
+    def request_admin_answers(self, survey):
+        return self._admin_changelist('admin:app_surveyresponseanswer_changelist')
+
+    def _admin_changelist(self, url_name):
+        url = reverse(url_name)
+
+        def make_request(client, i):
+            return client.get(url, {'p': i % 5})
+        return make_request
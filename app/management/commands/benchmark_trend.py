@@ -0,0 +1,78 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from app.benchmark import create_survey, scratch_database
+from app.models import QuestionStarRollup
+from app.rollup import STAR_VALUES, get_question_star_counts, rebuild_trend_buckets
+from app.trends import get_survey_trend, trend_buckets
+
+
+class Command(BaseCommand):
+    help = (
+        'Time a trend over a year of daily rollup rows (every question, day and star value) '
+        'at each granularity, against one star-count aggregation per bucket.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--questions', type=int, default=30)
+        parser.add_argument('--days', type=int, default=365)
+        parser.add_argument('--iterations', type=int, default=20)
+
+    def time(self, func, iterations):
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return sorted(timings)[len(timings) // 2] * 1000
+
+    def handle(self, *args, **options):
+        end_date = timezone.localdate()
+        start_date = end_date - timedelta(days=options['days'] - 1)
+        with scratch_database():
+            survey = create_survey(options['questions'])
+            questions = list(survey.surveyquestion_set.all())
+            rng = random.Random(0)
+            QuestionStarRollup.objects.bulk_create([
+                QuestionStarRollup(
+                    survey=survey, question=question, date=start_date + timedelta(days=day),
+                    star_value=star_value, count=rng.randint(1, 40),
+                )
+                for day in range(options['days'])
+                for question in questions
+                for star_value in STAR_VALUES
+            ], batch_size=5000)
+            buckets = rebuild_trend_buckets([survey.id])
+            self.stdout.write(
+                f'{options["questions"]} questions, {options["days"]} days, '
+                f'{QuestionStarRollup.objects.count()} rollup rows, {buckets} trend bucket rows'
+            )
+
+            setup_test_environment()
+            client = Client()
+            url = reverse('survey_trend_api', args=[survey.id])
+            for granularity in ('day', 'week', 'month'):
+                buckets = trend_buckets(start_date, end_date, granularity)
+                trend_ms = self.time(lambda: get_survey_trend(survey, start_date, end_date, granularity), options['iterations'])
+                # A new query string each time so the cached body is never reused
+                api_ms = self.time(
+                    lambda: client.get(url, {
+                        'start_date': start_date, 'end_date': end_date,
+                        'granularity': granularity, 'uncached': time.perf_counter_ns(),
+                    }),
+                    options['iterations'],
+                )
+                per_bucket_ms = self.time(
+                    lambda: [get_question_star_counts(survey, first, last) for first, last in buckets], 1,
+                )
+                self.stdout.write(
+                    f'{granularity:<6} {len(buckets):>4} buckets  trend {trend_ms:>7.1f} ms  '
+                    f'API {api_ms:>7.1f} ms  one aggregation per bucket {per_bucket_ms:>8.1f} ms'
+                )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from app.models import Survey
+from app.qr_assets import render_survey_qr_codes
+
+
+class Command(BaseCommand):
+    help = 'Render the QR codes of every survey ahead of time, e.g. after changing SURVEY_QR_BASE_URL.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--survey', type=int, action='append', dest='surveys',
+                            help='Only render this survey id (can be given more than once).')
+
+    def handle(self, *args, **options):
+        survey_ids = Survey.objects.order_by('id').values_list('id', flat=True)
+        if options['surveys']:
+            survey_ids = survey_ids.filter(id__in=options['surveys'])
+
+        count = 0
+        for survey_id in survey_ids:
+            render_survey_qr_codes(survey_id)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Rendered QR codes for {count} surveys.'))
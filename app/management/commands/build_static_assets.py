@@ -0,0 +1,53 @@
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from app.static_assets import FONT_AWESOME_DIR, subset_font_awesome, template_icon_classes
+
+try:
+    import fontawesomefree
+except ImportError:  # only needed to rebuild the Font Awesome subset
+    fontawesomefree = None
+
+
+class Command(BaseCommand):
+    help = (
+        'Cut Font Awesome down to the icons the templates use, then run collectstatic, which writes '
+        'content-hashed names and gzip/brotli copies. Subsetting needs the fontawesomefree and fonttools '
+        'packages; the subset is committed, so deployments only need --no-icons.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', help='Static directory of fontawesomefree (default: the installed package).')
+        parser.add_argument('--no-icons', action='store_false', dest='icons', help='Keep the current Font Awesome subset.')
+        parser.add_argument('--no-collect', action='store_false', dest='collect', help='Skip collectstatic.')
+
+    def handle(self, *args, **options):
+        if options['icons']:
+            self.build_icons(options['source'])
+        if options['collect']:
+            started = time.perf_counter()
+            call_command('collectstatic', interactive=False, verbosity=0)
+            files = [path for path in Path(settings.STATIC_ROOT).rglob('*') if path.is_file()]
+            self.stdout.write(
+                f'Collected {len(files)} files ({sum(path.stat().st_size for path in files) / 1e6:.1f} MB) '
+                f'into {settings.STATIC_ROOT} in {time.perf_counter() - started:.1f}s.'
+            )
+
+    def build_icons(self, source):
+        if source is None:
+            if fontawesomefree is None:
+                raise CommandError('Install fontawesomefree or pass --source.')
+            source = Path(fontawesomefree.__file__).parent / 'static' / 'fontawesomefree'
+        directories = [Path(directory) for engine in settings.TEMPLATES for directory in engine['DIRS']]
+        directories.append(Path(settings.BASE_DIR) / 'app' / 'templates')
+        try:
+            built = subset_font_awesome(source, template_icon_classes(directories))
+        except ImportError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(f'Font Awesome icons: {", ".join(built["icons"]) or "none"}')
+        for name, size in built['files'].items():
+            self.stdout.write(f'  {FONT_AWESOME_DIR.name}/{name}: {size / 1024:.1f} kB')
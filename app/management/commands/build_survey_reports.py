@@ -0,0 +1,81 @@
+import time
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from app.models import Survey
+from app.report_batch import iter_survey_reports_zip, last_month, render_survey_reports, report_period
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise CommandError(f'Invalid date {value!r}; use YYYY-MM-DD.')
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the PDF report of every survey, or of some departments' surveys, for a date range "
+        '(last month by default) in a pool of worker processes, into a directory or a ZIP file.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--department', action='append', dest='departments',
+                            help='Department name or id (can be given more than once). Default: all surveys.')
+        parser.add_argument('--start-date', type=parse_date)
+        parser.add_argument('--end-date', type=parse_date)
+        output = parser.add_mutually_exclusive_group()
+        output.add_argument('--output', help='Directory for the PDFs (default: survey_reports/<start>_<end>).')
+        output.add_argument('--zip', help='Write a ZIP file with the PDFs and timings.csv instead.')
+        parser.add_argument('--workers', type=int, default=settings.PDF_REPORT_BATCH_WORKERS,
+                            help='Worker processes (default: PDF_REPORT_BATCH_WORKERS, the number of cores).')
+
+    def handle(self, *args, **options):
+        default_start, default_end = last_month()
+        start_date = options['start_date'] or default_start
+        end_date = options['end_date'] or default_end
+        if start_date > end_date:
+            raise CommandError('--start-date is after --end-date.')
+
+        surveys = Survey.objects.all()
+        if options['departments']:
+            matches = Q()
+            for department in options['departments']:
+                matches |= Q(department_id=department) if department.isdigit() else Q(department__name=department)
+            surveys = surveys.filter(matches)
+        total = surveys.count()
+        if not total:
+            raise CommandError('No surveys to report on.')
+
+        period = report_period(start_date, end_date)
+        self.stderr.write(f'{total} reports for {start_date} to {end_date} with {options["workers"]} workers')
+        started = time.perf_counter()
+        if options['zip']:
+            # timings.csv in the archive has the per-report times
+            with open(options['zip'], 'wb') as handle:
+                for chunk in iter_survey_reports_zip(surveys, *period, workers=options['workers']):
+                    handle.write(chunk)
+            self.stdout.write(f'Wrote {options["zip"]} in {time.perf_counter() - started:.1f}s.')
+            return
+
+        directory = Path(options['output'] or Path(settings.BASE_DIR) / 'survey_reports' / f'{start_date}_{end_date}')
+        render_seconds = 0.0
+        failed = 0
+        for done, report in enumerate(render_survey_reports(surveys, *period, directory, options['workers']), 1):
+            render_seconds += report['seconds']
+            if report['status'] == 'ok':
+                self.stdout.write(f'[{done}/{total}] {report["filename"]}: {report["seconds"]:.1f}s')
+            else:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'[{done}/{total}] {report["filename"]}: failed {report["error"] or ""}'))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'{total - failed} reports in {directory} in {elapsed:.1f}s '
+            f'({render_seconds:.1f}s of rendering, {render_seconds / elapsed if elapsed else 0:.1f}x parallel).'
+        )
+        if failed:
+            raise CommandError(f'{failed} reports failed.')
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from app.journal import drain_journal, pending_entries, recover_journal
+
+
+class Command(BaseCommand):
+    help = 'Commit the write-behind submission journal to the database (crash-recovery replay).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--status', action='store_true', help='Only print the number of pending entries.')
+
+    def handle(self, *args, **options):
+        if options['status']:
+            self.stdout.write(f'{pending_entries()} pending submissions')
+            return
+
+        recover_journal()
+        drained = drain_journal()
+        self.stdout.write(self.style.SUCCESS(
+            f'Committed {drained} journaled submissions, {pending_entries()} pending.'
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from app.synthetic import generate_survey_data
+
+
+class Command(BaseCommand):
+    help = 'Fill the database with realistic synthetic departments, surveys, questions and responses.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--departments', type=int, default=2)
+        parser.add_argument('--surveys', type=int, default=3, help='Surveys per department.')
+        parser.add_argument('--questions', type=int, default=10, help='Questions per survey.')
+        parser.add_argument('--responses', type=int, default=1000, help='Responses per survey.')
+        parser.add_argument('--days', type=int, default=90, help='Spread responses over this many past days.')
+        parser.add_argument('--remark-rate', type=float, default=0.3)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        surveys = generate_survey_data(
+            departments=options['departments'],
+            surveys=options['surveys'],
+            questions=options['questions'],
+            responses=options['responses'],
+            days=options['days'],
+            remark_rate=options['remark_rate'],
+            seed=options['seed'],
+            log=self.stdout.write,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(surveys)} surveys with {len(surveys) * options["responses"]} responses.'
+        ))
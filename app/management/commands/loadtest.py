@@ -0,0 +1,101 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+
+from app.benchmark import create_survey, remarks_page_params, run_concurrently, scratch_database
+from app.ingest import save_survey_responses
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test the submit and statistics paths. With --backends, runs itself once per '
+        'DB_ENGINE in a subprocess and compares the results.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backends', nargs='+', choices=['sqlite', 'postgresql'])
+        parser.add_argument('--clients', type=int, default=8)
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--questions', type=int, default=20)
+        parser.add_argument('--seed-responses', type=int, default=5000)
+        parser.add_argument('--json', action='store_true', help='Print the raw JSON result only.')
+
+    def handle(self, *args, **options):
+        if options['backends']:
+            return self.compare(options)
+
+        result = self.run(options)
+        if options['json']:
+            self.stdout.write(json.dumps(result))
+        else:
+            self.print_results({result['backend']: result})
+
+    def run(self, options):
+        setup_test_environment()
+        with scratch_database():
+            survey = create_survey(options['questions'], name='Load test')
+            questions = list(survey.surveyquestion_set.all())
+            save_survey_responses([
+                {
+                    'survey_id': survey.id,
+                    'answers': {q.id: (i + q.id) % 5 + 1 for q in questions},
+                    'remarks': f'Seeded remark {i}' if i % 4 == 0 else '',
+                    'ip_address': '127.0.0.1',
+                }
+                for i in range(options['seed_responses'])
+            ])
+
+            submit_url = reverse('survey_list', args=[survey.id])
+            statistics_url = reverse('survey_statistics_with_id', args=[survey.id])
+
+            def submit(client, i):
+                data = {'survey': survey.id, 'remarks': f'Load test {i}'}
+                data.update({f'question_{q.id}': str((i + q.id) % 5 + 1) for q in questions})
+                return client.post(submit_url, data)
+
+            # Readers spread over the first 50 remarks pages
+            remarks_pages = remarks_page_params(survey, 50)
+
+            def statistics(client, i):
+                return client.get(statistics_url, {
+                    'start_date': '2000-01-01', 'end_date': '2100-12-31', **remarks_pages[i % len(remarks_pages)],
+                })
+
+            return {
+                'backend': connection.vendor,
+                'clients': options['clients'],
+                'submit': run_concurrently(submit, options['requests'], options['clients']),
+                'statistics': run_concurrently(statistics, options['requests'], options['clients']),
+            }
+
+    def compare(self, options):
+        results = {}
+        for backend in options['backends']:
+            command = [
+                sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'loadtest', '--json',
+                '--clients', str(options['clients']), '--requests', str(options['requests']),
+                '--questions', str(options['questions']), '--seed-responses', str(options['seed_responses']),
+            ]
+            process = subprocess.run(command, env={**os.environ, 'DB_ENGINE': backend}, capture_output=True, text=True)
+            if process.returncode != 0:
+                self.stderr.write(f'{backend}: load test failed\n{process.stderr.strip()}')
+                continue
+            results[backend] = json.loads(process.stdout.strip().splitlines()[-1])
+        self.print_results(results)
+
+    def print_results(self, results):
+        self.stdout.write(f'{"backend":<12}{"path":<12}{"req/s":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"errors":>8}')
+        for backend, result in results.items():
+            for path in ('submit', 'statistics'):
+                row = result[path]
+                self.stdout.write(
+                    f'{backend:<12}{path:<12}{row["throughput"]:>10}{row["p50_ms"]:>10}'
+                    f'{row["p95_ms"]:>10}{row["p99_ms"]:>10}{row["errors"]:>8}'
+                )
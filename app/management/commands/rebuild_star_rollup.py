@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.rollup import rebuild_star_rollup
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the per-question daily star-count rollup and the week and month trend buckets from the stored answers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--survey', type=int, action='append', dest='surveys',
+                            help='Only rebuild this survey id (can be given more than once).')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rows = rebuild_star_rollup(options['surveys'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt star rollup: {rows} rows.'))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from app.aggregates import refresh_question_aggregates, reset_question_aggregates
+from app.models import Survey
+
+
+class Command(BaseCommand):
+    help = 'Fold settled answers into the per-question running aggregates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--survey', type=int, action='append', dest='surveys',
+                            help='Only refresh this survey id (can be given more than once).')
+        parser.add_argument('--rebuild', action='store_true', help='Recompute from scratch instead.')
+
+    def handle(self, *args, **options):
+        survey_ids = options['surveys'] or list(Survey.objects.values_list('id', flat=True))
+        if options['rebuild']:
+            reset_question_aggregates(survey_ids)
+        folded = sum(refresh_question_aggregates(survey_id) for survey_id in survey_ids)
+        self.stdout.write(self.style.SUCCESS(f'Folded {folded} answers into the question aggregates.'))
@@ -0,0 +1,252 @@
+# metrics.py
+"""Request, ORM, template and PDF timings exposed in the Prometheus text format.
+
+MetricsMiddleware times every request and counts its queries.
+InstrumentedDjangoTemplates times top-level
+template renders and reports.render_pdf_bytes times xhtml2pdf. The numbers
+live in this process only; with several workers, scrape each one.
+
+Queries reach the request that ran them through a context variable rather
+than a per-request connection.execute_wrapper. Under ASGI a sync view or ORM
+call runs in a sync_to_async thread with its own connection, which the
+request's wrapper never sees. The context, on the other hand, goes with it.
+app/signals.py installs query_observer on every connection as it is
+opened, and observe_queries() subscribes for the duration of a request.
+"""
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template.exceptions import TemplateDoesNotExist
+
+from .journal import pending_entries
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_registry = []
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{%s}' % ','.join(
+        '%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in pairs
+    )
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+        self._values = defaultdict(float)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def inc(self, amount=1, **labels):
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] += amount
+
+    def collect(self):
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} counter'
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield f'{self.name}{_format_labels(labels)} {_format_value(value)}'
+
+
+class Histogram:
+    def __init__(self, name, documentation, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets) + (math.inf,)
+        # labels -> [bucket counts..., sum]
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * len(self.buckets) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-1] += value
+
+    def collect(self):
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} histogram'
+        with self._lock:
+            items = [(labels, list(series)) for labels, series in self._values.items()]
+        for labels, series in items:
+            for bound, count in zip(self.buckets, series):
+                yield f'{self.name}_bucket{_format_labels(labels, [("le", _format_value(bound))])} {count}'
+            yield f'{self.name}_sum{_format_labels(labels)} {_format_value(series[-1])}'
+            yield f'{self.name}_count{_format_labels(labels)} {series[-2]}'
+
+
+class Gauge:
+    """A value read when the metrics are scraped."""
+
+    def __init__(self, name, documentation, read):
+        self.name = name
+        self.documentation = documentation
+        self.read = read
+        _registry.append(self)
+
+    def collect(self):
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} gauge'
+        yield f'{self.name} {_format_value(self.read())}'
+
+
+REQUEST_SECONDS = Histogram('survey_request_duration_seconds', 'Time spent handling a request, by view.')
+REQUESTS = Counter('survey_requests_total', 'Requests handled, by view and status code.')
+DB_QUERY_SECONDS = Histogram('survey_db_query_duration_seconds', 'Duration of single ORM queries, by view.')
+DB_QUERIES_PER_REQUEST = Histogram(
+    'survey_db_queries_per_request', 'Number of ORM queries per request, by view.', QUERY_COUNT_BUCKETS,
+)
+TEMPLATE_RENDER_SECONDS = Histogram('survey_template_render_seconds', 'Time spent rendering a template, by template.')
+PDF_RENDER_SECONDS = Histogram('survey_pdf_render_seconds', 'Time xhtml2pdf spends building a PDF report.')
+
+
+JOURNAL_PENDING = Gauge('survey_journal_pending_entries', 'Journaled submissions not yet committed.', pending_entries)
+
+
+def render_prometheus():
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.collect())
+    return '\n'.join(lines) + '\n'
+
+
+# Callables that get (sql, seconds) for every query run in this context
+_query_observers = ContextVar('query_observers', default=())
+
+
+def query_observer(execute, sql, params, many, context):
+    """execute_wrapper that reports each query to the observers of the current context."""
+    observers = _query_observers.get()
+    if not observers:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        for observer in observers:
+            observer(sql, duration)
+
+
+@contextmanager
+def observe_queries(observer):
+    """Call observer(sql, seconds) for the queries of the block, on any connection or thread it uses."""
+    token = _query_observers.set(_query_observers.get() + (observer,))
+    try:
+        yield observer
+    finally:
+        _query_observers.reset(token)
+
+
+class QueryRecorder:
+    """Query observer that counts and times the queries of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.durations = []
+
+    def __call__(self, sql, duration):
+        self.count += 1
+        self.durations.append(duration)
+
+
+def _view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match else 'unmatched'
+
+
+def _record(request, recorder, elapsed, status_code):
+    view = _view_name(request)
+    REQUEST_SECONDS.observe(elapsed, view=view)
+    REQUESTS.inc(view=view, status=status_code)
+    DB_QUERIES_PER_REQUEST.observe(recorder.count, view=view)
+    for duration in recorder.durations:
+        DB_QUERY_SECONDS.observe(duration, view=view)
+
+
+class MetricsMiddleware:
+    """Record latency, status and ORM query counts and timings per view."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with observe_queries(recorder):
+            response = self.get_response(request)
+        _record(request, recorder, time.perf_counter() - start, response.status_code)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with observe_queries(recorder):
+            response = await self.get_response(request)
+        _record(request, recorder, time.perf_counter() - start, response.status_code)
+        return response
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            TEMPLATE_RENDER_SECONDS.observe(time.perf_counter() - start, template=self.origin.template_name or 'string')
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, with render times recorded per template."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+def metrics_view(request):
+    # Only for the local Prometheus scraper; hide it from everyone else
+    if request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_IPS:
+        raise Http404
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
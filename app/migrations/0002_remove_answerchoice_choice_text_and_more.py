@@ -3,15 +3,10 @@
 from django.db import migrations, models
 
 def create_answer_choices(apps, schema_editor):
-    AnswerChoice = apps.get_model('app', 'AnswerChoice')  # Replace 'app' with your actual app name
-    SurveyQuestion = apps.get_model('app', 'SurveyQuestion')  # Replace 'app' with your actual app name
-
-    # Assuming you have a specific survey question associated with these choices
-    some_survey_question_instance = SurveyQuestion.objects.get(pk=some_survey_question_id)
-
-    AnswerChoice.objects.create(choice_value=1, question_id=some_survey_question_instance.id)
-    AnswerChoice.objects.create(choice_value=2, question_id=some_survey_question_instance.id)
-    AnswerChoice.objects.create(choice_value=3, question_id=some_survey_question_instance.id)
+    # AnswerChoice rows are created on demand when a response is submitted,
+    # so there is nothing to seed here. This used to look up an undefined
+    # question id, which made migrating a fresh database impossible.
+    pass
 
 class Migration(migrations.Migration):
 
@@ -30,5 +25,5 @@ class Migration(migrations.Migration):
             field=models.IntegerField(default=0),
             preserve_default=False,
         ),
-        migrations.RunPython(create_answer_choices),  # Add this line for the data migration
+        migrations.RunPython(create_answer_choices, migrations.RunPython.noop),  # Add this line for the data migration
     ]
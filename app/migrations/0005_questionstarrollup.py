@@ -0,0 +1,61 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def populate_star_rollup(apps, schema_editor):
+    QuestionStarRollup = apps.get_model('app', 'QuestionStarRollup')
+    SurveyResponseAnswer = apps.get_model('app', 'SurveyResponseAnswer')
+
+    rows = (
+        SurveyResponseAnswer.objects.annotate(date=TruncDate('response__timestamp'))
+        .values('response__survey_id', 'question_id', 'date', 'answer__choice_value')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    QuestionStarRollup.objects.bulk_create(
+        [
+            QuestionStarRollup(
+                survey_id=row['response__survey_id'],
+                question_id=row['question_id'],
+                date=row['date'],
+                star_value=row['answer__choice_value'],
+                count=row['count'],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_alter_answerchoice_choice_value'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionStarRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('star_value', models.IntegerField(choices=[(1, '⭐'), (2, '⭐⭐'), (3, '⭐⭐⭐'), (4, '⭐⭐⭐⭐'), (5, '⭐⭐⭐⭐⭐')])),
+                ('count', models.IntegerField(default=0)),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.surveyquestion')),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.survey')),
+            ],
+            options={
+                'db_table': 'question_star_rollup',
+                'indexes': [models.Index(fields=['survey', 'date'], name='star_rollup_survey_date_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='questionstarrollup',
+            constraint=models.UniqueConstraint(fields=('question', 'date', 'star_value'), name='unique_question_star_rollup'),
+        ),
+        migrations.RunPython(populate_star_rollup, migrations.RunPython.noop),
+    ]
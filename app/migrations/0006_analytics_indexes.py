@@ -0,0 +1,49 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:41
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_answer_choices(apps, schema_editor):
+    # Keep the lowest id of every (question, choice_value) pair and point the
+    # answers at it, so the unique constraint below can be created.
+    AnswerChoice = apps.get_model('app', 'AnswerChoice')
+    SurveyResponseAnswer = apps.get_model('app', 'SurveyResponseAnswer')
+
+    duplicates = (
+        AnswerChoice.objects.values('question_id', 'choice_value')
+        .annotate(keep_id=Min('id'), total=Count('id'))
+        .filter(total__gt=1)
+        .order_by()
+    )
+    for row in duplicates:
+        extra_ids = list(
+            AnswerChoice.objects.filter(question_id=row['question_id'], choice_value=row['choice_value'])
+            .exclude(id=row['keep_id'])
+            .values_list('id', flat=True)
+        )
+        SurveyResponseAnswer.objects.filter(answer_id__in=extra_ids).update(answer_id=row['keep_id'])
+        AnswerChoice.objects.filter(id__in=extra_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_questionstarrollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['survey', 'timestamp'], name='response_survey_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponseanswer',
+            index=models.Index(fields=['question', 'answer'], name='answer_question_choice_idx'),
+        ),
+        migrations.RunPython(merge_duplicate_answer_choices, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='answerchoice',
+            constraint=models.UniqueConstraint(fields=('question', 'choice_value'), name='unique_answer_choice'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_surveyresponse_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SurveyAggregateMark',
+            fields=[
+                ('survey', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='app.survey')),
+                ('last_response_id', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'survey_aggregate_mark',
+            },
+        ),
+        migrations.CreateModel(
+            name='QuestionAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.BigIntegerField(default=0)),
+                ('total', models.BigIntegerField(default=0)),
+                ('total_squares', models.BigIntegerField(default=0)),
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='app.surveyquestion')),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.survey')),
+            ],
+            options={
+                'db_table': 'question_aggregate',
+            },
+        ),
+    ]
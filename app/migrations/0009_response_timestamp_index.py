@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-18 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_question_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['timestamp', 'id'], name='response_ts_id_idx'),
+        ),
+    ]
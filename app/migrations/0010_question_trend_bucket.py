@@ -0,0 +1,66 @@
+# Generated by Django 5.0.1 on 2026-10-18 09:50
+
+from collections import defaultdict
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F, Sum
+
+
+def populate_trend_buckets(apps, schema_editor):
+    QuestionStarRollup = apps.get_model('app', 'QuestionStarRollup')
+    QuestionTrendBucket = apps.get_model('app', 'QuestionTrendBucket')
+
+    totals = defaultdict(lambda: [0, 0])
+    rows = (
+        QuestionStarRollup.objects.values_list('survey_id', 'question_id', 'date')
+        .annotate(answered=Sum('count'), stars=Sum(F('count') * F('star_value')))
+        .order_by()
+    )
+    for survey_id, question_id, date, answered, stars in rows.iterator():
+        for granularity, start in (('week', date - timedelta(days=date.weekday())), ('month', date.replace(day=1))):
+            bucket = totals[survey_id, question_id, granularity, start]
+            bucket[0] += answered
+            bucket[1] += stars
+    QuestionTrendBucket.objects.bulk_create(
+        [
+            QuestionTrendBucket(
+                survey_id=survey_id, question_id=question_id, granularity=granularity, start=start,
+                count=count, total=total,
+            )
+            for (survey_id, question_id, granularity, start), (count, total) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_response_timestamp_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionTrendBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('week', 'Week'), ('month', 'Month')], max_length=5)),
+                ('start', models.DateField()),
+                ('count', models.IntegerField(default=0)),
+                ('total', models.IntegerField(default=0)),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.surveyquestion')),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.survey')),
+            ],
+            options={
+                'db_table': 'question_trend_bucket',
+                'indexes': [models.Index(fields=['survey', 'granularity', 'start'], name='trend_bucket_survey_start_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='questiontrendbucket',
+            constraint=models.UniqueConstraint(fields=('question', 'granularity', 'start'), name='unique_question_trend_bucket'),
+        ),
+        migrations.RunPython(populate_trend_buckets, migrations.RunPython.noop),
+    ]
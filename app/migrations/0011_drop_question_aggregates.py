@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:09
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0010_question_trend_bucket'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='surveyaggregatemark',
+            name='survey',
+        ),
+        migrations.DeleteModel(
+            name='QuestionAggregate',
+        ),
+        migrations.DeleteModel(
+            name='SurveyAggregateMark',
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_drop_question_aggregates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SurveyAnswersGeneration',
+            fields=[
+                ('survey', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='app.survey')),
+                ('generation', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'survey_answers_generation',
+            },
+        ),
+    ]
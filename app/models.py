@@ -1,5 +1,5 @@
 # models.py
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
@@ -42,12 +42,50 @@ class AnswerChoice(models.Model):
 
     class Meta:
         db_table = 'answer_choice'
-    
+        constraints = [
+            models.UniqueConstraint(fields=['question', 'choice_value'], name='unique_answer_choice'),
+        ]
+
+
+def _forget_answers(answers):
+    # Deleted answers leave the rollup, the question aggregates and the
+    # analytics columns. Imported here because these modules import the models.
+    from .aggregates import subtract_answers
+    from .analytics import invalidate_survey_columns
+    from .rollup import subtract_star_counts
+
+    subtract_answers(answers)
+    invalidate_survey_columns(subtract_star_counts(answers))
+
+
+class SurveyResponseQuerySet(models.QuerySet):
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            _forget_answers(SurveyResponseAnswer.objects.filter(response__in=self.values('pk')))
+            return super().delete()
+
+
+class SurveyResponseAnswerQuerySet(models.QuerySet):
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            _forget_answers(SurveyResponseAnswer.objects.filter(pk__in=self.values('pk')))
+            return super().delete()
+
+
 class SurveyResponse(models.Model):
     survey = models.ForeignKey(Survey, on_delete=models.CASCADE)
     ip_address = models.GenericIPAddressField()
     timestamp = models.DateTimeField(default=timezone.now)
     remarks = models.TextField(blank=True, null=True)
+    # Set by clients that may deliver the same response more than once
+    idempotency_key = models.CharField(max_length=64, blank=True, null=True, unique=True)
+
+    objects = SurveyResponseQuerySet.as_manager()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            _forget_answers(SurveyResponseAnswer.objects.filter(response_id=self.pk))
+            return super().delete(*args, **kwargs)
     
     def get_survey_responses(self, start_date=None, end_date=None):
         responses = SurveyResponse.objects.filter(survey=self)
@@ -63,11 +101,103 @@ class SurveyResponse(models.Model):
     class Meta:
 
         db_table = 'survey_response'
+        indexes = [
+            models.Index(fields=['survey', 'timestamp'], name='response_survey_ts_idx'),
+            # Keyset pagination across all surveys (the SurveyResponse admin)
+            models.Index(fields=['timestamp', 'id'], name='response_ts_id_idx'),
+        ]
 
 class SurveyResponseAnswer(models.Model):
     response = models.ForeignKey(SurveyResponse, on_delete=models.CASCADE)
     question = models.ForeignKey(SurveyQuestion, on_delete=models.CASCADE)
     answer = models.ForeignKey(AnswerChoice, on_delete=models.CASCADE)
+
+    objects = SurveyResponseAnswerQuerySet.as_manager()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            _forget_answers(SurveyResponseAnswer.objects.filter(pk=self.pk))
+            return super().delete(*args, **kwargs)
+
     class Meta:
 
-        db_table = 'survey_response_answer'
\ No newline at end of file
+        db_table = 'survey_response_answer'
+        indexes = [
+            models.Index(fields=['question', 'answer'], name='answer_question_choice_idx'),
+        ]
+
+
+class QuestionStarRollup(models.Model):
+    # Number of answers per question, local day and star value. Kept up to
+    # date by app.ingest and rebuilt with `manage.py rebuild_star_rollup`.
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE)
+    question = models.ForeignKey(SurveyQuestion, on_delete=models.CASCADE)
+    date = models.DateField()
+    star_value = models.IntegerField(choices=[(1, '⭐'), (2, '⭐⭐'), (3, '⭐⭐⭐'), (4, '⭐⭐⭐⭐'), (5, '⭐⭐⭐⭐⭐')])
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'question_star_rollup'
+        constraints = [
+            models.UniqueConstraint(fields=['question', 'date', 'star_value'], name='unique_question_star_rollup'),
+        ]
+        indexes = [
+            models.Index(fields=['survey', 'date'], name='star_rollup_survey_date_idx'),
+        ]
+
+
+class QuestionTrendBucket(models.Model):
+    # Number and star total of the answers per question and local week or
+    # month, so a trend reads one row per question and bucket instead of
+    # every daily rollup row. Kept up to date and rebuilt with QuestionStarRollup.
+    GRANULARITY_CHOICES = [('week', 'Week'), ('month', 'Month')]
+
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE)
+    question = models.ForeignKey(SurveyQuestion, on_delete=models.CASCADE)
+    granularity = models.CharField(max_length=5, choices=GRANULARITY_CHOICES)
+    # Monday of the week or first day of the month
+    start = models.DateField()
+    count = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'question_trend_bucket'
+        constraints = [
+            models.UniqueConstraint(fields=['question', 'granularity', 'start'], name='unique_question_trend_bucket'),
+        ]
+        indexes = [
+            models.Index(fields=['survey', 'granularity', 'start'], name='trend_bucket_survey_start_idx'),
+        ]
+
+
+class SurveyAnswersGeneration(models.Model):
+    # Bumped in the transaction that edits or deletes any of a survey's
+    # stored answers. Every process compares it with its in-memory analytics
+    # columns (app.analytics), and it is part of the statistics API ETag.
+    survey = models.OneToOneField(Survey, on_delete=models.CASCADE, primary_key=True)
+    generation = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'survey_answers_generation'
+
+
+class QuestionAggregate(models.Model):
+    # All-time answer count, sum and sum of squares of the star values per
+    # question, folded in by app.aggregates up to SurveyAggregateMark.
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE)
+    question = models.OneToOneField(SurveyQuestion, on_delete=models.CASCADE)
+    count = models.BigIntegerField(default=0)
+    total = models.BigIntegerField(default=0)
+    total_squares = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'question_aggregate'
+
+
+class SurveyAggregateMark(models.Model):
+    # Highest SurveyResponse id whose answers are included in QuestionAggregate
+    survey = models.OneToOneField(Survey, on_delete=models.CASCADE, primary_key=True)
+    last_response_id = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'survey_aggregate_mark'
@@ -0,0 +1,79 @@
+# page_cache.py
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .forms import SurveyResponseForm
+
+# Rendered in place of the CSRF token and swapped for the real one per request
+CSRF_TOKEN_PLACEHOLDER = 'csrftokenplaceholder0cached0page0fragment'
+
+
+def render_cached(key, template_name, context=None, timeout=None):
+    """Render a request-independent template once and keep it in the cache.
+
+    Returns a dict with the html, a strong ETag and the render time.
+    """
+    page = cache.get(key)
+    if page is None:
+        content = render_to_string(template_name, context)
+        page = {
+            'content': content,
+            'etag': '"%s"' % hashlib.md5(content.encode('utf-8'), usedforsecurity=False).hexdigest(),
+            'last_modified': timezone.now(),
+        }
+        cache.set(key, page, timeout=timeout if timeout is not None else settings.PAGE_CACHE_TIMEOUT)
+    return page
+
+
+async def arender_cached(key, template_name, context=None, timeout=None):
+    """Async version of render_cached(); only the cache round trips are awaited."""
+    page = await cache.aget(key)
+    if page is None:
+        content = render_to_string(template_name, context)
+        page = {
+            'content': content,
+            'etag': '"%s"' % hashlib.md5(content.encode('utf-8'), usedforsecurity=False).hexdigest(),
+            'last_modified': timezone.now(),
+        }
+        await cache.aset(key, page, timeout=timeout if timeout is not None else settings.PAGE_CACHE_TIMEOUT)
+    return page
+
+
+def _survey_form_page(definition):
+    survey = definition.survey
+    return (
+        f'survey_form_html:{survey.id}:{definition.version}',
+        'survey_list.html',
+        {
+            'survey': survey,
+            'questions': definition.questions,
+            'form': SurveyResponseForm(questions=definition.questions),
+            'csrf_token': CSRF_TOKEN_PLACEHOLDER,
+        },
+    )
+
+
+def survey_form_response(request, definition):
+    """The respondent form for a survey, rendered once per definition version."""
+    page = render_cached(*_survey_form_page(definition), timeout=settings.SURVEY_DEFINITION_CACHE_TIMEOUT)
+    # get_token also makes sure the CSRF cookie is set on the response
+    return HttpResponse(page['content'].replace(CSRF_TOKEN_PLACEHOLDER, get_token(request)))
+
+
+def thank_you_page_cached():
+    return render_cached('page_html:thank_you_page', 'thank_you_page.html')
+
+
+async def asurvey_form_response(request, definition):
+    page = await arender_cached(*_survey_form_page(definition), timeout=settings.SURVEY_DEFINITION_CACHE_TIMEOUT)
+    return HttpResponse(page['content'].replace(CSRF_TOKEN_PLACEHOLDER, get_token(request)))
+
+
+async def athank_you_page_cached():
+    return await arender_cached('page_html:thank_you_page', 'thank_you_page.html')
@@ -0,0 +1,156 @@
+# qr_assets.py
+"""Survey QR codes, rendered once and kept on disk.
+
+Each survey gets a PNG and an SVG QR code of its survey_list URL at screen
+and print size. The files are named after a hash of their content, so they
+can be served with far-future cache headers: a new base URL or survey id
+gives new files under new names. A small manifest per survey records the
+URL the files encode and their names, so a page view only reads that.
+"""
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import zipfile
+from pathlib import Path
+
+import segno
+from django.conf import settings
+from django.urls import reverse
+from django.utils.text import slugify
+
+# Pixels per QR module; a survey URL is a 29 or 33 module code plus border
+QR_SIZES = {'screen': 6, 'print': 24}
+QR_FORMATS = {'png': 'image/png', 'svg': 'image/svg+xml'}
+QR_FILENAME_RE = re.compile(r'^survey_\d+_(%s)_[0-9a-f]{16}\.(%s)$' % ('|'.join(QR_SIZES), '|'.join(QR_FORMATS)))
+
+_render_lock = threading.Lock()
+
+
+def survey_qr_target(survey_id):
+    return settings.SURVEY_QR_BASE_URL.rstrip('/') + reverse('survey_list', args=[survey_id])
+
+
+def _qr_directory():
+    return Path(settings.SURVEY_QR_DIR)
+
+
+def _manifest_path(survey_id):
+    return _qr_directory() / f'survey_{survey_id}.json'
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _render(target, size, kind):
+    buffer = io.BytesIO()
+    segno.make(target, error='m').save(buffer, kind=kind, scale=QR_SIZES[size], border=4)
+    return buffer.getvalue()
+
+
+def _read_manifest(survey_id):
+    try:
+        return json.loads(_manifest_path(survey_id).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def render_survey_qr_codes(survey_id):
+    """Render every size and format for the survey and return the new manifest."""
+    target = survey_qr_target(survey_id)
+    directory = _qr_directory()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    for size in QR_SIZES:
+        for kind in QR_FORMATS:
+            data = _render(target, size, kind)
+            filename = f'survey_{survey_id}_{size}_{hashlib.sha256(data).hexdigest()[:16]}.{kind}'
+            if not (directory / filename).exists():
+                _write_atomic(directory / filename, data)
+            files[f'{size}_{kind}'] = filename
+
+    manifest = {'target': target, 'files': files}
+    _write_atomic(_manifest_path(survey_id), json.dumps(manifest).encode('utf-8'))
+
+    # Files for an older target are never linked again
+    for stale in directory.glob(f'survey_{survey_id}_*'):
+        if stale.name not in files.values():
+            stale.unlink(missing_ok=True)
+    return manifest
+
+
+def get_survey_qr_codes(survey_id):
+    """Return {'<size>_<format>': filename}, rendering the files if they are missing or stale."""
+    manifest = _read_manifest(survey_id)
+    if manifest is None or manifest['target'] != survey_qr_target(survey_id):
+        with _render_lock:
+            manifest = _read_manifest(survey_id)
+            if manifest is None or manifest['target'] != survey_qr_target(survey_id):
+                manifest = render_survey_qr_codes(survey_id)
+    return manifest['files']
+
+
+def get_survey_qr_urls(survey_id):
+    return {
+        key: reverse('survey_qr_code', args=[filename])
+        for key, filename in get_survey_qr_codes(survey_id).items()
+    }
+
+
+def delete_survey_qr_codes(survey_id):
+    for path in _qr_directory().glob(f'survey_{survey_id}_*'):
+        path.unlink(missing_ok=True)
+    _manifest_path(survey_id).unlink(missing_ok=True)
+
+
+def qr_code_path(filename):
+    """Path of a rendered QR code, or None for names this module would never have written."""
+    if not QR_FILENAME_RE.match(filename):
+        return None
+    path = _qr_directory() / filename
+    return path if path.exists() else None
+
+
+class ZipStream(io.RawIOBase):
+    # A write-only file for ZipFile that hands back what was written so far
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_qr_zip(surveys):
+    """Yield a ZIP of every survey's QR codes, one survey at a time.
+
+    ZipFile writes to the unseekable stream with data descriptors, so nothing
+    but the current file is held in memory. PNGs are stored as they are;
+    they would not compress any further.
+    """
+    stream = ZipStream()
+    with zipfile.ZipFile(stream, 'w') as archive:
+        for survey_id, name in surveys.values_list('id', 'name').iterator():
+            folder = f'{survey_id}-{slugify(name) or "survey"}'
+            for key, filename in get_survey_qr_codes(survey_id).items():
+                size, kind = key.split('_')
+                archive.write(
+                    _qr_directory() / filename, f'{folder}/{size}.{kind}',
+                    compress_type=zipfile.ZIP_STORED if kind == 'png' else zipfile.ZIP_DEFLATED,
+                )
+            yield stream.take()
+    yield stream.take()
@@ -0,0 +1,82 @@
+# query_detector.py
+"""Development-time N+1 query detector.
+
+QueryGrowthMiddleware groups the queries of a request by their SQL (the
+parameters are separate, so one statement run once per row always has the
+same text). A statement that runs QUERY_DETECTOR_THRESHOLD times or more
+is a query per rendered row, and the request's query count then grows
+linearly with the data. Such requests are logged as warnings with the view
+and the statement.
+
+Queries are followed through app.metrics.observe_queries, so the ones that
+run in sync_to_async threads under ASGI are counted too.
+
+The middleware removes itself (MiddlewareNotUsed) unless
+QUERY_DETECTOR_ENABLED is set, which it is by default with DEBUG.
+"""
+import logging
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .metrics import observe_queries
+
+logger = logging.getLogger(__name__)
+
+
+class StatementCounter:
+    """Query observer that counts how often each SQL statement runs."""
+
+    def __init__(self):
+        self.statements = Counter()
+
+    def __call__(self, sql, duration):
+        self.statements[sql] += 1
+
+    def repeated(self, threshold):
+        return [(sql, count) for sql, count in self.statements.most_common() if count >= threshold]
+
+
+def _report(request, counter):
+    repeated = counter.repeated(settings.QUERY_DETECTOR_THRESHOLD)
+    if not repeated:
+        return
+    match = getattr(request, 'resolver_match', None)
+    for sql, count in repeated:
+        logger.warning('query repeated per row', extra={'data': {
+            'view': match.view_name if match else request.path,
+            'path': request.path,
+            'repeats': count,
+            'total_queries': sum(counter.statements.values()),
+            'sql': sql,
+        }})
+
+
+class QueryGrowthMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.QUERY_DETECTOR_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        counter = StatementCounter()
+        with observe_queries(counter):
+            response = self.get_response(request)
+        _report(request, counter)
+        return response
+
+    async def __acall__(self, request):
+        counter = StatementCounter()
+        with observe_queries(counter):
+            response = await self.get_response(request)
+        _report(request, counter)
+        return response
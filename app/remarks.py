@@ -0,0 +1,36 @@
+# remarks.py
+from django.db.models import Count, Exists, F, OuterRef, Subquery
+
+from .keyset import akeyset_page, keyset_page
+from .models import SurveyResponseAnswer
+
+REMARKS_PER_PAGE = 5
+
+
+def get_remarks(responses):
+    """One row per response that has remarks and answers, oldest first.
+
+    `responses` is an already filtered SurveyResponse queryset. Rows are dicts
+    with id, remark, timestamp and count (the number of answers). The answers
+    are checked and counted per response in subqueries rather than with a
+    GROUP BY, so the database can walk the (survey, timestamp) index in order
+    and stop after one page.
+    """
+    answers = SurveyResponseAnswer.objects.filter(response=OuterRef('pk')).order_by()
+    return (
+        responses.exclude(remarks='')
+        .filter(Exists(answers))
+        .values('id', 'timestamp', remark=F('remarks'))
+        .annotate(count=Subquery(answers.values('response').annotate(count=Count('id')).values('count')))
+        .order_by('timestamp', 'id')
+    )
+
+
+def get_remarks_page(responses, after=None, before=None, last=False, per_page=REMARKS_PER_PAGE):
+    """Return a keyset page of get_remarks(); see app.keyset for the cursors."""
+    return keyset_page(get_remarks(responses), after, before, last, per_page)
+
+
+async def aget_remarks_page(responses, after=None, before=None, last=False, per_page=REMARKS_PER_PAGE):
+    """Async version of get_remarks_page()."""
+    return await akeyset_page(get_remarks(responses), after, before, last, per_page)
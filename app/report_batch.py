@@ -0,0 +1,133 @@
+# report_batch.py
+"""PDF reports for many surveys at once, e.g. every survey's monthly report.
+
+The star counts of all the surveys come from one aggregation pass. The
+reports are then rendered by a pool of worker processes, one per core by
+default (PDF_REPORT_BATCH_WORKERS), each running render_report_pdf with its
+share of the counts. Results come back as reports finish, so they can be
+reported as progress and written to a directory or streamed into a ZIP.
+"""
+import csv
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from django.utils.text import slugify
+
+from .analytics import surveys_question_star_counts
+from .qr_assets import ZipStream
+from .reports import render_report_pdf
+from .worker_setup import database_names, setup_worker
+
+
+def report_period(start_date, end_date):
+    """Naive local datetimes covering the dates start_date to end_date, as the report views use them."""
+    return (
+        datetime.combine(start_date, datetime.min.time()),
+        datetime.combine(end_date, datetime.max.time()),
+    )
+
+
+def last_month(today=None):
+    """(first day, last day) of the calendar month before `today` in the local time zone."""
+    today = today or timezone.localdate()
+    end_date = today.replace(day=1) - timedelta(days=1)
+    return end_date.replace(day=1), end_date
+
+
+def report_filename(survey):
+    return f'{slugify(survey.department.name) or "department"}/{survey.id}-{slugify(survey.name) or "survey"}.pdf'
+
+
+def _render(survey, start_date, end_date, question_counts, path):
+    started = time.perf_counter()
+    ok = render_report_pdf(survey, start_date, end_date, path, question_counts=question_counts)
+    return ok, time.perf_counter() - started
+
+
+def _render_in_worker(*args):
+    try:
+        return _render(*args)
+    finally:
+        connections.close_all()
+
+
+def render_survey_reports(surveys, start_date, end_date, directory, workers=None):
+    """Render the report of every survey in `surveys` into `directory`.
+
+    Yields a dict per report as it finishes: survey, filename, path, status
+    ('ok' or 'failed'), seconds and error. With one worker the reports are
+    rendered in this process.
+    """
+    directory = Path(directory)
+    surveys = list(surveys.select_related('department').order_by('department__name', 'name', 'id'))
+    question_counts = surveys_question_star_counts(
+        [survey.id for survey in surveys],
+        start_date.date() if start_date else None,
+        end_date.date() if end_date else None,
+    )
+    jobs = [(survey, directory / report_filename(survey)) for survey in surveys]
+    for _, path in jobs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def result(survey, path, ok=False, seconds=0.0, error=None):
+        return {
+            'survey': survey, 'filename': report_filename(survey), 'path': path,
+            'status': 'ok' if ok else 'failed', 'seconds': seconds, 'error': error,
+        }
+
+    workers = workers or settings.PDF_REPORT_BATCH_WORKERS
+    if workers == 1 or len(jobs) <= 1:
+        for survey, path in jobs:
+            yield result(survey, path, *_render(survey, start_date, end_date, question_counts[survey.id], path))
+        return
+
+    # Spawned workers start clean, which is safe from inside a threaded web
+    # server; the parent's connections are closed so none is shared
+    connections.close_all()
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, len(jobs)), mp_context=multiprocessing.get_context('spawn'),
+        initializer=setup_worker, initargs=(database_names(),),
+    )
+    try:
+        futures = {
+            pool.submit(_render_in_worker, survey, start_date, end_date, question_counts[survey.id], path): (survey, path)
+            for survey, path in jobs
+        }
+        for future in as_completed(futures):
+            survey, path = futures[future]
+            try:
+                yield result(survey, path, *future.result())
+            except Exception as exc:
+                yield result(survey, path, error=repr(exc))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_survey_reports_zip(surveys, start_date, end_date, workers=None):
+    """Yield a ZIP of the surveys' reports, a report at a time, ending with timings.csv."""
+    stream = ZipStream()
+    timings = io.StringIO()
+    writer = csv.writer(timings)
+    writer.writerow(['file', 'department', 'survey', 'status', 'seconds'])
+    with tempfile.TemporaryDirectory(prefix='survey-reports-') as directory:
+        with zipfile.ZipFile(stream, 'w') as archive:
+            for report in render_survey_reports(surveys, start_date, end_date, directory, workers):
+                survey = report['survey']
+                writer.writerow([report['filename'], survey.department.name, survey.name, report['status'], f'{report["seconds"]:.2f}'])
+                if report['status'] == 'ok':
+                    # PDF streams are compressed already
+                    archive.write(report['path'], report['filename'], compress_type=zipfile.ZIP_STORED)
+                    os.remove(report['path'])
+                yield stream.take()
+            archive.writestr('timings.csv', timings.getvalue(), compress_type=zipfile.ZIP_DEFLATED)
+        yield stream.take()
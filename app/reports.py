@@ -0,0 +1,258 @@
+# reports.py
+"""Survey PDF reports.
+
+xhtml2pdf lays out a whole document in memory, at many times the size of its
+HTML, so a report is not rendered in one go: render_report_pdf renders the
+summary and then the individual responses a chunk at a time (read by keyset
+on (timestamp, id)), writes each part to a temporary file and merges them with
+pypdf. The layout, by far the largest cost, then depends on the chunk size
+and not on the survey size. The merge does not: pypdf keeps every page's
+objects until the file is written, so it grows with the output, by about
+8 MB per thousand pages (benchmark_pdf_report).
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, Max, Subquery
+from django.http import HttpResponse
+from django.template.loader import get_template
+from django.utils import timezone
+from pypdf import PdfWriter
+from xhtml2pdf import pisa
+
+from .models import SurveyAnswersGeneration, SurveyQuestion, SurveyResponse
+from .analytics import question_star_counts
+from .keyset import keyset_page
+from .metrics import PDF_RENDER_SECONDS
+
+REPORT_TEMPLATE = 'survey_pdf_template.html'
+
+
+def _render_html(html, dest):
+    # Returns False if xhtml2pdf reported an error
+    start = time.perf_counter()
+    pdf = pisa.pisaDocument(html, dest)
+    PDF_RENDER_SECONDS.observe(time.perf_counter() - start)
+    return not pdf.err
+
+
+def render_pdf_bytes(template_src, context_dict):
+    html = get_template(template_src).render(context_dict)
+    result = BytesIO()
+    if _render_html(html, result):
+        return result.getvalue()
+    return None
+
+
+def render_to_pdf(template_src, context_dict):
+    pdf = render_pdf_bytes(template_src, context_dict)
+    if pdf is not None:
+        return HttpResponse(pdf, content_type='application/pdf')
+    return None
+
+
+def get_report_responses(survey, start_date=None, end_date=None):
+    # start_date and end_date are naive local datetimes, either may be None
+    responses = SurveyResponse.objects.filter(survey=survey)
+    if start_date:
+        responses = responses.filter(timestamp__gte=timezone.make_aware(start_date))
+    if end_date:
+        responses = responses.filter(timestamp__lte=timezone.make_aware(end_date))
+    return responses
+
+
+def build_report_context(survey, start_date=None, end_date=None, question_counts=None):
+    """The report template's context; pass `question_counts` if they were computed already."""
+    responses = get_report_responses(survey, start_date, end_date)
+    if question_counts is None:
+        # Star counts for each question from the configured statistics backend
+        question_counts = question_star_counts(
+            survey,
+            start_date.date() if start_date else None,
+            end_date.date() if end_date else None,
+        )
+    return {
+        'survey': survey,
+        'responses': responses,
+        'total_responses': responses.count(),
+        'question_counts': question_counts,
+        'start_date': start_date,
+        'end_date': end_date,
+        'include_summary': True,
+    }
+
+
+def iter_report_response_chunks(responses, chunk_size):
+    """Yield the responses as lists of at most `chunk_size` rows, in (timestamp, id) order.
+
+    Each chunk is its own keyset query, so no cursor stays open while the
+    previous chunk renders. There is always a first chunk, if only an empty one.
+    """
+    rows = responses.values('id', 'timestamp', 'remarks')
+    page = keyset_page(rows, per_page=chunk_size)
+    yield page.object_list
+    while page.has_next:
+        last = page.object_list[-1]
+        page = keyset_page(rows, after=(last['timestamp'], last['id']), per_page=chunk_size)
+        yield page.object_list
+
+
+def render_report_pdf(survey, start_date, end_date, output, chunk_size=None, question_counts=None):
+    """Render the report into the file `output`. Returns False if xhtml2pdf reported an error.
+
+    The summary comes with the first chunk of responses; every chunk is
+    rendered to its own temporary PDF next to `output` and pypdf merges them.
+    The merge holds all the pages at once, so its memory is linear in the
+    size of the report.
+    """
+    chunk_size = chunk_size or settings.PDF_REPORT_CHUNK_SIZE
+    context = build_report_context(survey, start_date, end_date, question_counts)
+    template = get_template(REPORT_TEMPLATE)
+    output = Path(output)
+    with tempfile.TemporaryDirectory(dir=output.parent, prefix='.parts-') as parts_dir:
+        parts = []
+        for index, chunk in enumerate(iter_report_response_chunks(context['responses'], chunk_size)):
+            html = template.render({**context, 'responses': chunk, 'include_summary': index == 0})
+            parts.append(Path(parts_dir) / f'{index}.pdf')
+            with open(parts[-1], 'wb') as dest:
+                if not _render_html(html, dest):
+                    return False
+
+        writer = PdfWriter()
+        for part in parts:
+            writer.append(part)
+        with open(output, 'wb') as dest:
+            writer.write(dest)
+    return True
+
+
+class PdfReport:
+    """A survey report for a date range, cached on disk under a data fingerprint.
+
+    The fingerprint covers the survey name, its questions, the latest
+    response id and response count in the range and the survey's answers
+    generation, so the cached file goes stale as soon as a new response
+    arrives or a stored one is edited.
+    """
+
+    def __init__(self, survey, start_date=None, end_date=None):
+        self.survey = survey
+        self.start_date = start_date
+        self.end_date = end_date
+        self.fingerprint = self._fingerprint()
+        self.path = self.directory / f'{self.range_key}_{self.fingerprint}.pdf'
+
+    @property
+    def directory(self):
+        return Path(settings.PDF_REPORT_CACHE_DIR) / f'survey_{self.survey.id}'
+
+    @property
+    def range_key(self):
+        start = self.start_date.strftime('%Y%m%d') if self.start_date else 'start'
+        end = self.end_date.strftime('%Y%m%d') if self.end_date else 'end'
+        return f'{start}-{end}'
+
+    def _fingerprint(self):
+        # The generation rides along in the same query; it comes back NULL
+        # for an empty range, where there is nothing to edit
+        generation = SurveyAnswersGeneration.objects.filter(survey_id=self.survey.id).values('generation')
+        version = get_report_responses(self.survey, self.start_date, self.end_date).aggregate(
+            latest=Max('id'), total=Count('id'), generation=Max(Subquery(generation)),
+        )
+        questions = list(SurveyQuestion.objects.filter(survey=self.survey).order_by('id').values_list('id', 'question_text'))
+        data = repr((
+            self.survey.id, self.survey.name, self.range_key, version['latest'], version['total'], questions,
+            version['generation'],
+        ))
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()[:20]
+
+    def is_ready(self):
+        return self.path.exists()
+
+    def render(self):
+        """Render the PDF into the cache. Returns False if xhtml2pdf reported an error."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f'.{threading.get_ident()}.tmp')
+        try:
+            if not render_report_pdf(self.survey, self.start_date, self.end_date, tmp_path):
+                return False
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        # Older versions of the same report are never served again
+        for stale in self.directory.glob(f'{self.range_key}_*.pdf'):
+            if stale != self.path:
+                stale.unlink(missing_ok=True)
+        return True
+
+
+_executor = None
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+def _get_executor():
+    # Threads keep the request path free, but xhtml2pdf is pure Python and
+    # holds the GIL, so reports render one at a time and slow the web
+    # process's own requests while they run. Batches of reports go to the
+    # process pool in app.report_batch instead.
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.PDF_REPORT_WORKERS, thread_name_prefix='pdf-report')
+    return _executor
+
+
+def _render_job(report):
+    try:
+        return report.render()
+    finally:
+        # Worker threads keep their own connections; don't leak them
+        connections.close_all()
+
+
+def submit_report(report):
+    """Queue a background render of the report unless one is already running."""
+    with _jobs_lock:
+        job = _jobs.get(report.path)
+        if job is None:
+            job = _get_executor().submit(_render_job, report)
+            _jobs[report.path] = job
+        return job
+
+
+def get_report_status(report):
+    """Return 'ready', 'pending' or 'failed' for the report, queueing it if nobody has yet."""
+    if report.is_ready():
+        with _jobs_lock:
+            _jobs.pop(report.path, None)
+        return 'ready'
+
+    with _jobs_lock:
+        job = _jobs.get(report.path)
+    if job is None:
+        submit_report(report)
+        return 'pending'
+    if not job.done():
+        return 'pending'
+
+    with _jobs_lock:
+        _jobs.pop(report.path, None)
+    if job.exception() is None and job.result() and report.is_ready():
+        return 'ready'
+    return 'failed'
+
+
+def wait_for_reports(timeout=None):
+    """Block until every render queued so far has finished, without touching the database."""
+    with _jobs_lock:
+        jobs = list(_jobs.values())
+    wait(jobs, timeout)
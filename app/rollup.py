@@ -0,0 +1,250 @@
+# rollup.py
+import math
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.db.models.functions import TruncDate
+
+from .models import QuestionStarRollup, QuestionTrendBucket, SurveyQuestion, SurveyResponseAnswer
+
+STAR_VALUES = range(1, 6)
+# Granularities kept in QuestionTrendBucket; days are read from the rollup
+TREND_BUCKET_GRANULARITIES = ('week', 'month')
+
+
+def bucket_start(date, granularity):
+    """First day of the day, week (from Monday) or month that `date` falls in."""
+    if granularity == 'week':
+        return date - timedelta(days=date.weekday())
+    if granularity == 'month':
+        return date.replace(day=1)
+    return date
+
+
+def _trend_bucket_totals(daily):
+    # {(question_id, date): (count, star total)} -> {(question_id, granularity, start): [count, star total]}
+    totals = defaultdict(lambda: [0, 0])
+    for (question_id, date), (count, total) in daily.items():
+        for granularity in TREND_BUCKET_GRANULARITIES:
+            bucket = totals[question_id, granularity, bucket_start(date, granularity)]
+            bucket[0] += count
+            bucket[1] += total
+    return totals
+
+
+def _record_trend_buckets(survey_id, daily):
+    """Add {(question_id, date): (count, star total)} to the week and month buckets."""
+    totals = _trend_bucket_totals(daily)
+    QuestionTrendBucket.objects.bulk_create(
+        [
+            QuestionTrendBucket(survey_id=survey_id, question_id=question_id, granularity=granularity, start=start)
+            for question_id, granularity, start in totals
+        ],
+        ignore_conflicts=True,
+    )
+
+    # Each question's increment is picked by a CASE. Buckets with the same
+    # increments share an UPDATE: a single day's answers add the same amounts
+    # to its week and to its month.
+    groups = defaultdict(dict)
+    for (question_id, granularity, start), amounts in totals.items():
+        groups[granularity, start][question_id] = tuple(amounts)
+    shared = defaultdict(list)
+    for bucket, increments in groups.items():
+        shared[tuple(sorted(increments.items()))].append(bucket)
+    for increments, buckets in shared.items():
+        increments = dict(increments)
+        matches = Q()
+        for granularity, start in buckets:
+            matches |= Q(granularity=granularity, start=start)
+        QuestionTrendBucket.objects.filter(matches, question_id__in=list(increments)).update(
+            count=F('count') + Case(*[When(question_id=question_id, then=Value(count)) for question_id, (count, _) in increments.items()]),
+            total=F('total') + Case(*[When(question_id=question_id, then=Value(total)) for question_id, (_, total) in increments.items()]),
+        )
+
+
+def _add_star_counts(survey_id, increments):
+    # {(question_id, date, star_value): amount} -> rollup rows and trend buckets;
+    # amounts are negative for deleted answers.
+    # Make sure every row exists, then bump the counts with one UPDATE per
+    # (date, star value, increment) group instead of one per question.
+    QuestionStarRollup.objects.bulk_create(
+        [
+            QuestionStarRollup(survey_id=survey_id, question_id=question_id, date=date, star_value=star_value, count=0)
+            for question_id, date, star_value in increments
+        ],
+        ignore_conflicts=True,
+    )
+
+    groups = defaultdict(list)
+    for (question_id, date, star_value), amount in increments.items():
+        groups[(date, star_value, amount)].append(question_id)
+
+    for (date, star_value, amount), question_ids in groups.items():
+        QuestionStarRollup.objects.filter(
+            question_id__in=question_ids, date=date, star_value=star_value,
+        ).update(count=F('count') + amount)
+
+    daily = defaultdict(lambda: [0, 0])
+    for (question_id, date, star_value), amount in increments.items():
+        daily[question_id, date][0] += amount
+        daily[question_id, date][1] += amount * star_value
+    _record_trend_buckets(survey_id, daily)
+
+
+def record_star_counts(survey_id, answers):
+    """Fold new answers into the QuestionStarRollup table and the trend buckets.
+
+    `answers` is an iterable of (question_id, date, star_value) tuples. Call
+    this inside the transaction that inserts the answer rows.
+    """
+    increments = Counter(answers)
+    if increments:
+        _add_star_counts(survey_id, increments)
+
+
+def subtract_star_counts(answers):
+    """Take a queryset of answers back out of the rollup and the trend buckets.
+
+    Call this inside the transaction that deletes them, before the delete.
+    Answers of several surveys can be mixed. Returns the ids of the surveys
+    they belong to.
+    """
+    rows = (
+        answers.annotate(date=TruncDate('response__timestamp'))
+        .values_list('response__survey_id', 'question_id', 'date', 'answer__choice_value')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    decrements = defaultdict(dict)
+    for survey_id, question_id, date, star_value, count in rows:
+        decrements[survey_id][question_id, date, star_value] = -count
+    for survey_id, increments in decrements.items():
+        _add_star_counts(survey_id, increments)
+    return list(decrements)
+
+
+def rebuild_star_rollup(survey_ids=None):
+    """Recompute the rollup and trend buckets from the answer table. Returns the number of rollup rows written."""
+    rollups = QuestionStarRollup.objects.all()
+    answers = SurveyResponseAnswer.objects.all()
+    if survey_ids is not None:
+        rollups = rollups.filter(survey_id__in=survey_ids)
+        answers = answers.filter(response__survey_id__in=survey_ids)
+
+    rows = (
+        answers.annotate(date=TruncDate('response__timestamp'))
+        .values('response__survey_id', 'question_id', 'date', 'answer__choice_value')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+
+    rollups.delete()
+    created = QuestionStarRollup.objects.bulk_create(
+        [
+            QuestionStarRollup(
+                survey_id=row['response__survey_id'],
+                question_id=row['question_id'],
+                date=row['date'],
+                star_value=row['answer__choice_value'],
+                count=row['count'],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+    rebuild_trend_buckets(survey_ids)
+    return len(created)
+
+
+def rebuild_trend_buckets(survey_ids=None):
+    """Recompute the week and month buckets from the daily rollup. Returns the number of rows written."""
+    rollups = QuestionStarRollup.objects.all()
+    buckets = QuestionTrendBucket.objects.all()
+    if survey_ids is not None:
+        rollups = rollups.filter(survey_id__in=survey_ids)
+        buckets = buckets.filter(survey_id__in=survey_ids)
+
+    daily = defaultdict(dict)
+    rows = (
+        rollups.values_list('survey_id', 'question_id', 'date')
+        .annotate(answered=Sum('count'), stars=Sum(F('count') * F('star_value')))
+        .order_by()
+    )
+    for survey_id, question_id, date, answered, stars in rows.iterator():
+        daily[survey_id][question_id, date] = (answered, stars)
+
+    buckets.delete()
+    created = QuestionTrendBucket.objects.bulk_create(
+        [
+            QuestionTrendBucket(
+                survey_id=survey_id, question_id=question_id, granularity=granularity, start=start,
+                count=count, total=total,
+            )
+            for survey_id, survey_daily in daily.items()
+            for (question_id, granularity, start), (count, total) in _trend_bucket_totals(survey_daily).items()
+        ],
+        batch_size=1000,
+    )
+    return len(created)
+
+
+def _star_count_totals(rollups, start_date, end_date):
+    if start_date:
+        rollups = rollups.filter(date__gte=start_date)
+    if end_date:
+        rollups = rollups.filter(date__lte=end_date)
+    return rollups.values('question_id', 'star_value').annotate(total=Sum('count')).order_by()
+
+
+def _set_star_counts(questions, rows):
+    totals = defaultdict(dict)
+    for row in rows:
+        totals[row['question_id']][row['star_value']] = row['total']
+
+    for question in questions:
+        counts = totals.get(question.id, {})
+        for star_value in STAR_VALUES:
+            setattr(question, f'star_counts_{star_value}', counts.get(star_value, 0))
+        answered = sum(counts.values())
+        question.avg_rating = (
+            sum(star_value * count for star_value, count in counts.items()) / answered if answered else None
+        )
+        question.std_rating = (
+            math.sqrt(max(
+                sum(star_value * star_value * count for star_value, count in counts.items()) / answered
+                - question.avg_rating * question.avg_rating,
+                0.0,
+            )) if answered else None
+        )
+    return questions
+
+
+def get_question_star_counts(survey, start_date=None, end_date=None):
+    """Return the survey's questions annotated with star_counts_1..5, avg_rating and std_rating.
+
+    start_date and end_date are inclusive local dates; None leaves that end of
+    the range open.
+    """
+    rows = list(_star_count_totals(QuestionStarRollup.objects.filter(survey=survey), start_date, end_date))
+    return _set_star_counts(list(SurveyQuestion.objects.filter(survey=survey)), rows)
+
+
+def get_surveys_question_star_counts(survey_ids, start_date=None, end_date=None):
+    """get_question_star_counts() for several surveys in one aggregation; returns {survey_id: questions}."""
+    rollups = QuestionStarRollup.objects.filter(survey_id__in=survey_ids)
+    rows = list(_star_count_totals(rollups, start_date, end_date))
+    questions = list(SurveyQuestion.objects.filter(survey_id__in=survey_ids).order_by('id'))
+    _set_star_counts(questions, rows)
+    by_survey = {survey_id: [] for survey_id in survey_ids}
+    for question in questions:
+        by_survey[question.survey_id].append(question)
+    return by_survey
+
+
+async def aget_question_star_counts(survey, start_date=None, end_date=None):
+    """Async version of get_question_star_counts()."""
+    rows = [row async for row in _star_count_totals(QuestionStarRollup.objects.filter(survey=survey), start_date, end_date)]
+    questions = [question async for question in SurveyQuestion.objects.filter(survey=survey)]
+    return _set_star_counts(questions, rows)
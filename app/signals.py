@@ -0,0 +1,94 @@
+# signals.py
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .aggregates import reset_question_aggregates
+from .analytics import invalidate_survey_columns
+from .metrics import query_observer
+from .qr_assets import delete_survey_qr_codes
+from .rollup import rebuild_star_rollup
+from .models import AnswerChoice, Department, Survey, SurveyQuestion, SurveyResponse, SurveyResponseAnswer
+from .survey_cache import invalidate_survey_definition
+
+
+@receiver([post_save, post_delete], sender=Survey)
+def survey_changed(sender, instance, **kwargs):
+    invalidate_survey_definition(instance.id)
+
+
+@receiver(post_delete, sender=Survey)
+def survey_deleted(sender, instance, **kwargs):
+    delete_survey_qr_codes(instance.id)
+
+
+@receiver([post_save, post_delete], sender=SurveyQuestion)
+def survey_question_changed(sender, instance, signal, origin=None, **kwargs):
+    invalidate_survey_definition(instance.survey_id)
+    # Its answers went with it; a deleted survey takes its generation along
+    if signal is post_delete and _deleted_model(origin) not in (Department, Survey):
+        invalidate_survey_columns([instance.survey_id])
+
+
+@receiver([post_save, post_delete], sender=AnswerChoice)
+def answer_choice_changed(sender, instance, created=False, origin=None, **kwargs):
+    # Deleted along with its question or survey, whose receivers invalidate
+    if origin is not None and _deleted_model(origin) in (Department, Survey, SurveyQuestion):
+        return
+    # AnswerChoice only knows its question; a delete may run after it's gone
+    survey_id = SurveyQuestion.objects.filter(pk=instance.question_id).values_list('survey_id', flat=True).first()
+    if survey_id is not None:
+        invalidate_survey_definition(survey_id)
+        # A changed star value, or the answers that went with a deleted choice
+        if not created:
+            invalidate_survey_columns([survey_id])
+            rebuild_star_rollup([survey_id])
+            reset_question_aggregates([survey_id])
+
+
+@receiver(post_save, sender=SurveyResponse)
+@receiver(post_save, sender=SurveyResponseAnswer)
+def survey_answers_changed(sender, instance, created, **kwargs):
+    # New rows are picked up by response id and counted by app.ingest. The
+    # app never edits them, so an edit (admin, shell) rebuilds the survey's
+    # rollup, question aggregates and analytics columns. Deletes are handled
+    # by the models' and querysets' delete(), which keeps the fast delete of
+    # answers.
+    if created:
+        return
+    if sender is SurveyResponse:
+        survey_id = instance.survey_id
+    else:
+        survey_id = SurveyResponse.objects.filter(pk=instance.response_id).values_list('survey_id', flat=True).first()
+    if survey_id is not None:
+        invalidate_survey_columns([survey_id])
+        rebuild_star_rollup([survey_id])
+        reset_question_aggregates([survey_id])
+
+
+def _deleted_model(origin):
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+@receiver(connection_created)
+def tune_sqlite_connection(sender, connection, **kwargs):
+    # WAL lets readers run while a submission is being written, NORMAL only
+    # fsyncs at checkpoints and busy_timeout waits for the writer lock
+    # instead of failing with "database is locked"
+    if connection.vendor != 'sqlite':
+        return
+    busy_timeout = int(settings.DATABASES[connection.alias].get('OPTIONS', {}).get('timeout', 20) * 1000)
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={busy_timeout}')
+
+
+@receiver(connection_created)
+def observe_connection_queries(sender, connection, **kwargs):
+    # Request metrics and the query detector follow queries through a
+    # context variable (app.metrics); a reused wrapper keeps its list
+    if query_observer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_observer)
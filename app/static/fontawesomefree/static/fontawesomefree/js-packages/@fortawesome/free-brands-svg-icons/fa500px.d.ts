@@ -1,11 +0,0 @@
-import { IconDefinition, IconPrefix, IconName } from "@fortawesome/fontawesome-common-types";
-export const definition: IconDefinition;
-export const fa500px: IconDefinition;
-export const prefix: IconPrefix;
-export const iconName: IconName;
-export const width: number;
-export const height: number;
-export const ligatures: (string | number)[];
-export const unicode: string;
-export const svgPathData: string;
-export const aliases: (string | number)[];
\ No newline at end of file
@@ -1,522 +0,0 @@
-export const faMonero: IconDefinition;
-export const faHooli: IconDefinition;
-export const faYelp: IconDefinition;
-export const faCcVisa: IconDefinition;
-export const faLastfm: IconDefinition;
-export const faShopware: IconDefinition;
-export const faCreativeCommonsNc: IconDefinition;
-export const faAws: IconDefinition;
-export const faRedhat: IconDefinition;
-export const faYoast: IconDefinition;
-export const faCloudflare: IconDefinition;
-export const faUps: IconDefinition;
-export const faPixiv: IconDefinition;
-export const faWpexplorer: IconDefinition;
-export const faDyalog: IconDefinition;
-export const faBity: IconDefinition;
-export const faStackpath: IconDefinition;
-export const faBuysellads: IconDefinition;
-export const faFirstOrder: IconDefinition;
-export const faModx: IconDefinition;
-export const faGuilded: IconDefinition;
-export const faVnv: IconDefinition;
-export const faSquareJs: IconDefinition;
-export const faJsSquare: IconDefinition;
-export const faMicrosoft: IconDefinition;
-export const faQq: IconDefinition;
-export const faOrcid: IconDefinition;
-export const faJava: IconDefinition;
-export const faInvision: IconDefinition;
-export const faCreativeCommonsPdAlt: IconDefinition;
-export const faCentercode: IconDefinition;
-export const faGlideG: IconDefinition;
-export const faDrupal: IconDefinition;
-export const faHireAHelper: IconDefinition;
-export const faCreativeCommonsBy: IconDefinition;
-export const faUnity: IconDefinition;
-export const faWhmcs: IconDefinition;
-export const faRocketchat: IconDefinition;
-export const faVk: IconDefinition;
-export const faUntappd: IconDefinition;
-export const faMailchimp: IconDefinition;
-export const faCss3Alt: IconDefinition;
-export const faSquareReddit: IconDefinition;
-export const faRedditSquare: IconDefinition;
-export const faVimeoV: IconDefinition;
-export const faContao: IconDefinition;
-export const faSquareFontAwesome: IconDefinition;
-export const faDeskpro: IconDefinition;
-export const faBrave: IconDefinition;
-export const faSistrix: IconDefinition;
-export const faSquareInstagram: IconDefinition;
-export const faInstagramSquare: IconDefinition;
-export const faBattleNet: IconDefinition;
-export const faTheRedYeti: IconDefinition;
-export const faSquareHackerNews: IconDefinition;
-export const faHackerNewsSquare: IconDefinition;
-export const faEdge: IconDefinition;
-export const faThreads: IconDefinition;
-export const faNapster: IconDefinition;
-export const faSquareSnapchat: IconDefinition;
-export const faSnapchatSquare: IconDefinition;
-export const faGooglePlusG: IconDefinition;
-export const faArtstation: IconDefinition;
-export const faMarkdown: IconDefinition;
-export const faSourcetree: IconDefinition;
-export const faGooglePlus: IconDefinition;
-export const faDiaspora: IconDefinition;
-export const faFoursquare: IconDefinition;
-export const faStackOverflow: IconDefinition;
-export const faGithubAlt: IconDefinition;
-export const faPhoenixSquadron: IconDefinition;
-export const faPagelines: IconDefinition;
-export const faAlgolia: IconDefinition;
-export const faRedRiver: IconDefinition;
-export const faCreativeCommonsSa: IconDefinition;
-export const faSafari: IconDefinition;
-export const faGoogle: IconDefinition;
-export const faSquareFontAwesomeStroke: IconDefinition;
-export const faFontAwesomeAlt: IconDefinition;
-export const faAtlassian: IconDefinition;
-export const faLinkedinIn: IconDefinition;
-export const faDigitalOcean: IconDefinition;
-export const faNimblr: IconDefinition;
-export const faChromecast: IconDefinition;
-export const faEvernote: IconDefinition;
-export const faHackerNews: IconDefinition;
-export const faCreativeCommonsSampling: IconDefinition;
-export const faAdversal: IconDefinition;
-export const faCreativeCommons: IconDefinition;
-export const faWatchmanMonitoring: IconDefinition;
-export const faFonticons: IconDefinition;
-export const faWeixin: IconDefinition;
-export const faShirtsinbulk: IconDefinition;
-export const faCodepen: IconDefinition;
-export const faGitAlt: IconDefinition;
-export const faLyft: IconDefinition;
-export const faRev: IconDefinition;
-export const faWindows: IconDefinition;
-export const faWizardsOfTheCoast: IconDefinition;
-export const faSquareViadeo: IconDefinition;
-export const faViadeoSquare: IconDefinition;
-export const faMeetup: IconDefinition;
-export const faCentos: IconDefinition;
-export const faAdn: IconDefinition;
-export const faCloudsmith: IconDefinition;
-export const faOpensuse: IconDefinition;
-export const faPiedPiperAlt: IconDefinition;
-export const faSquareDribbble: IconDefinition;
-export const faDribbbleSquare: IconDefinition;
-export const faCodiepie: IconDefinition;
-export const faNode: IconDefinition;
-export const faMix: IconDefinition;
-export const faSteam: IconDefinition;
-export const faCcApplePay: IconDefinition;
-export const faScribd: IconDefinition;
-export const faDebian: IconDefinition;
-export const faOpenid: IconDefinition;
-export const faInstalod: IconDefinition;
-export const faExpeditedssl: IconDefinition;
-export const faSellcast: IconDefinition;
-export const faSquareTwitter: IconDefinition;
-export const faTwitterSquare: IconDefinition;
-export const faRProject: IconDefinition;
-export const faDelicious: IconDefinition;
-export const faFreebsd: IconDefinition;
-export const faVuejs: IconDefinition;
-export const faAccusoft: IconDefinition;
-export const faIoxhost: IconDefinition;
-export const faFonticonsFi: IconDefinition;
-export const faAppStore: IconDefinition;
-export const faCcMastercard: IconDefinition;
-export const faItunesNote: IconDefinition;
-export const faGolang: IconDefinition;
-export const faKickstarter: IconDefinition;
-export const faGrav: IconDefinition;
-export const faWeibo: IconDefinition;
-export const faUncharted: IconDefinition;
-export const faFirstdraft: IconDefinition;
-export const faSquareYoutube: IconDefinition;
-export const faYoutubeSquare: IconDefinition;
-export const faWikipediaW: IconDefinition;
-export const faWpressr: IconDefinition;
-export const faRendact: IconDefinition;
-export const faAngellist: IconDefinition;
-export const faGalacticRepublic: IconDefinition;
-export const faNfcDirectional: IconDefinition;
-export const faSkype: IconDefinition;
-export const faJoget: IconDefinition;
-export const faFedora: IconDefinition;
-export const faStripeS: IconDefinition;
-export const faMeta: IconDefinition;
-export const faLaravel: IconDefinition;
-export const faHotjar: IconDefinition;
-export const faBluetoothB: IconDefinition;
-export const faSquareLetterboxd: IconDefinition;
-export const faStickerMule: IconDefinition;
-export const faCreativeCommonsZero: IconDefinition;
-export const faHips: IconDefinition;
-export const faBehance: IconDefinition;
-export const faReddit: IconDefinition;
-export const faDiscord: IconDefinition;
-export const faChrome: IconDefinition;
-export const faAppStoreIos: IconDefinition;
-export const faCcDiscover: IconDefinition;
-export const faWpbeginner: IconDefinition;
-export const faConfluence: IconDefinition;
-export const faShoelace: IconDefinition;
-export const faMdb: IconDefinition;
-export const faDochub: IconDefinition;
-export const faAccessibleIcon: IconDefinition;
-export const faEbay: IconDefinition;
-export const faAmazon: IconDefinition;
-export const faUnsplash: IconDefinition;
-export const faYarn: IconDefinition;
-export const faSquareSteam: IconDefinition;
-export const faSteamSquare: IconDefinition;
-export const fa500px: IconDefinition;
-export const faSquareVimeo: IconDefinition;
-export const faVimeoSquare: IconDefinition;
-export const faAsymmetrik: IconDefinition;
-export const faFontAwesome: IconDefinition;
-export const faFontAwesomeFlag: IconDefinition;
-export const faFontAwesomeLogoFull: IconDefinition;
-export const faGratipay: IconDefinition;
-export const faApple: IconDefinition;
-export const faHive: IconDefinition;
-export const faGitkraken: IconDefinition;
-export const faKeybase: IconDefinition;
-export const faApplePay: IconDefinition;
-export const faPadlet: IconDefinition;
-export const faAmazonPay: IconDefinition;
-export const faSquareGithub: IconDefinition;
-export const faGithubSquare: IconDefinition;
-export const faStumbleupon: IconDefinition;
-export const faFedex: IconDefinition;
-export const faPhoenixFramework: IconDefinition;
-export const faShopify: IconDefinition;
-export const faNeos: IconDefinition;
-export const faSquareThreads: IconDefinition;
-export const faHackerrank: IconDefinition;
-export const faResearchgate: IconDefinition;
-export const faSwift: IconDefinition;
-export const faAngular: IconDefinition;
-export const faSpeakap: IconDefinition;
-export const faAngrycreative: IconDefinition;
-export const faYCombinator: IconDefinition;
-export const faEmpire: IconDefinition;
-export const faEnvira: IconDefinition;
-export const faGoogleScholar: IconDefinition;
-export const faSquareGitlab: IconDefinition;
-export const faGitlabSquare: IconDefinition;
-export const faStudiovinari: IconDefinition;
-export const faPiedPiper: IconDefinition;
-export const faWordpress: IconDefinition;
-export const faProductHunt: IconDefinition;
-export const faFirefox: IconDefinition;
-export const faLinode: IconDefinition;
-export const faGoodreads: IconDefinition;
-export const faSquareOdnoklassniki: IconDefinition;
-export const faOdnoklassnikiSquare: IconDefinition;
-export const faJsfiddle: IconDefinition;
-export const faSith: IconDefinition;
-export const faThemeisle: IconDefinition;
-export const faPage4: IconDefinition;
-export const faHashnode: IconDefinition;
-export const faReact: IconDefinition;
-export const faCcPaypal: IconDefinition;
-export const faSquarespace: IconDefinition;
-export const faCcStripe: IconDefinition;
-export const faCreativeCommonsShare: IconDefinition;
-export const faBitcoin: IconDefinition;
-export const faKeycdn: IconDefinition;
-export const faOpera: IconDefinition;
-export const faItchIo: IconDefinition;
-export const faUmbraco: IconDefinition;
-export const faGalacticSenate: IconDefinition;
-export const faUbuntu: IconDefinition;
-export const faDraft2digital: IconDefinition;
-export const faStripe: IconDefinition;
-export const faHouzz: IconDefinition;
-export const faGg: IconDefinition;
-export const faDhl: IconDefinition;
-export const faSquarePinterest: IconDefinition;
-export const faPinterestSquare: IconDefinition;
-export const faXing: IconDefinition;
-export const faBlackberry: IconDefinition;
-export const faCreativeCommonsPd: IconDefinition;
-export const faPlaystation: IconDefinition;
-export const faQuinscape: IconDefinition;
-export const faLess: IconDefinition;
-export const faBloggerB: IconDefinition;
-export const faOpencart: IconDefinition;
-export const faVine: IconDefinition;
-export const faSignalMessenger: IconDefinition;
-export const faPaypal: IconDefinition;
-export const faGitlab: IconDefinition;
-export const faTypo3: IconDefinition;
-export const faRedditAlien: IconDefinition;
-export const faYahoo: IconDefinition;
-export const faDailymotion: IconDefinition;
-export const faAffiliatetheme: IconDefinition;
-export const faPiedPiperPp: IconDefinition;
-export const faBootstrap: IconDefinition;
-export const faOdnoklassniki: IconDefinition;
-export const faNfcSymbol: IconDefinition;
-export const faMintbit: IconDefinition;
-export const faEthereum: IconDefinition;
-export const faSpeakerDeck: IconDefinition;
-export const faCreativeCommonsNcEu: IconDefinition;
-export const faPatreon: IconDefinition;
-export const faAvianex: IconDefinition;
-export const faEllo: IconDefinition;
-export const faGofore: IconDefinition;
-export const faBimobject: IconDefinition;
-export const faBraveReverse: IconDefinition;
-export const faFacebookF: IconDefinition;
-export const faSquareGooglePlus: IconDefinition;
-export const faGooglePlusSquare: IconDefinition;
-export const faMandalorian: IconDefinition;
-export const faFirstOrderAlt: IconDefinition;
-export const faOsi: IconDefinition;
-export const faGoogleWallet: IconDefinition;
-export const faDAndDBeyond: IconDefinition;
-export const faPeriscope: IconDefinition;
-export const faFulcrum: IconDefinition;
-export const faCloudscale: IconDefinition;
-export const faForumbee: IconDefinition;
-export const faMizuni: IconDefinition;
-export const faSchlix: IconDefinition;
-export const faSquareXing: IconDefinition;
-export const faXingSquare: IconDefinition;
-export const faBandcamp: IconDefinition;
-export const faWpforms: IconDefinition;
-export const faCloudversify: IconDefinition;
-export const faUsps: IconDefinition;
-export const faMegaport: IconDefinition;
-export const faMagento: IconDefinition;
-export const faSpotify: IconDefinition;
-export const faOptinMonster: IconDefinition;
-export const faFly: IconDefinition;
-export const faAviato: IconDefinition;
-export const faItunes: IconDefinition;
-export const faCuttlefish: IconDefinition;
-export const faBlogger: IconDefinition;
-export const faFlickr: IconDefinition;
-export const faViber: IconDefinition;
-export const faSoundcloud: IconDefinition;
-export const faDigg: IconDefinition;
-export const faTencentWeibo: IconDefinition;
-export const faLetterboxd: IconDefinition;
-export const faSymfony: IconDefinition;
-export const faMaxcdn: IconDefinition;
-export const faEtsy: IconDefinition;
-export const faFacebookMessenger: IconDefinition;
-export const faAudible: IconDefinition;
-export const faThinkPeaks: IconDefinition;
-export const faBilibili: IconDefinition;
-export const faErlang: IconDefinition;
-export const faXTwitter: IconDefinition;
-export const faCottonBureau: IconDefinition;
-export const faDashcube: IconDefinition;
-export const fa42Group: IconDefinition;
-export const faInnosoft: IconDefinition;
-export const faStackExchange: IconDefinition;
-export const faElementor: IconDefinition;
-export const faSquarePiedPiper: IconDefinition;
-export const faPiedPiperSquare: IconDefinition;
-export const faCreativeCommonsNd: IconDefinition;
-export const faPalfed: IconDefinition;
-export const faSuperpowers: IconDefinition;
-export const faResolving: IconDefinition;
-export const faXbox: IconDefinition;
-export const faSearchengin: IconDefinition;
-export const faTiktok: IconDefinition;
-export const faSquareFacebook: IconDefinition;
-export const faFacebookSquare: IconDefinition;
-export const faRenren: IconDefinition;
-export const faLinux: IconDefinition;
-export const faGlide: IconDefinition;
-export const faLinkedin: IconDefinition;
-export const faHubspot: IconDefinition;
-export const faDeploydog: IconDefinition;
-export const faTwitch: IconDefinition;
-export const faRavelry: IconDefinition;
-export const faMixer: IconDefinition;
-export const faSquareLastfm: IconDefinition;
-export const faLastfmSquare: IconDefinition;
-export const faVimeo: IconDefinition;
-export const faMendeley: IconDefinition;
-export const faUniregistry: IconDefinition;
-export const faFigma: IconDefinition;
-export const faCreativeCommonsRemix: IconDefinition;
-export const faCcAmazonPay: IconDefinition;
-export const faDropbox: IconDefinition;
-export const faInstagram: IconDefinition;
-export const faCmplid: IconDefinition;
-export const faUpwork: IconDefinition;
-export const faFacebook: IconDefinition;
-export const faGripfire: IconDefinition;
-export const faJediOrder: IconDefinition;
-export const faUikit: IconDefinition;
-export const faFortAwesomeAlt: IconDefinition;
-export const faPhabricator: IconDefinition;
-export const faUssunnah: IconDefinition;
-export const faEarlybirds: IconDefinition;
-export const faTradeFederation: IconDefinition;
-export const faAutoprefixer: IconDefinition;
-export const faWhatsapp: IconDefinition;
-export const faSlideshare: IconDefinition;
-export const faGooglePlay: IconDefinition;
-export const faViadeo: IconDefinition;
-export const faLine: IconDefinition;
-export const faGoogleDrive: IconDefinition;
-export const faServicestack: IconDefinition;
-export const faSimplybuilt: IconDefinition;
-export const faBitbucket: IconDefinition;
-export const faImdb: IconDefinition;
-export const faDeezer: IconDefinition;
-export const faRaspberryPi: IconDefinition;
-export const faJira: IconDefinition;
-export const faDocker: IconDefinition;
-export const faScreenpal: IconDefinition;
-export const faBluetooth: IconDefinition;
-export const faGitter: IconDefinition;
-export const faDAndD: IconDefinition;
-export const faMicroblog: IconDefinition;
-export const faCcDinersClub: IconDefinition;
-export const faGgCircle: IconDefinition;
-export const faPiedPiperHat: IconDefinition;
-export const faKickstarterK: IconDefinition;
-export const faYandex: IconDefinition;
-export const faReadme: IconDefinition;
-export const faHtml5: IconDefinition;
-export const faSellsy: IconDefinition;
-export const faSass: IconDefinition;
-export const faWirsindhandwerk: IconDefinition;
-export const faWsh: IconDefinition;
-export const faBuromobelexperte: IconDefinition;
-export const faSalesforce: IconDefinition;
-export const faOctopusDeploy: IconDefinition;
-export const faMedapps: IconDefinition;
-export const faNs8: IconDefinition;
-export const faPinterestP: IconDefinition;
-export const faApper: IconDefinition;
-export const faFortAwesome: IconDefinition;
-export const faWaze: IconDefinition;
-export const faCcJcb: IconDefinition;
-export const faSnapchat: IconDefinition;
-export const faSnapchatGhost: IconDefinition;
-export const faFantasyFlightGames: IconDefinition;
-export const faRust: IconDefinition;
-export const faWix: IconDefinition;
-export const faSquareBehance: IconDefinition;
-export const faBehanceSquare: IconDefinition;
-export const faSupple: IconDefinition;
-export const faWebflow: IconDefinition;
-export const faRebel: IconDefinition;
-export const faCss3: IconDefinition;
-export const faStaylinked: IconDefinition;
-export const faKaggle: IconDefinition;
-export const faSpaceAwesome: IconDefinition;
-export const faDeviantart: IconDefinition;
-export const faCpanel: IconDefinition;
-export const faGoodreadsG: IconDefinition;
-export const faSquareGit: IconDefinition;
-export const faGitSquare: IconDefinition;
-export const faSquareTumblr: IconDefinition;
-export const faTumblrSquare: IconDefinition;
-export const faTrello: IconDefinition;
-export const faCreativeCommonsNcJp: IconDefinition;
-export const faGetPocket: IconDefinition;
-export const faPerbyte: IconDefinition;
-export const faGrunt: IconDefinition;
-export const faWeebly: IconDefinition;
-export const faConnectdevelop: IconDefinition;
-export const faLeanpub: IconDefinition;
-export const faBlackTie: IconDefinition;
-export const faThemeco: IconDefinition;
-export const faPython: IconDefinition;
-export const faAndroid: IconDefinition;
-export const faBots: IconDefinition;
-export const faFreeCodeCamp: IconDefinition;
-export const faHornbill: IconDefinition;
-export const faJs: IconDefinition;
-export const faIdeal: IconDefinition;
-export const faGit: IconDefinition;
-export const faDev: IconDefinition;
-export const faSketch: IconDefinition;
-export const faYandexInternational: IconDefinition;
-export const faCcAmex: IconDefinition;
-export const faUber: IconDefinition;
-export const faGithub: IconDefinition;
-export const faPhp: IconDefinition;
-export const faAlipay: IconDefinition;
-export const faYoutube: IconDefinition;
-export const faSkyatlas: IconDefinition;
-export const faFirefoxBrowser: IconDefinition;
-export const faReplyd: IconDefinition;
-export const faSuse: IconDefinition;
-export const faJenkins: IconDefinition;
-export const faTwitter: IconDefinition;
-export const faRockrms: IconDefinition;
-export const faPinterest: IconDefinition;
-export const faBuffer: IconDefinition;
-export const faNpm: IconDefinition;
-export const faYammer: IconDefinition;
-export const faBtc: IconDefinition;
-export const faDribbble: IconDefinition;
-export const faStumbleuponCircle: IconDefinition;
-export const faInternetExplorer: IconDefinition;
-export const faStubber: IconDefinition;
-export const faTelegram: IconDefinition;
-export const faTelegramPlane: IconDefinition;
-export const faOldRepublic: IconDefinition;
-export const faOdysee: IconDefinition;
-export const faSquareWhatsapp: IconDefinition;
-export const faWhatsappSquare: IconDefinition;
-export const faNodeJs: IconDefinition;
-export const faEdgeLegacy: IconDefinition;
-export const faSlack: IconDefinition;
-export const faSlackHash: IconDefinition;
-export const faMedrt: IconDefinition;
-export const faUsb: IconDefinition;
-export const faTumblr: IconDefinition;
-export const faVaadin: IconDefinition;
-export const faQuora: IconDefinition;
-export const faSquareXTwitter: IconDefinition;
-export const faReacteurope: IconDefinition;
-export const faMedium: IconDefinition;
-export const faMediumM: IconDefinition;
-export const faAmilia: IconDefinition;
-export const faMixcloud: IconDefinition;
-export const faFlipboard: IconDefinition;
-export const faViacoin: IconDefinition;
-export const faCriticalRole: IconDefinition;
-export const faSitrox: IconDefinition;
-export const faDiscourse: IconDefinition;
-export const faJoomla: IconDefinition;
-export const faMastodon: IconDefinition;
-export const faAirbnb: IconDefinition;
-export const faWolfPackBattalion: IconDefinition;
-export const faBuyNLarge: IconDefinition;
-export const faGulp: IconDefinition;
-export const faCreativeCommonsSamplingPlus: IconDefinition;
-export const faStrava: IconDefinition;
-export const faEmber: IconDefinition;
-export const faCanadianMapleLeaf: IconDefinition;
-export const faTeamspeak: IconDefinition;
-export const faPushed: IconDefinition;
-export const faWordpressSimple: IconDefinition;
-export const faNutritionix: IconDefinition;
-export const faWodu: IconDefinition;
-export const faGooglePay: IconDefinition;
-export const faIntercom: IconDefinition;
-export const faZhihu: IconDefinition;
-export const faKorvue: IconDefinition;
-export const faPix: IconDefinition;
-export const faSteamSymbol: IconDefinition;
-import { IconDefinition, IconLookup, IconName, IconPrefix, IconPack } from '@fortawesome/fontawesome-common-types';
-export { IconDefinition, IconLookup, IconName, IconPrefix, IconPack } from '@fortawesome/fontawesome-common-types';
-export const prefix: IconPrefix;
-export const fab: IconPack;
\ No newline at end of file
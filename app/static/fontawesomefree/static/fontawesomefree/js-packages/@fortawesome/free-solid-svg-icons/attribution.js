@@ -1,4 +0,0 @@
-console.log(`Font Awesome Free 6.5.1 by @fontawesome - https://fontawesome.com
-License - https://fontawesome.com/license/free (Icons: CC BY 4.0, Fonts: SIL OFL 1.1, Code: MIT License)
-Copyright 2023 Fonticons, Inc.
-`)
\ No newline at end of file
@@ -0,0 +1,248 @@
+# static_assets.py
+"""Static files: a Font Awesome subset, hashed names and precompressed copies.
+
+The templates use a handful of Font Awesome icons, so rather than the whole
+fontawesomefree package (69 MB of fonts, SVGs and JS), app/static/fontawesome
+holds a stylesheet and fonts cut down to the icons the templates reference.
+build_static_assets regenerates them when a template starts using a new icon.
+
+collectstatic stores every file under a content-hashed name as well and adds
+gzip and brotli copies of the text files next to it. serve_static sends the
+hashed files with far-future cache headers, picking the precompressed copy the
+client accepts.
+"""
+import gzip
+import mimetypes
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional; gzip copies only
+    brotli = None
+
+try:
+    import tinycss2
+    from fontTools import subset as font_subset
+except ImportError:  # only needed to rebuild the Font Awesome subset
+    tinycss2 = font_subset = None
+
+FONT_AWESOME_DIR = Path(__file__).resolve().parent / 'static' / 'fontawesome'
+# Classes that pick a font rather than an icon
+FONT_AWESOME_STYLES = {
+    'fa': 'solid', 'fas': 'solid', 'fa-solid': 'solid',
+    'far': 'regular', 'fa-regular': 'regular',
+    'fab': 'brands', 'fa-brands': 'brands',
+}
+FONT_AWESOME_FONTS = {'solid': 'fa-solid-900', 'regular': 'fa-regular-400', 'brands': 'fa-brands-400'}
+FONT_AWESOME_LICENSE = (
+    '/*!\n'
+    ' * Font Awesome Free by @fontawesome - https://fontawesome.com\n'
+    ' * License - https://fontawesome.com/license/free (Icons: CC BY 4.0, Fonts: SIL OFL 1.1, Code: MIT License)\n'
+    ' * Subset to the icons used by the MySurvey templates; rebuild with build_static_assets.\n'
+    ' */\n'
+)
+
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.mjs', '.svg', '.json', '.map', '.txt', '.html', '.xml', '.ico', '.ttf', '.otf', '.eot'}
+# Files smaller than this fit in a packet or two anyway
+MIN_COMPRESS_SIZE = 256
+# A name like base.5af66c1b1797.css, written by ManifestStaticFilesStorage
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+HASHED_MAX_AGE = 60 * 60 * 24 * 365
+UNHASHED_MAX_AGE = 60 * 60
+
+_CLASS_ATTRIBUTE_RE = re.compile(r'class\s*=\s*"([^"]*)"|class\s*=\s*\'([^\']*)\'')
+_SELECTOR_CLASS_RE = re.compile(r'\.(fa[\w-]*)')
+_CONTENT_RE = re.compile(r'content:\s*"\\([0-9a-fA-F]+)"')
+
+
+def template_icon_classes(directories):
+    """Return the Font Awesome classes used in the class attributes of the templates under `directories`."""
+    classes = set()
+    for directory in directories:
+        for path in Path(directory).rglob('*.html'):
+            for match in _CLASS_ATTRIBUTE_RE.finditer(path.read_text(encoding='utf-8')):
+                classes.update(token for token in (match[1] or match[2]).split() if re.fullmatch(r'fa[\w-]*', token))
+    return classes
+
+
+def _kept_selectors(prelude, classes):
+    # The selectors of a rule whose Font Awesome classes are all in use;
+    # selectors without any class (:root, :host) are always kept
+    selectors = [selector.strip() for selector in tinycss2.serialize(prelude).split(',')]
+    return [
+        selector for selector in selectors
+        if set(_SELECTOR_CLASS_RE.findall(selector)) <= classes and ('.' not in selector or _SELECTOR_CLASS_RE.search(selector))
+    ]
+
+
+def _serialize(tokens):
+    # tinycss2 unescapes "\f058"; keep the icon codepoints escaped and the file ASCII
+    return re.sub(r'[^\x00-\x7f]', lambda match: f'\\{ord(match[0]):x}', tinycss2.serialize(tokens))
+
+
+def _subset_rules(rules, classes, font_url=None):
+    kept = []
+    for rule in rules:
+        if rule.type == 'qualified-rule':
+            selectors = _kept_selectors(rule.prelude, classes)
+            if selectors:
+                kept.append(f'{", ".join(selectors)} {{{_serialize(rule.content)}}}')
+        elif rule.type == 'at-rule' and rule.lower_at_keyword == 'media':
+            nested = _subset_rules(tinycss2.parse_rule_list(rule.content, skip_comments=True, skip_whitespace=True), classes)
+            if nested:
+                kept.append(f'@media{tinycss2.serialize(rule.prelude)}{{\n{chr(10).join(nested)}}}')
+        elif rule.type == 'at-rule' and rule.lower_at_keyword == 'font-face' and font_url is not None:
+            # Only the woff2 file; every browser that runs the survey pages reads it
+            content = re.sub(r'src:[^;]*;', f'src: url("{font_url}") format("woff2");', _serialize(rule.content))
+            kept.append(f'@font-face {{{content}}}')
+        elif rule.type == 'at-rule' and rule.lower_at_keyword.endswith('keyframes'):
+            kept.append(rule)
+    return kept
+
+
+def _drop_unused_keyframes(rules):
+    text = '\n'.join(rule for rule in rules if isinstance(rule, str))
+    return [
+        rule if isinstance(rule, str) else rule.serialize()
+        for rule in rules
+        if isinstance(rule, str) or re.search(rf'\b{re.escape(tinycss2.serialize(rule.prelude).strip())}\b', text)
+    ]
+
+
+def _parse_css(path):
+    return tinycss2.parse_stylesheet(path.read_text(encoding='utf-8'), skip_comments=True, skip_whitespace=True)
+
+
+def subset_font_awesome(source, classes, output=FONT_AWESOME_DIR):
+    """Write fontawesome.css and woff2 fonts holding only `classes` into `output`.
+
+    `source` is the static directory of the fontawesomefree package (with css/
+    and webfonts/ in it). Returns {'icons': [...], 'files': {name: size}}.
+    """
+    if tinycss2 is None or font_subset is None:
+        raise ImportError('Subsetting Font Awesome needs tinycss2 and fonttools.')
+    source = Path(source)
+    output = Path(output)
+    classes = set(classes)
+    styles = {FONT_AWESOME_STYLES[name] for name in classes if name in FONT_AWESOME_STYLES}
+
+    rules = _subset_rules(_parse_css(source / 'css' / 'fontawesome.css'), classes)
+    codepoints = set()
+    for rule in rules:
+        if isinstance(rule, str) and '::before' in rule:
+            codepoints.update(int(code, 16) for code in _CONTENT_RE.findall(rule))
+    icons = sorted(name for name in classes if any(f'.{name}::before' in rule for rule in rules if isinstance(rule, str)))
+    for style in sorted(styles):
+        rules += _subset_rules(
+            _parse_css(source / 'css' / f'{style}.css'), classes,
+            font_url=f'webfonts/{FONT_AWESOME_FONTS[style]}.woff2',
+        )
+
+    (output / 'webfonts').mkdir(parents=True, exist_ok=True)
+    files = {}
+    for style in sorted(styles):
+        options = font_subset.Options()
+        options.flavor = 'woff2'
+        options.layout_features = []
+        options.name_IDs = []
+        font = font_subset.load_font(source / 'webfonts' / f'{FONT_AWESOME_FONTS[style]}.ttf', options)
+        subsetter = font_subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        path = output / 'webfonts' / f'{FONT_AWESOME_FONTS[style]}.woff2'
+        font_subset.save_font(font, path, options)
+        files[f'webfonts/{path.name}'] = path.stat().st_size
+    for stale in (output / 'webfonts').iterdir():
+        if f'webfonts/{stale.name}' not in files:
+            stale.unlink()
+
+    css = FONT_AWESOME_LICENSE + '\n'.join(_drop_unused_keyframes(rules)) + '\n'
+    (output / 'fontawesome.css').write_text(css, encoding='utf-8')
+    files['fontawesome.css'] = len(css.encode('utf-8'))
+    return {'icons': icons, 'files': files}
+
+
+def precompress(path):
+    """Write path.gz and, with brotli installed, path.br next to a file if that makes it smaller.
+
+    Copies that already exist are kept: the names are content-hashed, so a
+    repeated collectstatic only compresses files that changed.
+    """
+    path = Path(path)
+    compressors = {'.gz': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors['.br'] = lambda data: brotli.compress(data, quality=11)
+    targets = {suffix: path.with_name(path.name + suffix) for suffix in compressors}
+    if all(target.exists() for target in targets.values()):
+        return
+    data = path.read_bytes()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return
+    for suffix, compress in compressors.items():
+        compressed = compress(data)
+        if len(compressed) < len(data):
+            targets[suffix].write_bytes(compressed)
+
+
+class PrecompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """ManifestStaticFilesStorage that also writes gzip and brotli copies of the hashed text files."""
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # Not collected yet (development, tests): link the plain name
+            return name
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        for name in set(self.hashed_files.values()):
+            if Path(name).suffix.lower() in COMPRESSIBLE_EXTENSIONS and self.exists(name):
+                precompress(self.path(name))
+
+
+def _accepted_encodings(request):
+    return {part.split(';')[0].strip() for part in request.headers.get('Accept-Encoding', '').split(',')}
+
+
+def serve_static(request, path):
+    """Serve a collected static file, precompressed if the client accepts it.
+
+    A hashed name never changes content, so it is cached for a year; other
+    names for an hour.
+    """
+    try:
+        full_path = Path(safe_join(settings.STATIC_ROOT, path))
+    except SuspiciousFileOperation:
+        raise Http404('No such file.')
+    if not full_path.is_file() or full_path.suffix in ('.gz', '.br'):
+        raise Http404('No such file.')
+
+    accepted = _accepted_encodings(request)
+    encoding, served = None, full_path
+    for name, suffix in (('br', '.br'), ('gzip', '.gz')):
+        variant = full_path.with_name(full_path.name + suffix)
+        if name in accepted and variant.is_file():
+            encoding, served = name, variant
+            break
+
+    content_type = mimetypes.guess_type(full_path.name)[0] or 'application/octet-stream'
+    response = FileResponse(served.open('rb'), content_type=content_type, filename=full_path.name)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    if HASHED_NAME_RE.search(full_path.name):
+        response['Cache-Control'] = f'public, max-age={HASHED_MAX_AGE}, immutable'
+    else:
+        response['Cache-Control'] = f'public, max-age={UNHASHED_MAX_AGE}'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
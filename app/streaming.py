@@ -0,0 +1,36 @@
+# streaming.py
+"""Bodies for StreamingHttpResponse that stream under both WSGI and ASGI.
+
+Django's ASGI handler reads a synchronous iterator into a list before it
+sends anything, so under ASGI (settings.ASYNC_VIEWS) the generators that
+read the database or build ZIPs are wrapped in an async iterator. It pulls
+a batch of items per sync_to_async call. The calls are thread sensitive, so
+every batch runs in the request's sync thread and a server-side cursor
+opened by one batch is still there for the next.
+"""
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+
+async def aiterate(iterable, batch_size=1):
+    """Yield the items of a sync iterable, reading batch_size of them per thread hop."""
+    iterator = iter(iterable)
+    take = sync_to_async(lambda: list(islice(iterator, batch_size)))
+    try:
+        while batch := await take():
+            for item in batch:
+                yield item
+    finally:
+        # Closing the generator releases its cursor or temporary files
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            await sync_to_async(close)()
+
+
+def streaming_content(iterable, batch_size=1):
+    """`iterable` under WSGI; under ASGI an async iterator over it (see aiterate)."""
+    if settings.ASYNC_VIEWS:
+        return aiterate(iterable, batch_size)
+    return iterable
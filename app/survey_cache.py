@@ -0,0 +1,97 @@
+# survey_cache.py
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import AnswerChoice, Survey
+
+
+class SurveyDefinition:
+    """Everything the respondent path needs to show and store a survey."""
+
+    def __init__(self, survey, questions, choice_ids, version):
+        self.survey = survey
+        self.questions = questions
+        # {(question_id, choice_value): AnswerChoice id}
+        self.choice_ids = choice_ids
+        self.version = version
+
+
+def _version_key(survey_id):
+    return f'survey_definition_version:{survey_id}'
+
+
+def get_definition_version(survey_id):
+    version = cache.get(_version_key(survey_id))
+    if version is None:
+        # A fresh, never reused version, so an evicted version key can't
+        # bring an outdated definition back
+        cache.add(_version_key(survey_id), time.time_ns(), timeout=None)
+        version = cache.get(_version_key(survey_id))
+    return version
+
+
+async def aget_definition_version(survey_id):
+    version = await cache.aget(_version_key(survey_id))
+    if version is None:
+        await cache.aadd(_version_key(survey_id), time.time_ns(), timeout=None)
+        version = await cache.aget(_version_key(survey_id))
+    return version
+
+
+def invalidate_survey_definition(survey_id):
+    cache.set(_version_key(survey_id), time.time_ns(), timeout=None)
+
+
+def load_survey_definition(survey_id, version=None):
+    survey = Survey.objects.get(pk=survey_id)
+    questions = list(survey.surveyquestion_set.order_by('id'))
+    choice_ids = {
+        (question_id, choice_value): choice_id
+        for choice_id, question_id, choice_value in AnswerChoice.objects.filter(
+            question__survey_id=survey_id,
+        ).values_list('id', 'question_id', 'choice_value')
+    }
+    return SurveyDefinition(survey, questions, choice_ids, version)
+
+
+async def aload_survey_definition(survey_id, version=None):
+    survey = await Survey.objects.aget(pk=survey_id)
+    questions = [question async for question in survey.surveyquestion_set.order_by('id')]
+    choice_ids = {
+        (question_id, choice_value): choice_id
+        async for choice_id, question_id, choice_value in AnswerChoice.objects.filter(
+            question__survey_id=survey_id,
+        ).values_list('id', 'question_id', 'choice_value')
+    }
+    return SurveyDefinition(survey, questions, choice_ids, version)
+
+
+def get_survey_definition(survey_id):
+    """Return the cached SurveyDefinition, loading it on a miss.
+
+    Raises Survey.DoesNotExist like Survey.objects.get.
+    """
+    survey_id = int(survey_id)
+    version = get_definition_version(survey_id)
+    key = f'survey_definition:{survey_id}:{version}'
+
+    definition = cache.get(key)
+    if definition is None:
+        definition = load_survey_definition(survey_id, version)
+        cache.set(key, definition, timeout=settings.SURVEY_DEFINITION_CACHE_TIMEOUT)
+    return definition
+
+
+async def aget_survey_definition(survey_id):
+    """Async version of get_survey_definition()."""
+    survey_id = int(survey_id)
+    version = await aget_definition_version(survey_id)
+    key = f'survey_definition:{survey_id}:{version}'
+
+    definition = await cache.aget(key)
+    if definition is None:
+        definition = await aload_survey_definition(survey_id, version)
+        await cache.aset(key, definition, timeout=settings.SURVEY_DEFINITION_CACHE_TIMEOUT)
+    return definition
@@ -0,0 +1,92 @@
+# synthetic.py
+"""Realistic synthetic survey data for load tests and benchmarks.
+
+Star ratings are skewed per question: most questions lean positive, some
+are polarising and a few are clearly bad. Roughly a third of the responses
+carry a remark, and timestamps are spread over the last `days` days. The
+same seed always produces the same data.
+"""
+import random
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .ingest import save_survey_responses
+from .models import Department, Survey, SurveyQuestion
+from .rollup import STAR_VALUES
+
+# Star weights (1..5) a question's answers are drawn from
+RATING_PROFILES = (
+    (0.03, 0.05, 0.12, 0.40, 0.40),  # well liked
+    (0.05, 0.10, 0.25, 0.35, 0.25),  # fine
+    (0.30, 0.10, 0.10, 0.15, 0.35),  # polarising
+    (0.35, 0.30, 0.20, 0.10, 0.05),  # a problem
+)
+PROFILE_WEIGHTS = (0.45, 0.3, 0.15, 0.1)
+
+REMARK_OPENINGS = ('The staff', 'Waiting time', 'The counter', 'Parking', 'The new system', 'Service today')
+REMARK_VERDICTS = (
+    'was excellent', 'was friendly and quick', 'could be better', 'was far too slow',
+    'needs more signage', 'was confusing', 'was great as usual', 'made my day',
+)
+
+QUESTION_TOPICS = (
+    'How satisfied are you with the service', 'How friendly was the staff', 'How clean was the facility',
+    'How short was the waiting time', 'How easy was it to find us', 'How likely are you to come back',
+)
+
+
+def random_remark(rnd):
+    return f'{rnd.choice(REMARK_OPENINGS)} {rnd.choice(REMARK_VERDICTS)}.'
+
+
+def generate_survey_data(departments=2, surveys=3, questions=10, responses=1000, days=90,
+                         remark_rate=0.3, seed=0, batch_size=1000, log=None):
+    """Create departments x surveys surveys with `questions` questions and `responses` responses each.
+
+    Responses go through save_survey_responses in batches, so the rollup and
+    answer choices are maintained as in production. Returns the new surveys.
+    """
+    rnd = random.Random(seed)
+    now = timezone.now()
+
+    created = []
+    for d in range(departments):
+        department = Department.objects.create(name=f'Department {d + 1}')
+        new_surveys = Survey.objects.bulk_create([
+            Survey(name=f'{department.name} survey {s + 1}', description='Synthetic survey', department=department)
+            for s in range(surveys)
+        ])
+        if not new_surveys[0].pk:
+            new_surveys = list(Survey.objects.filter(department=department).order_by('id'))
+        created.extend(new_surveys)
+
+    for survey in created:
+        SurveyQuestion.objects.bulk_create([
+            SurveyQuestion(survey=survey, question_text=f'{QUESTION_TOPICS[q % len(QUESTION_TOPICS)]}? ({q + 1})')
+            for q in range(questions)
+        ])
+        question_ids = list(survey.surveyquestion_set.order_by('id').values_list('id', flat=True))
+        profiles = {question_id: rnd.choices(RATING_PROFILES, PROFILE_WEIGHTS)[0] for question_id in question_ids}
+
+        # Ascending timestamps, so response ids follow time as they do live
+        offsets = sorted(rnd.random() * days for _ in range(responses))
+        submissions = [
+            {
+                'survey_id': survey.id,
+                'answers': {
+                    question_id: rnd.choices(STAR_VALUES, profiles[question_id])[0]
+                    for question_id in question_ids
+                },
+                'remarks': random_remark(rnd) if rnd.random() < remark_rate else '',
+                'ip_address': f'10.{rnd.randrange(256)}.{rnd.randrange(256)}.{rnd.randrange(1, 255)}',
+                'timestamp': now - timedelta(days=days) + timedelta(days=offset),
+            }
+            for offset in offsets
+        ]
+        for start in range(0, len(submissions), batch_size):
+            save_survey_responses(submissions[start:start + batch_size])
+        if log:
+            log(f'{survey.name}: {questions} questions, {responses} responses')
+
+    return created
@@ -1,3 +1,1579 @@
-from django.test import TestCase
+import gzip
+import re
+import tempfile
+import threading
+import time
+import zipfile
+from collections import defaultdict
+from datetime import datetime, timedelta
+from importlib import import_module
+from inspect import iscoroutinefunction
+from io import BytesIO, StringIO
+from pathlib import Path
+from statistics import fmean, pstdev
+from types import ModuleType
+from unittest import skipUnless
+from unittest.mock import patch
 
-# Create your tests here.
+import orjson
+from asgiref.sync import async_to_sync, sync_to_async
+from pypdf import PdfReader
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.widgets import ForeignKeyRawIdWidget
+from django.contrib.auth.models import User
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections
+from django.db.models import Sum
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path, resolve, reverse
+from django.utils import timezone
+
+from . import analytics, async_views, urls, views
+from .ingest import save_survey_response, save_survey_responses
+from .aggregates import get_question_aggregates
+from .analytics import get_generation, get_survey_columns, numpy_star_counts, question_star_counts, star_statistics, surveys_question_star_counts
+from .admin import estimated_row_count
+from .benchmark import remarks_page_params, scratch_database, summarize
+from .models import (
+    AnswerChoice, Department, QuestionAggregate, QuestionStarRollup, QuestionTrendBucket, Survey, SurveyAggregateMark,
+    SurveyQuestion, SurveyResponse, SurveyResponseAnswer,
+)
+from .journal import append_submission, drain_journal, journal_path, pending_entries, recover_journal
+from .metrics import DB_QUERIES_PER_REQUEST, QueryRecorder, observe_queries
+from .page_cache import CSRF_TOKEN_PLACEHOLDER
+from .qr_assets import get_survey_qr_codes
+from .query_detector import QueryGrowthMiddleware
+from .report_batch import render_survey_reports, report_period
+from .reports import PdfReport, build_report_context, iter_report_response_chunks
+from .rollup import STAR_VALUES, get_question_star_counts, rebuild_star_rollup, rebuild_trend_buckets
+from .survey_cache import aget_survey_definition, get_survey_definition
+from .static_assets import FONT_AWESOME_DIR, brotli, template_icon_classes
+from .trends import bucket_count, get_survey_trend, trend_buckets
+
+# Tables that grow with the number of responses and must never be scanned
+LARGE_TABLES = ('survey_response', 'survey_response_answer', 'answer_choice', 'question_star_rollup', 'question_trend_bucket')
+
+
+def streamed(response):
+    """The body of a streaming response, whether its content is sync or async (under ASGI)."""
+    if response.is_async:
+        async def read():
+            return b''.join([chunk async for chunk in response.streaming_content])
+        return async_to_sync(read)()
+    return b''.join(response.streaming_content)
+
+
+def seed_survey(question_count=5, response_count=30):
+    department = Department.objects.create(name='Quality')
+    survey = Survey.objects.create(name='Kiosk', description='Kiosk survey', department=department)
+    questions = SurveyQuestion.objects.bulk_create([
+        SurveyQuestion(survey=survey, question_text=f'Question {i + 1}') for i in range(question_count)
+    ])
+    for i in range(response_count):
+        cleaned_data = {f'question_{q.id}': str((i + q.id) % 5 + 1) for q in questions}
+        cleaned_data['remarks'] = f'Remark {i}' if i % 2 else ''
+        save_survey_response(survey, questions, cleaned_data, '127.0.0.1')
+    return survey, questions
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Query plans are checked with SQLite EXPLAIN QUERY PLAN')
+class QueryPlanTests(TestCase):
+    """The hot analytics and submission queries must be answered from an index."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey()
+
+    def explain(self, sql, params=()):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertQueriesUseIndexes(self, captured):
+        explained = 0
+        for query in captured:
+            sql = query['sql']
+            if not re.match(r'\s*(SELECT|UPDATE|DELETE)\b', sql, re.IGNORECASE):
+                continue
+            explained += 1
+            for step in self.explain(sql):
+                match = re.match(r'SCAN (\w+)(.*)', step)
+                if match and match.group(1) in LARGE_TABLES:
+                    self.assertIn('USING', match.group(2), f'Full scan of {match.group(1)} in:\n{sql}\n{step}')
+        self.assertGreater(explained, 0)
+
+    def test_survey_statistics(self):
+        url = reverse('survey_statistics_with_id', args=[self.survey.id])
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url, {'start_date': '2020-01-01', 'end_date': '2100-01-01', 'last': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertQueriesUseIndexes(captured)
+
+    def test_remarks_are_read_in_index_order(self):
+        url = reverse('survey_remarks', args=[self.survey.id])
+        after = self.client.get(url).json()['next']
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(after)
+        self.assertEqual(response.status_code, 200)
+        self.assertQueriesUseIndexes(captured)
+        remarks_sql = [query['sql'] for query in captured if 'remarks' in query['sql']]
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', '\n'.join(self.explain(remarks_sql[0])))
+
+    def test_survey_pdf_report(self):
+        start_date = datetime(2020, 1, 1)
+        end_date = datetime(2100, 1, 1) + timedelta(days=1) - timedelta(microseconds=1)
+        with override_settings(PDF_REPORT_CACHE_DIR=tempfile.mkdtemp()):
+            with CaptureQueriesContext(connection) as captured:
+                PdfReport(self.survey, start_date, end_date)
+                context = build_report_context(self.survey, start_date, end_date)
+                chunks = list(iter_report_response_chunks(context['responses'], 7))
+        self.assertEqual(context['total_responses'], 30)
+        self.assertEqual(sum(map(len, chunks)), 30)
+        self.assertQueriesUseIndexes(captured)
+        chunk_sql = [query['sql'] for query in captured if 'remarks' in query['sql']]
+        self.assertEqual(len(chunk_sql), 5)
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', '\n'.join(self.explain(chunk_sql[-1])))
+
+    def test_survey_list_submission(self):
+        data = {'survey': self.survey.id, 'remarks': 'Great'}
+        data.update({f'question_{q.id}': '4' for q in self.questions})
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(reverse('survey_list', args=[self.survey.id]), data)
+        self.assertRedirects(response, reverse('thank_you_page'), fetch_redirect_response=False)
+        self.assertQueriesUseIndexes(captured)
+
+    def test_admin_answers_of_one_survey(self):
+        # The survey filter is only offered with a second survey
+        Survey.objects.create(name='Lobby', description='', department=self.survey.department)
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(
+                reverse('admin:app_surveyresponseanswer_changelist'), {'response__survey__id__exact': self.survey.id},
+            )
+        self.assertEqual(len(response.context['cl'].result_list), 100)
+        self.assertQueriesUseIndexes(captured)
+        page_sql = [query['sql'] for query in captured if query['sql'].startswith('SELECT "survey_response_answer"."id"')]
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', '\n'.join(self.explain(page_sql[0])))
+
+    def test_response_timestamp_range(self):
+        responses = self.survey.get_responses().filter(
+            timestamp__gte=timezone.now() - timedelta(days=7), timestamp__lte=timezone.now(),
+        )
+        plan = ' '.join(self.explain(*responses.query.sql_with_params()))
+        self.assertIn('response_survey_ts_idx', plan)
+
+
+def add_responses(survey, count):
+    question_ids = list(survey.surveyquestion_set.values_list('id', flat=True))
+    save_survey_responses([
+        {
+            'survey_id': survey.id,
+            'answers': {question_id: (i + question_id) % 5 + 1 for question_id in question_ids},
+            'remarks': f'Remark {i}' if i % 2 else '',
+            'ip_address': '127.0.0.1',
+        }
+        for i in range(count)
+    ])
+
+
+def respond_with_id(survey, questions, pk, star_value=5):
+    """Save a response with a chosen id, e.g. one that commits after a higher id."""
+    response = SurveyResponse.objects.create(pk=pk, survey=survey, ip_address='127.0.0.1')
+    SurveyResponseAnswer.objects.bulk_create([
+        SurveyResponseAnswer(
+            response=response, question=question,
+            answer=AnswerChoice.objects.get_or_create(question=question, choice_value=star_value)[0],
+        )
+        for question in questions
+    ])
+
+
+def batch_upload(survey, count, **extra):
+    question_ids = survey.surveyquestion_set.values_list('id', flat=True)
+    return orjson.dumps({'responses': [
+        {'answers': {str(question_id): (i + question_id) % 5 + 1 for question_id in question_ids}, **extra}
+        for i in range(count)
+    ]})
+
+
+def grow_site(survey, scale):
+    """Add departments, surveys, questions and responses; everything scales with `scale`."""
+    for i in range(scale):
+        department = Department.objects.create(name=f'Department {i}')
+        other = Survey.objects.create(name=f'Survey {i}', description='Other survey', department=department)
+        SurveyQuestion.objects.create(survey=other, question_text='Other question')
+    SurveyQuestion.objects.bulk_create([
+        SurveyQuestion(survey=survey, question_text=f'Extra question {i + 1}') for i in range(scale)
+    ])
+    add_responses(survey, 10 * scale)
+
+
+def disposable_survey(scale=1):
+    department = Department.objects.create(name='Disposable')
+    survey = Survey.objects.create(name='Disposable', description='Deleted by the test', department=department)
+    SurveyQuestion.objects.bulk_create([
+        SurveyQuestion(survey=survey, question_text=f'Question {i + 1}') for i in range(3 * scale)
+    ])
+    add_responses(survey, 10 * scale)
+    return survey
+
+
+@override_settings(PDF_REPORT_CACHE_DIR=tempfile.mkdtemp(), SURVEY_QR_DIR=tempfile.mkdtemp())
+class QueryBudgetTests(TestCase):
+    """Every view runs a fixed number of queries, however much data there is."""
+
+    # (url name, method) -> the most queries one request may run
+    QUERY_BUDGETS = {
+        ('survey_list_view', 'get'): 3,
+        ('survey_detail', 'get'): 6,
+        ('survey_detail_with_pk', 'get'): 6,
+        ('survey_create', 'get'): 4,
+        ('survey_delete', 'post'): 19,
+        ('survey_question_create', 'get'): 2,
+        ('survey_question_edit', 'get'): 3,
+        ('survey_selection', 'get'): 3,
+        ('survey_list', 'get'): 4,
+        ('survey_list', 'post'): 11,
+        ('thank_you_page', 'get'): 1,
+        ('survey_journal_status', 'get'): 2,
+        ('survey_management', 'get'): 5,
+        ('survey_edit', 'get'): 5,
+        ('survey_statistics_with_id', 'get'): 10,
+        ('survey_remarks', 'get'): 2,
+        ('survey_statistics_api', 'get'): 10,
+        ('survey_trend_api', 'get'): 6,
+        ('survey_responses_api', 'post'): 15,
+        ('survey_pdf_report_with_id', 'get'): 5,
+        ('survey_pdf_report_status', 'get'): 3,
+        ('survey_export_with_id', 'get'): 4,
+        ('survey_qr_code', 'get'): 0,
+        ('survey_qr_codes_zip', 'get'): 1,
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey()
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def requests(self, scale):
+        survey = self.survey
+        question = self.questions[0]
+        submission = {'survey': survey.id, 'remarks': 'Great'}
+        submission.update({f'question_{q.id}': '4' for q in survey.surveyquestion_set.all()})
+        return [
+            ('survey_list_view', 'get', {}, None),
+            ('survey_detail', 'get', {}, {'survey_id': survey.id}),
+            ('survey_detail_with_pk', 'get', {'pk': survey.id}, {'survey_id': survey.id}),
+            ('survey_create', 'get', {}, None),
+            ('survey_question_create', 'get', {}, None),
+            ('survey_question_edit', 'get', {'pk': question.id}, None),
+            ('survey_selection', 'get', {}, None),
+            ('survey_list', 'get', {'survey_id': survey.id}, None),
+            ('survey_list', 'post', {'survey_id': survey.id}, submission),
+            ('thank_you_page', 'get', {}, None),
+            ('survey_journal_status', 'get', {}, None),
+            ('survey_management', 'get', {}, None),
+            ('survey_edit', 'get', {'pk': survey.id}, None),
+            ('survey_statistics_with_id', 'get', {'survey_id': survey.id}, {'last': 1}),
+            ('survey_remarks', 'get', {'survey_id': survey.id}, {'last': 1}),
+            ('survey_statistics_api', 'get', {'survey_id': survey.id}, {'last': 1}),
+            ('survey_trend_api', 'get', {'survey_id': survey.id}, {'granularity': 'day'}),
+            ('survey_responses_api', 'post', {'survey_id': survey.id}, batch_upload(survey, 20)),
+            ('survey_pdf_report_with_id', 'get', {'selected_survey_id': survey.id}, None),
+            ('survey_pdf_report_status', 'get', {'selected_survey_id': survey.id}, None),
+            ('survey_export_with_id', 'get', {'selected_survey_id': survey.id}, {'format': 'csv'}),
+            ('survey_qr_code', 'get', {'filename': get_survey_qr_codes(survey.id)['screen_png']}, None),
+            ('survey_qr_codes_zip', 'get', {}, None),
+            # Django deletes cascaded rows in batches of 100, so the deleted
+            # survey keeps its size while the rest of the site grows
+            ('survey_delete', 'post', {'pk': disposable_survey(scale).id}, {}),
+        ]
+
+    def count_queries(self, scale):
+        # The PDF is rendered up front so the request serves the cached file
+        # instead of starting a background render
+        PdfReport(self.survey).render()
+        counts = {}
+        for url_name, method, kwargs, data in self.requests(scale):
+            cache.clear()
+            with CaptureQueriesContext(connection) as captured:
+                extra = {'content_type': 'application/json'} if isinstance(data, bytes) else {}
+                response = getattr(self.client, method)(reverse(url_name, kwargs=kwargs), data, **extra)
+                if response.streaming:
+                    streamed(response)
+            self.assertLess(response.status_code, 400, url_name)
+            counts[url_name, method] = len(captured)
+        return counts
+
+    def test_every_url_has_a_budget(self):
+        self.assertEqual(
+            {pattern.name for pattern in urls.urlpatterns},
+            {url_name for url_name, _ in self.QUERY_BUDGETS},
+        )
+
+    def test_query_counts_stay_within_budget_as_data_grows(self):
+        self.client.force_login(self.user)
+        small = self.count_queries(1)
+        grow_site(self.survey, 5)
+        large = self.count_queries(6)
+
+        self.assertEqual(set(small), set(self.QUERY_BUDGETS))
+        for key, count in small.items():
+            with self.subTest(url_name=key[0], method=key[1]):
+                self.assertLessEqual(large[key], self.QUERY_BUDGETS[key])
+                self.assertEqual(large[key], count, 'query count grows with the data')
+
+
+@override_settings(QUERY_DETECTOR_ENABLED=True, QUERY_DETECTOR_THRESHOLD=3)
+class QueryGrowthDetectorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_survey(question_count=5, response_count=0)
+
+    def question_list(self, queryset):
+        def view(request):
+            return HttpResponse(', '.join(f'{q.survey.name}: {q.question_text}' for q in queryset))
+        return QueryGrowthMiddleware(view)(RequestFactory().get('/questions/'))
+
+    def test_warns_about_a_query_per_row(self):
+        with self.assertLogs('app.query_detector', 'WARNING') as logs:
+            self.question_list(SurveyQuestion.objects.all())
+        self.assertEqual(logs.records[0].data['repeats'], 5)
+        self.assertIn('"survey"', logs.records[0].data['sql'])
+
+    def test_quiet_when_related_rows_are_joined(self):
+        with self.assertNoLogs('app.query_detector', 'WARNING'):
+            self.question_list(SurveyQuestion.objects.select_related('survey'))
+
+    async def test_sees_queries_of_sync_threads_under_asgi(self):
+        # Like a sync ORM call from an async view on an ASGI server: another
+        # thread, with a connection of its own
+        def query_per_row():
+            try:
+                with connection.cursor() as cursor:
+                    for i in range(4):
+                        cursor.execute('SELECT %s', [i])
+            finally:
+                connection.close()
+
+        async def view(request):
+            await sync_to_async(query_per_row, thread_sensitive=False)()
+            return HttpResponse()
+        with self.assertLogs('app.query_detector', 'WARNING') as logs:
+            await QueryGrowthMiddleware(view)(AsyncRequestFactory().get('/rows/'))
+        self.assertEqual(logs.records[0].data['repeats'], 4)
+
+
+@override_settings(SURVEY_QR_DIR=tempfile.mkdtemp(), SURVEY_QR_BASE_URL='https://survey.example.com')
+class SurveyQrCodeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, _ = seed_survey(question_count=1, response_count=0)
+
+    def test_rendered_once_and_served_with_far_future_caching(self):
+        files = get_survey_qr_codes(self.survey.id)
+        self.assertEqual(set(files), {'screen_png', 'screen_svg', 'print_png', 'print_svg'})
+        path = Path(settings.SURVEY_QR_DIR) / files['print_png']
+        mtime = path.stat().st_mtime_ns
+        self.assertEqual(get_survey_qr_codes(self.survey.id), files)
+        self.assertEqual(path.stat().st_mtime_ns, mtime)
+
+        response = self.client.get(reverse('survey_qr_code', args=[files['screen_svg']]))
+        self.assertEqual(response['Content-Type'], 'image/svg+xml')
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(self.client.get(reverse('survey_qr_code', args=['..secret.png'])).status_code, 404)
+
+    def test_new_base_url_gives_new_files(self):
+        old = get_survey_qr_codes(self.survey.id)
+        with override_settings(SURVEY_QR_BASE_URL='https://kiosk.example.com'):
+            new = get_survey_qr_codes(self.survey.id)
+        self.assertTrue(set(old.values()).isdisjoint(new.values()))
+        self.assertFalse((Path(settings.SURVEY_QR_DIR) / old['screen_png']).exists())
+
+    def test_zip_of_all_surveys(self):
+        other = Survey.objects.create(name='Lobby / East', description='', department=self.survey.department)
+        response = self.client.get(reverse('survey_qr_codes_zip'))
+        archive = zipfile.ZipFile(BytesIO(streamed(response)))
+        self.assertIsNone(archive.testzip())
+        self.assertIn(f'{other.id}-lobby-east/print.svg', archive.namelist())
+        self.assertEqual(len(archive.namelist()), 8)
+
+    def test_zip_of_one_department(self):
+        elsewhere = Department.objects.create(name='Lobby')
+        Survey.objects.create(name='Entrance', description='', department=elsewhere)
+        response = self.client.get(reverse('survey_qr_codes_zip'), {'department': elsewhere.id})
+        names = zipfile.ZipFile(BytesIO(streamed(response))).namelist()
+        self.assertEqual(len(names), 4)
+        self.assertTrue(all('-entrance/' in name for name in names))
+
+    def test_invalid_department_is_rejected(self):
+        for department in ('abc', '-1', '²'):
+            response = self.client.get(reverse('survey_qr_codes_zip'), {'department': department})
+            self.assertEqual(response.status_code, 400)
+
+    @override_settings(ASYNC_VIEWS=True)
+    def test_zip_streams_under_asgi(self):
+        response = self.client.get(reverse('survey_qr_codes_zip'))
+        self.assertTrue(response.is_async)
+        self.assertEqual(len(zipfile.ZipFile(BytesIO(streamed(response))).namelist()), 4)
+
+    def test_deleting_the_survey_removes_its_files(self):
+        files = get_survey_qr_codes(self.survey.id)
+        self.survey.delete()
+        self.assertFalse((Path(settings.SURVEY_QR_DIR) / files['print_png']).exists())
+
+
+@override_settings(PDF_REPORT_CACHE_DIR=tempfile.mkdtemp(), PDF_REPORT_CHUNK_SIZE=4)
+class PdfReportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, _ = seed_survey(question_count=2, response_count=10)
+
+    def test_rendered_in_chunks_and_merged(self):
+        report = PdfReport(self.survey)
+        self.assertTrue(report.render())
+        text = '\n'.join(page.extract_text() for page in PdfReader(report.path).pages)
+        self.assertEqual(text.count('Question Star Counts'), 1)
+        for response in self.survey.get_responses():
+            self.assertEqual(text.count(f'Response ID: {response.id}\n'), 1)
+        # The chunk files and the temporary output are gone
+        self.assertFalse([path for path in report.directory.iterdir() if path.suffix != '.pdf'])
+
+    def test_edited_remark_gives_a_new_report(self):
+        report = PdfReport(self.survey)
+        response = self.survey.surveyresponse_set.first()
+        response.remarks = 'Edited in the admin'
+        response.save()
+        self.assertNotEqual(PdfReport(self.survey).path, report.path)
+
+    def test_empty_range_still_has_the_summary(self):
+        report = PdfReport(self.survey, datetime(2000, 1, 1), datetime(2000, 1, 2))
+        self.assertTrue(report.render())
+        self.assertIn('Total Responses: 0', PdfReader(report.path).pages[0].extract_text())
+
+
+@override_settings(PDF_REPORT_BATCH_WORKERS=1)
+class ReportBatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, _ = seed_survey(question_count=3, response_count=6)
+        cls.other = Survey.objects.create(name='Lobby', description='', department=cls.survey.department)
+        SurveyQuestion.objects.create(survey=cls.other, question_text='Clean?')
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+
+    def test_star_counts_of_all_surveys_in_one_pass(self):
+        with CaptureQueriesContext(connection) as captured:
+            counts = surveys_question_star_counts([self.survey.id, self.other.id])
+        self.assertEqual(len(captured), 2)
+        for survey in (self.survey, self.other):
+            expected = question_star_counts(survey)
+            self.assertEqual(
+                [(q.id, [getattr(q, f'star_counts_{star}') for star in range(1, 6)]) for q in counts[survey.id]],
+                [(q.id, [getattr(q, f'star_counts_{star}') for star in range(1, 6)]) for q in expected],
+            )
+
+    def test_department_action_streams_a_zip(self):
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('admin:app_department_changelist'), {
+            'action': 'download_last_month_reports', '_selected_action': [self.survey.department_id],
+        })
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        archive = zipfile.ZipFile(BytesIO(streamed(response)))
+        kiosk, lobby = f'quality/{self.survey.id}-kiosk.pdf', f'quality/{self.other.id}-lobby.pdf'
+        self.assertEqual(sorted(archive.namelist()), [kiosk, lobby, 'timings.csv'])
+        self.assertTrue(archive.read(lobby).startswith(b'%PDF'))
+        self.assertEqual(archive.read('timings.csv').decode().count(',ok,'), 2)
+
+    @override_settings(ASYNC_VIEWS=True)
+    def test_department_action_streams_under_asgi(self):
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('admin:app_department_changelist'), {
+            'action': 'download_last_month_reports', '_selected_action': [self.survey.department_id],
+        })
+        self.assertTrue(response.is_async)
+        self.assertIn('timings.csv', zipfile.ZipFile(BytesIO(streamed(response))).namelist())
+
+
+class ReportBatchWorkerTests(TransactionTestCase):
+    """Reports rendered by spawned worker processes, which open the (file) test database by name."""
+
+    def setUp(self):
+        self.survey, _ = seed_survey(question_count=3, response_count=6)
+        self.other = Survey.objects.create(name='Lobby', description='', department=self.survey.department)
+        SurveyQuestion.objects.create(survey=self.other, question_text='Clean?')
+
+    def test_two_workers_render_every_report(self):
+        period = report_period(timezone.localdate() - timedelta(days=30), timezone.localdate())
+        with tempfile.TemporaryDirectory() as directory:
+            reports = list(render_survey_reports(Survey.objects.all(), *period, directory, workers=2))
+            self.assertEqual([(report['status'], report['error']) for report in reports], [('ok', None)] * 2)
+            by_survey = {report['survey'].id: report['path'] for report in reports}
+            text = PdfReader(by_survey[self.survey.id]).pages[0].extract_text()
+        self.assertIn('Total Responses: 6', text)
+
+
+@override_settings(
+    STATIC_ROOT=tempfile.mkdtemp(),
+    STATICFILES_DIRS=[settings.BASE_DIR / 'app' / 'static'],
+    STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+)
+class StaticAssetTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        call_command('collectstatic', interactive=False, verbosity=0)
+        cls.url = staticfiles_storage.url('fontawesome/fontawesome.css')
+
+    def test_subset_covers_every_icon_in_the_templates(self):
+        css = (FONT_AWESOME_DIR / 'fontawesome.css').read_text()
+        for name in template_icon_classes([settings.BASE_DIR / 'app' / 'templates']):
+            self.assertIn(f'.{name} ', css.replace('::before', ' '), f'Run build_static_assets to add {name}')
+
+    def test_hashed_precompressed_and_cached_for_a_year(self):
+        self.assertRegex(self.url, r'^/static/fontawesome/fontawesome\.[0-9a-f]{12}\.css$')
+        plain = self.client.get(self.url)
+        self.assertRegex(b''.join(plain.streaming_content).decode(), r'fa-solid-900\.[0-9a-f]{12}\.woff2')
+        self.assertIn('immutable', plain['Cache-Control'])
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        response = self.client.get(self.url, headers={'Accept-Encoding': 'gzip, br'})
+        self.assertEqual(response['Content-Encoding'], 'br' if brotli else 'gzip')
+        self.assertEqual(response['Content-Type'], 'text/css')
+        response = self.client.get(self.url, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(gzip.decompress(streamed(response)), Path(settings.STATIC_ROOT, self.url[8:]).read_bytes())
+
+    def test_plain_names_and_missing_files(self):
+        response = self.client.get('/static/fontawesome/fontawesome.css')
+        self.assertNotIn('immutable', response['Cache-Control'])
+        self.assertFalse(list(Path(settings.STATIC_ROOT).glob('fontawesome/webfonts/*.gz')))
+        self.assertEqual(self.client.get(self.url + '.gz').status_code, 404)
+        self.assertEqual(self.client.get('/static/../db.sqlite3').status_code, 404)
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, _ = seed_survey(question_count=2, response_count=0)
+        # Several remarks share a timestamp, so the id has to break the tie
+        start = timezone.now() - timedelta(days=10)
+        add_responses(cls.survey, 40)
+        for i, response in enumerate(cls.survey.surveyresponse_set.order_by('id')):
+            response.timestamp = start + timedelta(days=i // 8)
+            response.remarks = f'Remark {i}'
+            response.save()
+        cls.url = reverse('survey_remarks', args=[cls.survey.id])
+
+    def walk(self, url, link):
+        seen = []
+        while url:
+            page = self.client.get(url).json()
+            seen.append([remark['id'] for remark in page['remarks']])
+            url = page[link]
+        return seen
+
+    def test_forward_and_backward_walks_see_every_remark_once(self):
+        expected = list(self.survey.surveyresponse_set.order_by('timestamp', 'id').values_list('id', flat=True))
+        forward = self.walk(self.url, 'next')
+        self.assertEqual(sum(forward, []), expected)
+        backward = self.walk(self.url + '?last=1', 'previous')
+        self.assertEqual(sum(reversed(backward), []), expected)
+
+    def test_links_keep_the_date_range(self):
+        start_date = str(timezone.localdate() - timedelta(days=8))
+        page = self.client.get(self.url, {'start_date': start_date}).json()
+        self.assertIn(f'start_date={start_date}', page['next'])
+        self.assertIsNone(page['previous'])
+        later = self.client.get(page['next']).json()
+        self.assertIn(f'start_date={start_date}', later['first'])
+
+    def test_malformed_cursor_shows_the_first_page(self):
+        first = self.client.get(self.url).json()
+        self.assertEqual(self.client.get(self.url, {'after': 'nonsense'}).json(), first)
+        # Past the range of datetime, or an id too large for the database
+        for cursor in ('99999999999999999999_1', '-99999999999999999999_1', '0_99999999999999999999'):
+            self.assertEqual(self.client.get(self.url, {'after': cursor}).json(), first)
+            self.assertEqual(self.client.get(self.url, {'before': cursor}).status_code, 200)
+
+    def test_admin_changelist_pages_by_cursor(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        url = reverse('admin:app_surveyresponse_changelist')
+        newest_first = list(self.survey.surveyresponse_set.order_by('-timestamp', '-id').values_list('id', flat=True))
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url, {'survey__id__exact': self.survey.id, 'last': 1})
+        self.assertEqual([row.id for row in response.context['cl'].result_list], newest_first)
+        self.assertFalse(any('COUNT(' in query['sql'] and 'survey_response' in query['sql'] for query in captured))
+
+
+class AdminChangelistTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, _ = seed_survey(question_count=3, response_count=20)
+        # The admin hides (and ignores) a survey filter with a single choice
+        Survey.objects.create(name='Lobby', description='', department=cls.survey.department)
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def changelist(self, model, params=None):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse(f'admin:app_{model}_changelist'), params or {})
+        self.assertEqual(response.status_code, 200)
+        return response.context['cl'], len(captured)
+
+    def test_every_model_has_its_own_admin(self):
+        for model in (Department, Survey, SurveyQuestion, SurveyResponse):
+            self.assertIsNot(type(admin.site._registry[model]), admin.ModelAdmin, model)
+
+    def test_answer_count_is_estimated_beyond_the_limit(self):
+        with patch('app.admin.EXACT_COUNT_LIMIT', 10):
+            cl, queries = self.changelist('surveyresponseanswer')
+            self.assertEqual(cl.paginator.count, estimated_row_count(SurveyResponseAnswer))
+            cl, _ = self.changelist('surveyresponseanswer', {'response__survey__id__exact': self.survey.id})
+            self.assertEqual(cl.paginator.count, 10)
+
+        add_responses(self.survey, 20)
+        with patch('app.admin.EXACT_COUNT_LIMIT', 10):
+            self.assertEqual(self.changelist('surveyresponseanswer')[1], queries)
+
+    def test_exact_search_and_date_hierarchy(self):
+        response = self.survey.surveyresponse_set.first()
+        cl, _ = self.changelist('surveyresponseanswer', {'q': str(response.id)})
+        self.assertEqual({answer.response_id for answer in cl.result_list}, {response.id})
+        cl, _ = self.changelist('surveyresponse', {'q': str(response.id)})
+        self.assertEqual([row.id for row in cl.result_list], [response.id])
+
+        local = timezone.localtime(response.timestamp)
+        cl, _ = self.changelist('surveyresponse', {'date': f'{local.year}-{local.month:02d}'})
+        self.assertIn(response.id, [row.id for row in cl.result_list])
+        cl, _ = self.changelist('surveyresponse', {'date': str(local.year - 1)})
+        self.assertEqual(cl.result_list, [])
+
+        for term in ('²', '99999999999999999999'):
+            self.assertEqual(list(self.changelist('surveyresponseanswer', {'q': term})[0].result_list), [])
+            self.assertEqual(list(self.changelist('surveyresponse', {'q': term})[0].result_list), [])
+        self.changelist('surveyresponse', {'date': '²'})
+
+    def test_answers_of_one_survey_are_listed_by_response(self):
+        cl, _ = self.changelist('surveyresponseanswer', {'response__survey__id__exact': self.survey.id})
+        newest_first = list(self.survey.surveyresponse_set.order_by('-timestamp', '-id').values_list('id', flat=True))
+        self.assertEqual(list(dict.fromkeys(answer.response_id for answer in cl.result_list)), newest_first)
+
+    def test_response_form_takes_a_survey_id(self):
+        response = self.client.get(reverse('admin:app_surveyresponse_change', args=[self.survey.surveyresponse_set.first().pk]))
+        self.assertIsInstance(response.context['adminform'].form.fields['survey'].widget, ForeignKeyRawIdWidget)
+
+
+class StatisticsApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=3, response_count=12)
+        cls.url = reverse('survey_statistics_api', args=[cls.survey.id])
+
+    def test_matches_the_statistics_page(self):
+        data = self.client.get(self.url).json()
+        page = self.client.get(reverse('survey_statistics_with_id', args=[self.survey.id])).context
+        self.assertEqual(data['total_responses'], page['total_responses'])
+        for question, shown in zip(data['questions'], page['question_counts']):
+            self.assertEqual(question['star_counts'], {str(star): getattr(shown, f'star_counts_{star}') for star in range(1, 6)})
+            self.assertAlmostEqual(question['average'], shown.avg_rating)
+        self.assertEqual([row['id'] for row in data['remarks']['results']], [row['id'] for row in page['remarks_page']])
+
+    def test_not_modified_without_aggregating(self):
+        etag = self.client.get(self.url)['ETag']
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(captured), 1)
+
+        add_responses(self.survey, 1)
+        self.assertEqual(self.client.get(self.url, headers={'If-None-Match': etag}).status_code, 200)
+
+    def test_deleting_an_older_response_changes_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.survey.surveyresponse_set.order_by('id').first().delete()
+        self.assertEqual(self.client.get(self.url, headers={'If-None-Match': etag}).status_code, 200)
+
+    def test_gzip_when_accepted(self):
+        plain = self.client.get(self.url)
+        response = self.client.get(self.url, headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertNotEqual(response['ETag'], plain['ETag'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+
+class TrendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=2, response_count=0)
+        # Local times; the last Sunday evening and Monday morning straddle a week boundary
+        local = [
+            (datetime(2026, 3, 2, 9), 5), (datetime(2026, 3, 8, 23, 30), 3),
+            (datetime(2026, 3, 9, 0, 30), 4), (datetime(2026, 4, 1, 12), 1),
+        ]
+        save_survey_responses([
+            {
+                'survey_id': cls.survey.id,
+                'answers': {question.id: value for question in cls.questions},
+                'remarks': '',
+                'ip_address': '127.0.0.1',
+                'timestamp': timezone.make_aware(timestamp),
+            }
+            for timestamp, value in local
+        ])
+
+    def trend(self, granularity, start=datetime(2026, 3, 1).date(), end=datetime(2026, 4, 5).date()):
+        buckets, questions = get_survey_trend(self.survey, start, end, granularity)
+        return buckets, questions[0].trend
+
+    def test_weekly_buckets_in_local_time(self):
+        buckets, trend = self.trend('week')
+        self.assertEqual(buckets[:3], trend_buckets(datetime(2026, 3, 1).date(), datetime(2026, 3, 15).date(), 'week'))
+        self.assertEqual([(first.isoformat(), last.isoformat()) for first, last in buckets[:2]], [
+            ('2026-03-01', '2026-03-01'), ('2026-03-02', '2026-03-08'),
+        ])
+        self.assertEqual(len(buckets), 6)
+        self.assertEqual(trend[:3], [(0, None), (2, 4.0), (1, 4.0)])
+        self.assertEqual(trend[5], (1, 1.0))
+
+    def test_monthly_and_numpy_backend_agree(self):
+        buckets, trend = self.trend('month')
+        self.assertEqual([first.month for first, _ in buckets], [3, 4])
+        self.assertEqual(trend, [(3, 4.0), (1, 1.0)])
+        with override_settings(SURVEY_STATISTICS_BACKEND='numpy'):
+            for granularity in ('day', 'week', 'month'):
+                with self.subTest(granularity=granularity):
+                    rollup = self.trend(granularity)
+                    self.assertEqual(self.trend(granularity), rollup)
+
+    def test_whole_weeks_from_the_trend_buckets(self):
+        questions = list(self.questions)
+        with CaptureQueriesContext(connection) as captured:
+            get_survey_trend(self.survey, datetime(2025, 3, 31).date(), datetime(2026, 3, 29).date(), 'week', questions)
+        self.assertEqual(len(captured), 1)
+        self.assertIn('question_trend_bucket', captured[0]['sql'])
+        self.assertEqual(questions[0].trend[-4:], [(2, 4.0), (1, 4.0), (0, None), (0, None)])
+
+        # Partial weeks at the ends come from the daily rollup
+        with CaptureQueriesContext(connection) as captured:
+            get_survey_trend(self.survey, datetime(2025, 4, 1).date(), datetime(2026, 3, 31).date(), 'week', questions)
+        self.assertEqual(len(captured), 2)
+
+    def test_rebuilt_buckets_match_the_recorded_ones(self):
+        recorded = self.trend('week'), self.trend('month')
+        QuestionTrendBucket.objects.all().delete()
+        self.assertEqual(rebuild_trend_buckets([self.survey.id]), 2 * (3 + 2))
+        self.assertEqual((self.trend('week'), self.trend('month')), recorded)
+
+    def test_api_and_statistics_page(self):
+        url = reverse('survey_trend_api', args=[self.survey.id])
+        data = self.client.get(url, {'start_date': '2026-03-01', 'end_date': '2026-04-05', 'granularity': 'month'}).json()
+        self.assertEqual(data['buckets'], [{'start': '2026-03-01', 'end': '2026-03-31'}, {'start': '2026-04-01', 'end': '2026-04-05'}])
+        self.assertEqual(data['questions'][0]['counts'], [3, 1])
+        self.assertEqual(data['questions'][0]['averages'], [4.0, 1.0])
+        self.assertEqual(self.client.get(url, {'granularity': 'year'}).status_code, 400)
+        self.assertEqual(len(self.client.get(url).json()['buckets']), 12)
+
+        page = self.client.get(
+            reverse('survey_statistics_with_id', args=[self.survey.id]),
+            {'start_date': '2026-03-01', 'end_date': '2026-04-05', 'granularity': 'day'},
+        )
+        self.assertEqual(len(page.context['trend_buckets']), 36)
+        self.assertEqual(page.context['question_counts'][0].trend[1], (1, 5.0))
+        self.assertIn('granularity=month', dict(page.context['trend_links'])['month'])
+
+    def test_ranges_that_end_at_the_last_date(self):
+        last = datetime.max.date()
+        for backend in ('rollup', 'numpy'):
+            with override_settings(SURVEY_STATISTICS_BACKEND=backend):
+                for granularity, first in (('day', datetime(9999, 12, 29)), ('week', datetime(9999, 12, 20)), ('month', datetime(9999, 10, 1))):
+                    with self.subTest(backend=backend, granularity=granularity):
+                        buckets, trend = self.trend(granularity, first.date(), last)
+                        self.assertEqual(buckets[-1][1], last)
+                        self.assertEqual(trend[-1], (0, None))
+
+        response = self.client.get(reverse('survey_trend_api', args=[self.survey.id]), {
+            'start_date': '9999-12-01', 'end_date': '9999-12-31', 'granularity': 'month',
+        })
+        self.assertEqual(response.json()['buckets'], [{'start': '9999-12-01', 'end': '9999-12-31'}])
+        page = self.client.get(reverse('survey_statistics_with_id', args=[self.survey.id]), {'end_date': '9999-12-31'})
+        self.assertEqual(page.context['trend_buckets'][-1], (datetime(9999, 12, 27).date(), last))
+
+    def test_long_ranges_are_capped(self):
+        start, end = datetime(2026, 2, 25).date(), datetime(2026, 4, 5).date()
+        for granularity in ('day', 'week', 'month'):
+            self.assertEqual(bucket_count(start, end, granularity), len(trend_buckets(start, end, granularity)))
+
+        url = reverse('survey_trend_api', args=[self.survey.id])
+        response = self.client.get(url, {'start_date': '2025-01-01', 'end_date': '2026-04-05', 'granularity': 'day'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('366', response.json()['error'])
+        self.assertEqual(self.client.get(url, {'start_date': '2016-05-01', 'end_date': '2026-04-05', 'granularity': 'month'}).status_code, 200)
+        with self.assertRaises(ValueError):
+            get_survey_trend(self.survey, datetime(2000, 1, 1).date(), end, 'week')
+
+        # The page falls back to weeks, then months, then the last months
+        page = reverse('survey_statistics_with_id', args=[self.survey.id])
+        for start_date, shown, buckets in (('2025-01-01', 'week', 66), ('2020-01-01', 'month', 76), ('2000-01-01', 'month', 120)):
+            with self.subTest(start_date=start_date):
+                context = self.client.get(page, {'start_date': start_date, 'end_date': '2026-04-05', 'granularity': 'day'}).context
+                self.assertEqual(context['trend_granularity'], shown)
+                self.assertEqual(len(context['trend_buckets']), buckets)
+        self.assertEqual(context['trend_buckets'][-1], (datetime(2026, 4, 1).date(), end))
+        # The JSON link asks for what the page shows
+        self.assertContains(self.client.get(page, {'start_date': '2000-01-01', 'end_date': '2026-04-05'}),
+                            'start_date=2016-05-01&amp;end_date=2026-04-05&amp;granularity=month')
+
+
+class BatchIngestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=3, response_count=0)
+        cls.url = reverse('survey_responses_api', args=[cls.survey.id])
+
+    def upload(self, responses, **headers):
+        return self.client.post(self.url, orjson.dumps({'responses': responses}), content_type='application/json', headers=headers)
+
+    def answers(self, value=4):
+        return {str(question.id): value for question in self.questions}
+
+    @override_settings(SURVEY_INGEST_TOKEN='secret')
+    def test_stores_valid_items_and_reports_the_rest(self):
+        response = self.upload([
+            {'answers': self.answers(), 'remarks': 'Offline', 'timestamp': '2024-01-05T10:30:00', 'idempotency_key': 'tablet-1:1'},
+            {'answers': {**self.answers(), str(self.questions[0].id): 9}},
+            {'answers': {str(self.questions[0].id): 3}},
+            {'answers': self.answers(2), 'idempotency_key': 'tablet-1:1'},
+        ], Authorization='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data['created'], data['invalid'], data['duplicates']), (1, 2, 1))
+        self.assertIn(f'question_{self.questions[0].id}', data['results'][1]['errors'])
+        self.assertIn(f'question_{self.questions[1].id}', data['results'][2]['errors'])
+
+        stored = SurveyResponse.objects.get(pk=data['results'][0]['id'])
+        self.assertEqual(stored.remarks, 'Offline')
+        self.assertEqual(timezone.localtime(stored.timestamp).replace(tzinfo=None), datetime(2024, 1, 5, 10, 30))
+        self.assertEqual(stored.surveyresponseanswer_set.count(), 3)
+
+    def test_odd_question_keys_are_reported(self):
+        data = self.upload([{'answers': {**self.answers(), '²': 3, 'x': 3}}]).json()
+        self.assertEqual(data['invalid'], 1)
+        self.assertIn('²', data['results'][0]['errors']['answers'])
+
+    @override_settings(SURVEY_INGEST_TOKEN='secret')
+    def test_timestamps_out_of_range_are_reported(self):
+        timestamps = [
+            '0001-01-01T00:00:00', '0001-01-01T00:00:00-05:00', '1970-01-01T00:00:00Z', '9999-12-31T23:59:59+14:00',
+            '2024-02-30T10:00:00', '2024-13-01T00:00:00', 5,
+        ]
+        data = self.upload([{'answers': self.answers(), 'timestamp': timestamp} for timestamp in timestamps], Authorization='Bearer secret').json()
+        self.assertEqual(data['invalid'], len(timestamps))
+        self.assertTrue(all('timestamp' in result['errors'] for result in data['results']))
+
+    def test_timestamps_are_ignored_without_a_token(self):
+        before = timezone.now()
+        data = self.upload([{'answers': self.answers(), 'timestamp': '2001-01-01T00:00:00Z'}]).json()
+        self.assertGreaterEqual(SurveyResponse.objects.get(pk=data['results'][0]['id']).timestamp, before)
+
+    def test_replayed_batch_is_not_stored_twice(self):
+        batch = [{'answers': self.answers(), 'idempotency_key': f'tablet-2:{i}'} for i in range(5)]
+        self.assertEqual(self.upload(batch).json()['created'], 5)
+        self.assertEqual(self.upload(batch).json()['duplicates'], 5)
+        self.assertEqual(self.survey.surveyresponse_set.count(), 5)
+
+    def test_statistics_include_uploaded_responses(self):
+        self.upload([{'answers': self.answers(5)} for _ in range(4)])
+        question = question_star_counts(self.survey)[0]
+        self.assertEqual(question.star_counts_5, 4)
+
+    def test_rejects_malformed_bodies_and_bad_tokens(self):
+        self.assertEqual(self.client.post(self.url, b'[', content_type='application/json').status_code, 400)
+        with override_settings(SURVEY_INGEST_TOKEN='secret'):
+            self.assertEqual(self.upload([]).status_code, 401)
+            self.assertEqual(self.upload([], Authorization='Bearer secret').status_code, 200)
+        with override_settings(SURVEY_INGEST_MAX_BATCH=2):
+            self.assertEqual(self.upload([{}] * 3).status_code, 413)
+
+
+class SubmissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=3, response_count=0)
+
+    def submit(self, survey, questions, value='4'):
+        data = {'survey': survey.id, 'remarks': 'Great'}
+        data.update({f'question_{question.id}': value for question in questions})
+        return self.client.post(reverse('survey_list', args=[survey.id]), data)
+
+    def test_answers_and_missing_choices_are_stored_together(self):
+        self.assertRedirects(self.submit(self.survey, self.questions), reverse('thank_you_page'), fetch_redirect_response=False)
+        response = SurveyResponse.objects.get(survey=self.survey)
+        self.assertEqual(response.remarks, 'Great')
+        self.assertEqual(
+            sorted(response.surveyresponseanswer_set.values_list('question_id', 'answer__choice_value')),
+            [(question.id, 4) for question in self.questions],
+        )
+        # The choices created by the first submission are reused by the next
+        self.submit(self.survey, self.questions)
+        self.assertEqual(AnswerChoice.objects.filter(question__survey=self.survey).count(), 3)
+
+    def test_query_count_does_not_grow_with_the_questions(self):
+        larger = Survey.objects.create(name='Long', description='', department=self.survey.department)
+        many = SurveyQuestion.objects.bulk_create([
+            SurveyQuestion(survey=larger, question_text=f'Question {i + 1}') for i in range(20)
+        ])
+        counts = []
+        for survey, questions in ((self.survey, self.questions), (larger, many)):
+            self.submit(survey, questions)
+            with CaptureQueriesContext(connection) as captured:
+                self.submit(survey, questions, '2')
+            counts.append(len(captured))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_failed_insert_leaves_nothing_behind(self):
+        with patch.object(SurveyResponseAnswer.objects, 'bulk_create', side_effect=RuntimeError('disk full')):
+            with self.assertRaises(RuntimeError):
+                save_survey_response(self.survey, self.questions, {f'question_{q.id}': '3' for q in self.questions}, '127.0.0.1')
+        self.assertFalse(SurveyResponse.objects.filter(survey=self.survey).exists())
+
+
+class RollupDeleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=3, response_count=10)
+
+    def rollup(self):
+        return (
+            sorted(QuestionStarRollup.objects.filter(count__gt=0).values_list('question_id', 'date', 'star_value', 'count')),
+            sorted(QuestionTrendBucket.objects.filter(count__gt=0).values_list('question_id', 'granularity', 'start', 'count', 'total')),
+        )
+
+    def assertRollupMatchesAnswers(self):
+        kept = self.rollup()
+        rebuild_star_rollup([self.survey.id])
+        self.assertEqual(kept, self.rollup())
+
+    def answered(self):
+        return sum(
+            getattr(question, f'star_counts_{star_value}')
+            for question in get_question_star_counts(self.survey) for star_value in STAR_VALUES
+        )
+
+    def test_deleting_responses_subtracts_their_answers(self):
+        responses = SurveyResponse.objects.filter(survey=self.survey).order_by('id')
+        SurveyResponse.objects.filter(pk__in=list(responses.values_list('pk', flat=True)[:5])).delete()
+        self.assertEqual(self.answered(), 15)
+        responses.first().delete()
+        self.assertEqual(self.answered(), 12)
+        self.assertRollupMatchesAnswers()
+
+    def test_deleting_answers_subtracts_them(self):
+        answers = SurveyResponseAnswer.objects.filter(question=self.questions[0])
+        answers.first().delete()
+        answers.filter(answer__choice_value=3).delete()
+        self.assertRollupMatchesAnswers()
+
+    def test_deleting_a_choice_rebuilds_the_survey(self):
+        AnswerChoice.objects.filter(question=self.questions[1], choice_value=2).delete()
+        self.assertFalse(QuestionStarRollup.objects.filter(question=self.questions[1], star_value=2, count__gt=0).exists())
+        self.assertRollupMatchesAnswers()
+
+    def test_edited_answer_rebuilds_the_survey(self):
+        answer = SurveyResponseAnswer.objects.filter(question=self.questions[2]).exclude(answer__choice_value=5).first()
+        answer.answer = AnswerChoice.objects.get_or_create(question=self.questions[2], choice_value=5)[0]
+        answer.save()
+        self.assertRollupMatchesAnswers()
+
+
+@override_settings(SURVEY_RESPONSE_ID_WINDOW=0)
+class QuestionAggregateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=3, response_count=10)
+
+    def answers(self):
+        stars = defaultdict(list)
+        for question_id, star_value in SurveyResponseAnswer.objects.filter(question__survey=self.survey).values_list('question_id', 'answer__choice_value'):
+            stars[question_id].append(star_value)
+        return stars
+
+    def assertAggregatesMatchAnswers(self):
+        aggregates = get_question_aggregates(self.survey.id)
+        answers = self.answers()
+        self.assertEqual(set(aggregates), set(answers))
+        for question_id, stars in answers.items():
+            self.assertEqual(aggregates[question_id]['count'], len(stars))
+            self.assertAlmostEqual(aggregates[question_id]['avg'], fmean(stars))
+            self.assertAlmostEqual(aggregates[question_id]['std'], pstdev(stars))
+
+    def mark(self):
+        return SurveyAggregateMark.objects.get(survey=self.survey).last_response_id
+
+    def test_newer_answers_are_folded_in_after_the_read(self):
+        self.assertAggregatesMatchAnswers()
+        self.assertEqual(self.mark(), SurveyResponse.objects.latest('id').id)
+        add_responses(self.survey, 4)
+        self.assertAggregatesMatchAnswers()
+        with self.settings(SURVEY_RESPONSE_ID_WINDOW=100):
+            add_responses(self.survey, 2)
+            # The folded rows and the sums above the mark
+            with self.assertNumQueries(2):
+                get_question_aggregates(self.survey.id)
+            self.assertAggregatesMatchAnswers()
+        self.assertEqual(self.mark(), SurveyResponse.objects.latest('id').id - 2)
+
+    @override_settings(SURVEY_RESPONSE_ID_WINDOW=10)
+    def test_responses_that_commit_late_inside_the_window_count_once(self):
+        last_id = SurveyResponse.objects.latest('id').id
+        respond_with_id(self.survey, self.questions, last_id + 30)
+        self.assertAggregatesMatchAnswers()
+        self.assertEqual(self.mark(), last_id + 20)
+        # Ids are taken at insert, so outside SQLite a lower one can commit last
+        respond_with_id(self.survey, self.questions, last_id + 25, star_value=1)
+        self.assertAggregatesMatchAnswers()
+        respond_with_id(self.survey, self.questions, last_id + 60, star_value=2)
+        self.assertAggregatesMatchAnswers()
+        self.assertEqual(self.mark(), last_id + 50)
+        self.assertAggregatesMatchAnswers()
+
+    def test_deletes_subtract_folded_answers(self):
+        get_question_aggregates(self.survey.id)
+        responses = SurveyResponse.objects.filter(survey=self.survey).order_by('id')
+        SurveyResponse.objects.filter(pk__in=list(responses.values_list('pk', flat=True)[:3])).delete()
+        responses.first().delete()
+        answers = SurveyResponseAnswer.objects.filter(question=self.questions[0])
+        answers.first().delete()
+        answers.filter(answer__choice_value=3).delete()
+        self.questions[1].delete()
+        # Everything is folded in, so the stored rows alone must match
+        stored = {
+            row['question_id']: row
+            for row in QuestionAggregate.objects.filter(survey=self.survey).values('question_id', 'count', 'total', 'total_squares')
+        }
+        self.assertEqual(set(stored), {self.questions[0].id, self.questions[2].id})
+        for question_id, stars in self.answers().items():
+            self.assertEqual(
+                (stored[question_id]['count'], stored[question_id]['total'], stored[question_id]['total_squares']),
+                (len(stars), sum(stars), sum(star * star for star in stars)),
+            )
+        self.assertAggregatesMatchAnswers()
+
+    def test_edited_answer_resets_the_survey(self):
+        get_question_aggregates(self.survey.id)
+        answer = SurveyResponseAnswer.objects.filter(question=self.questions[2]).exclude(answer__choice_value=5).first()
+        answer.answer = AnswerChoice.objects.get_or_create(question=self.questions[2], choice_value=5)[0]
+        answer.save()
+        self.assertFalse(SurveyAggregateMark.objects.filter(survey=self.survey).exists())
+        self.assertAggregatesMatchAnswers()
+
+    def test_rebuild_recomputes_the_folded_rows(self):
+        get_question_aggregates(self.survey.id)
+        QuestionAggregate.objects.filter(survey=self.survey).update(count=0, total=0, total_squares=0)
+        call_command('refresh_question_aggregates', '--rebuild', survey=[self.survey.id], stdout=StringIO())
+        self.assertEqual(QuestionAggregate.objects.filter(survey=self.survey).aggregate(Sum('count'))['count__sum'], 30)
+        self.assertAggregatesMatchAnswers()
+
+    def test_statistics_page_shows_average_and_deviation(self):
+        url = reverse('survey_statistics_with_id', args=[self.survey.id])
+        answers = self.answers()
+        for question in self.client.get(url).context['question_counts']:
+            self.assertAlmostEqual(question.avg_rating, fmean(answers[question.id]))
+            self.assertAlmostEqual(question.std_rating, pstdev(answers[question.id]))
+        # A date range is computed from the rollup's histogram
+        today = timezone.localdate().isoformat()
+        analytics._columns.clear()
+        statistics = star_statistics(get_survey_columns(self.survey.id), timezone.localdate(), timezone.localdate())
+        for question in self.client.get(url, {'start_date': today, 'end_date': today}).context['question_counts']:
+            self.assertAlmostEqual(question.avg_rating, statistics[question.id]['avg'])
+            self.assertAlmostEqual(question.std_rating, statistics[question.id]['std'])
+
+
+class RemarksTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Odd-numbered responses have remarks
+        cls.survey, cls.questions = seed_survey(question_count=3, response_count=12)
+        SurveyResponse.objects.create(survey=cls.survey, ip_address='127.0.0.1', remarks='No answers')
+
+    def test_remarks_of_answered_responses_with_their_answer_count(self):
+        page = self.client.get(reverse('survey_remarks', args=[self.survey.id])).json()
+        self.assertEqual([row['remark'] for row in page['remarks']], [f'Remark {i}' for i in (1, 3, 5, 7, 9)])
+        self.assertEqual({row['answers'] for row in page['remarks']}, {3})
+        last = self.client.get(page['next']).json()
+        self.assertEqual([row['remark'] for row in last['remarks']], ['Remark 11'])
+        self.assertIsNone(last['next'])
+
+    def test_statistics_page_shows_one_page_of_remarks(self):
+        response = self.client.get(reverse('survey_statistics_with_id', args=[self.survey.id]))
+        self.assertEqual([row['remark'] for row in response.context['remarks_page']], [f'Remark {i}' for i in (1, 3, 5, 7, 9)])
+        self.assertEqual(response.context['total_responses'], 13)
+
+    def test_benchmarks_walk_the_remarks_pages(self):
+        url = reverse('survey_statistics_with_id', args=[self.survey.id])
+        pages = [self.client.get(url, params).context['remarks_page'] for params in remarks_page_params(self.survey, 50)]
+        self.assertEqual([[row['remark'] for row in page] for page in pages], [
+            [f'Remark {i}' for i in (1, 3, 5, 7, 9)], ['Remark 11'],
+        ])
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=2, response_count=4)
+        # The first two responses were given ten days ago
+        cls.responses = list(cls.survey.surveyresponse_set.order_by('id'))
+        SurveyResponse.objects.filter(pk__in=[r.pk for r in cls.responses[:2]]).update(
+            timestamp=timezone.now() - timedelta(days=10),
+        )
+        cls.url = reverse('survey_export_with_id', args=[cls.survey.id])
+
+    def csv_rows(self, content):
+        return [line.split(',') for line in content.decode().splitlines()]
+
+    def test_csv_has_a_column_per_question(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = self.csv_rows(streamed(response))
+        self.assertEqual(rows[0], ['response_id', 'timestamp', 'Question 1', 'Question 2', 'remarks'])
+        self.assertEqual([int(row[0]) for row in rows[1:]], [r.id for r in self.responses])
+        first = self.responses[1]
+        self.assertEqual(rows[2][2:], [str((1 + q.id) % 5 + 1) for q in self.questions] + [first.remarks])
+
+    def test_ndjson_has_an_object_per_response(self):
+        response = self.client.get(self.url, {'format': 'ndjson'})
+        lines = [orjson.loads(line) for line in streamed(response).splitlines()]
+        self.assertEqual([line['response_id'] for line in lines], [r.id for r in self.responses])
+        self.assertEqual(lines[0]['ratings'], {str(q.id): (q.id % 5) + 1 for q in self.questions})
+
+    def test_date_range_filters_responses(self):
+        start_date = str(timezone.localdate() - timedelta(days=1))
+        response = self.client.get(self.url, {'start_date': start_date})
+        rows = self.csv_rows(streamed(response))
+        self.assertEqual([int(row[0]) for row in rows[1:]], [r.id for r in self.responses[2:]])
+        response = self.client.get(self.url, {'end_date': start_date, 'format': 'ndjson'})
+        self.assertEqual(len(streamed(response).splitlines()), 2)
+
+    def test_bad_parameters(self):
+        self.assertEqual(self.client.get(self.url, {'format': 'xml'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'start_date': '2024-13-01'}).status_code, 400)
+
+    @override_settings(ASYNC_VIEWS=True)
+    async def test_streams_asynchronously_under_asgi(self):
+        response = await self.async_client.get(self.url)
+        self.assertTrue(response.is_async)
+        content = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(self.csv_rows(content)), 5)
+
+
+class SurveyDefinitionCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=2, response_count=1)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_definition_is_read_once(self):
+        definition = get_survey_definition(self.survey.id)
+        self.assertEqual([q.id for q in definition.questions], [q.id for q in self.questions])
+        self.assertEqual(len(definition.choice_ids), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_survey_definition(str(self.survey.id)).version, definition.version)
+
+    def test_question_and_choice_changes_invalidate(self):
+        get_survey_definition(self.survey.id)
+        question = SurveyQuestion.objects.create(survey=self.survey, question_text='Added')
+        self.assertIn(question, get_survey_definition(self.survey.id).questions)
+        question.question_text = 'Renamed'
+        question.save()
+        self.assertEqual(get_survey_definition(self.survey.id).questions[-1].question_text, 'Renamed')
+        choice = AnswerChoice.objects.create(question=question, choice_value=3)
+        self.assertEqual(get_survey_definition(self.survey.id).choice_ids[question.id, 3], choice.id)
+        question.delete()
+        self.assertEqual(get_survey_definition(self.survey.id).questions, self.questions)
+
+    def test_survey_rename_invalidates(self):
+        get_survey_definition(self.survey.id)
+        Survey.objects.filter(pk=self.survey.pk).update(name='Stale')
+        self.assertEqual(get_survey_definition(self.survey.id).survey.name, 'Kiosk')
+        self.survey.name = 'Front desk'
+        self.survey.save()
+        self.assertEqual(get_survey_definition(self.survey.id).survey.name, 'Front desk')
+
+    def test_unknown_survey_raises(self):
+        with self.assertRaises(Survey.DoesNotExist):
+            get_survey_definition(self.survey.id + 100)
+
+    async def test_async_reads_share_the_cache(self):
+        definition = await aget_survey_definition(self.survey.id)
+        self.assertEqual((await aget_survey_definition(self.survey.id)).version, definition.version)
+        self.assertEqual(len(definition.questions), 2)
+
+
+class PageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=2, response_count=0)
+        cls.url = reverse('survey_list', args=[cls.survey.id])
+
+    def setUp(self):
+        cache.clear()
+
+    def test_survey_form_is_rendered_once_with_a_token_per_request(self):
+        first = self.client.get(self.url)
+        self.assertContains(first, 'Question 2')
+        with self.assertNumQueries(0):
+            second = self.client_class().get(self.url)
+        self.assertNotContains(second, CSRF_TOKEN_PLACEHOLDER)
+        self.assertNotEqual(first.cookies['csrftoken'].value, second.cookies['csrftoken'].value)
+
+    def test_cached_form_accepts_a_submission(self):
+        client = self.client_class(enforce_csrf_checks=True)
+        page = client.get(self.url).content.decode()
+        token = re.search(r'name="csrfmiddlewaretoken" value="([^"]+)"', page)[1]
+        data = {'survey': self.survey.id, 'csrfmiddlewaretoken': token}
+        data.update({f'question_{q.id}': '5' for q in self.questions})
+        self.assertEqual(client.post(self.url, data).status_code, 302)
+        self.assertEqual(SurveyResponse.objects.filter(survey=self.survey).count(), 1)
+
+    def test_edited_question_shows_up(self):
+        self.client.get(self.url)
+        self.questions[0].question_text = 'How was the wait?'
+        self.questions[0].save()
+        self.assertContains(self.client.get(self.url), 'How was the wait?')
+
+    def test_thank_you_page_revalidates(self):
+        url = reverse('thank_you_page')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('max-age=3600', response['Cache-Control'])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+
+class DatabaseTuningTests(SimpleTestCase):
+    def sqlite_connection(self, path):
+        # A connection of its own to a file, outside the test database
+        wrapper = type(connections['default'])({**connection.settings_dict, 'NAME': path}, alias='default')
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite connection settings')
+    def test_sqlite_connections_use_wal_and_a_busy_timeout(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.sqlite_connection(str(Path(directory, 'tuned.sqlite3'))).cursor() as cursor:
+                self.assertEqual(cursor.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+                self.assertEqual(cursor.execute('PRAGMA synchronous').fetchone()[0], 1)
+                self.assertEqual(cursor.execute('PRAGMA busy_timeout').fetchone()[0], 20000)
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite connection settings')
+    def test_second_writer_waits_instead_of_failing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory, 'locked.sqlite3'))
+            first, second = self.sqlite_connection(path), self.sqlite_connection(path)
+            with first.cursor() as cursor:
+                cursor.execute('CREATE TABLE submission (id INTEGER PRIMARY KEY)')
+            raw = first.connection
+            raw.execute('BEGIN IMMEDIATE')
+            raw.execute('INSERT INTO submission VALUES (1)')
+            threading.Timer(0.2, raw.commit).start()
+            started = time.perf_counter()
+            with second.cursor() as cursor:
+                cursor.execute('INSERT INTO submission VALUES (2)')
+                self.assertGreaterEqual(time.perf_counter() - started, 0.15)
+                self.assertEqual(cursor.execute('SELECT COUNT(*) FROM submission').fetchone()[0], 2)
+
+    def test_load_test_summary(self):
+        summary = summarize([i / 1000 for i in range(100, 0, -1)], elapsed=2.0, errors=1)
+        self.assertEqual(summary, {
+            'requests': 100, 'errors': 1, 'throughput': 50.0, 'p50_ms': 51.0, 'p95_ms': 95.0, 'p99_ms': 99.0,
+        })
+        self.assertEqual(summarize([], elapsed=0)['p99_ms'], 0.0)
+
+
+class ScratchDatabaseTests(SimpleTestCase):
+    databases = {'default'}
+
+    def test_names_are_restored(self):
+        names = connection.settings_dict['NAME'], connection.settings_dict['TEST']['NAME']
+        with scratch_database():
+            self.assertNotEqual(connection.settings_dict['NAME'], names[0])
+            self.assertFalse(Survey.objects.exists())
+        self.assertEqual((connection.settings_dict['NAME'], connection.settings_dict['TEST']['NAME']), names)
+        self.assertEqual(settings.DATABASES['default']['TEST']['NAME'], names[1])
+
+
+class SubmissionJournalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=2, response_count=0)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(override_settings(SURVEY_JOURNAL_DIR=directory.name))
+        self.rejected = Path(directory.name, 'submissions.rejected.jsonl')
+
+    def append(self, count, survey_id=None):
+        for i in range(count):
+            answers = {q.id: 4 for q in self.questions}
+            append_submission(survey_id or self.survey.id, answers, f'Journaled {i}', '127.0.0.1')
+
+    def stored(self):
+        return SurveyResponse.objects.filter(survey=self.survey).count()
+
+    def test_drain_stores_entries_and_compacts_the_journal(self):
+        self.append(3)
+        self.assertEqual(pending_entries(), 3)
+        self.assertEqual(drain_journal(batch_size=2), 3)
+        self.assertEqual(self.stored(), 3)
+        self.assertEqual(journal_path().stat().st_size, 0)
+        self.assertEqual(pending_entries(), 0)
+        self.assertEqual(drain_journal(), 0)
+
+    def test_bad_entries_are_set_aside(self):
+        self.append(1)
+        with open(journal_path(), 'ab') as handle:
+            handle.write(b'{"key": "broken"}\n')
+        self.append(1, survey_id=self.survey.id + 100)  # deleted since
+        self.append(1)
+        with self.assertLogs('app.journal', 'ERROR'):
+            self.assertEqual(drain_journal(), 4)
+        self.assertEqual(self.stored(), 2)
+        self.assertEqual(len(self.rejected.read_bytes().splitlines()), 2)
+
+    def test_locked_database_is_retried_later(self):
+        self.append(3)
+        with patch('app.journal.save_survey_responses', side_effect=OperationalError('database is locked')):
+            with self.assertLogs('app.journal', 'WARNING'):
+                self.assertEqual(drain_journal(), 0)
+        self.assertEqual(pending_entries(), 3)
+        self.assertFalse(self.rejected.exists())
+        self.assertEqual(drain_journal(), 3)
+        self.assertEqual(self.stored(), 3)
+
+    def test_replay_after_a_crash_stores_each_entry_once(self):
+        self.append(2)
+        # Crash after the commit but before the offset was written, with the
+        # next submission cut off half way
+        with patch('app.journal._write_offset', side_effect=SystemExit):
+            with self.assertRaises(SystemExit):
+                drain_journal()
+        self.assertEqual(self.stored(), 2)
+        with open(journal_path(), 'ab') as handle:
+            handle.write(b'{"key": "torn", "survey_')
+        self.assertEqual(drain_journal(), 2)
+        recover_journal()
+        self.append(1)
+        with self.assertLogs('app.journal', 'ERROR'):
+            self.assertEqual(drain_journal(), 2)
+        self.assertEqual(self.stored(), 3)
+        self.assertEqual(len(self.rejected.read_bytes().splitlines()), 1)
+        self.assertEqual(pending_entries(), 0)
+
+
+def async_urlconf():
+    """The project's URLs with the async respondent and statistics views, as routed under ASGI."""
+    swapped = {getattr(views, name): getattr(async_views, name) for name in ('survey_list', 'thank_you_page', 'survey_statistics')}
+    app_patterns = [
+        path(str(pattern.pattern), swapped.get(pattern.callback, pattern.callback), name=pattern.name)
+        for pattern in urls.urlpatterns
+    ]
+    urlconf = ModuleType('async_urls')
+    urlconf.urlpatterns = [
+        path(str(pattern.pattern), include(app_patterns)) if getattr(pattern, 'urlconf_module', None) is urls else pattern
+        for pattern in import_module(settings.ROOT_URLCONF).urlpatterns
+    ]
+    return urlconf
+
+
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.enterClassContext(override_settings(ROOT_URLCONF=async_urlconf()))
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=2, response_count=6)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_async_views_are_routed(self):
+        for url in (
+            reverse('survey_list', args=[self.survey.id]), reverse('thank_you_page'),
+            reverse('survey_statistics_with_id', args=[self.survey.id]),
+        ):
+            self.assertTrue(iscoroutinefunction(resolve(url).func), url)
+
+    async def test_form_and_submission(self):
+        url = reverse('survey_list', args=[self.survey.id])
+        self.assertContains(await self.async_client.get(url), 'Question 2')
+        data = {'survey': self.survey.id, 'remarks': 'Async'}
+        data.update({f'question_{q.id}': '5' for q in self.questions})
+        response = await self.async_client.post(url, data)
+        self.assertRedirects(response, reverse('thank_you_page'), fetch_redirect_response=False)
+        self.assertEqual(await SurveyResponse.objects.filter(survey=self.survey, remarks='Async').acount(), 1)
+        self.assertEqual(await SurveyResponseAnswer.objects.filter(response__remarks='Async', answer__choice_value=5).acount(), 2)
+
+    async def test_invalid_submission_shows_the_form_again(self):
+        url = reverse('survey_list', args=[self.survey.id])
+        response = await self.async_client.post(url, {'survey': self.survey.id})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(await SurveyResponse.objects.filter(survey=self.survey).acount(), 6)
+
+    async def test_thank_you_page_revalidates(self):
+        url = reverse('thank_you_page')
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((await self.async_client.get(url, headers={'If-None-Match': response['ETag']})).status_code, 304)
+
+    async def test_statistics_match_the_sync_view(self):
+        url = reverse('survey_statistics_with_id', args=[self.survey.id])
+        response = await self.async_client.get(url, {'granularity': 'day'})
+        self.assertEqual(response.status_code, 200)
+        context = response.context
+        expected = await sync_to_async(question_star_counts)(self.survey)
+        self.assertEqual(
+            [[getattr(q, f'star_counts_{v}') for v in STAR_VALUES] for q in context['question_counts']],
+            [[getattr(q, f'star_counts_{v}') for v in STAR_VALUES] for q in expected],
+        )
+        self.assertEqual(context['total_responses'], 6)
+        self.assertEqual(len(context['trend_buckets']), 30)
+        self.assertEqual([row['remark'] for row in context['remarks_page']], ['Remark 1', 'Remark 3', 'Remark 5'])
+
+    async def test_statistics_bad_parameters_redirect(self):
+        url = reverse('survey_statistics_with_id', args=[self.survey.id])
+        self.assertRedirects(await self.async_client.get(url, {'granularity': 'hour'}), url, fetch_redirect_response=False)
+        self.assertEqual((await self.async_client.get(url, {'start_date': 'soon'})).status_code, 302)
+        missing = reverse('survey_statistics_with_id', args=[self.survey.id + 100])
+        self.assertEqual((await self.async_client.get(missing)).status_code, 302)
+
+
+class NumpyBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, cls.questions = seed_survey(question_count=4, response_count=40)
+        # Spread the responses over three weeks
+        for i, response in enumerate(cls.survey.surveyresponse_set.order_by('id')):
+            SurveyResponse.objects.filter(pk=response.pk).update(timestamp=response.timestamp - timedelta(hours=13 * i))
+        rebuild_star_rollup([cls.survey.id])
+
+    def setUp(self):
+        # Ids are reused once a test's transaction is rolled back
+        analytics._columns.clear()
+
+    def statistics(self, count, start_date=None, end_date=None):
+        return [
+            [question.id, question.avg_rating] + [getattr(question, f'star_counts_{v}') for v in STAR_VALUES]
+            for question in count(self.survey, start_date, end_date)
+        ]
+
+    def assertBackendsAgree(self):
+        today = timezone.localdate()
+        for start_date, end_date in ((None, None), (today - timedelta(days=9), today - timedelta(days=2)), (today, None)):
+            numpy, rollup = self.statistics(numpy_star_counts, start_date, end_date), self.statistics(get_question_star_counts, start_date, end_date)
+            self.assertEqual([row[2:] for row in numpy], [row[2:] for row in rollup])
+            for (_, numpy_average, *_), (_, rollup_average, *_) in zip(numpy, rollup):
+                if rollup_average is None:
+                    self.assertIsNone(numpy_average)
+                else:
+                    self.assertAlmostEqual(numpy_average, rollup_average)
+
+    def test_histograms_match_the_rollup(self):
+        self.assertBackendsAgree()
+        add_responses(self.survey, 3)
+        self.assertBackendsAgree()
+
+    def test_deletes_elsewhere_are_seen_through_the_database(self):
+        get_survey_columns(self.survey.id)
+        generation = get_generation(self.survey.id)
+        SurveyResponse.objects.filter(survey=self.survey, pk__in=self.survey.surveyresponse_set.values('pk')[:7]).delete()
+        # Another process's cache never hears about it; the generation row does
+        cache.clear()
+        self.assertEqual(get_generation(self.survey.id), generation + 1)
+        self.assertEqual(len(get_survey_columns(self.survey.id)), 33 * 4)
+        self.assertBackendsAgree()
+
+    def test_responses_that_commit_below_the_mark_are_read(self):
+        answered = len(get_survey_columns(self.survey.id))
+        last_id = SurveyResponse.objects.latest('id').id
+        # Ids are taken at insert, so outside SQLite the lower one can commit last
+        respond_with_id(self.survey, self.questions, last_id + 10)
+        self.assertEqual(len(get_survey_columns(self.survey.id)), answered + 4)
+        respond_with_id(self.survey, self.questions, last_id + 5)
+        self.assertEqual(len(get_survey_columns(self.survey.id)), answered + 8)
+        # Generation, new rows and the count of the window below the mark
+        with self.assertNumQueries(3):
+            columns = get_survey_columns(self.survey.id)
+        self.assertEqual(len(columns), answered + 8)
+        self.assertEqual(columns.last_response_id, last_id + 10)
+
+    def test_new_rows_are_read_without_the_lock(self):
+        def new_rows(*args):
+            self.assertFalse(analytics._lock.locked())
+            return [], set()
+        with patch('app.analytics._new_rows', side_effect=new_rows) as read:
+            get_survey_columns(self.survey.id + 100)
+        read.assert_called_once()
+
+
+class RequestMetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey, _ = seed_survey(question_count=2, response_count=4)
+
+    def recorded_queries(self, view):
+        # (requests, queries) recorded so far for the view
+        series = DB_QUERIES_PER_REQUEST._values.get((('view', view),))
+        return (series[-2], series[-1]) if series else (0, 0)
+
+    def queries_of(self, view, request):
+        requests, queries = self.recorded_queries(view)
+        async_to_sync(request)() if iscoroutinefunction(request) else request()
+        after = self.recorded_queries(view)
+        self.assertEqual(after[0], requests + 1)
+        return after[1] - queries
+
+    def test_sync_requests_count_their_queries(self):
+        url = reverse('survey_remarks', args=[self.survey.id])
+        with CaptureQueriesContext(connection) as captured:
+            recorded = self.queries_of('survey_remarks', lambda: self.client.get(url))
+        self.assertEqual(recorded, len(captured))
+
+    def test_asgi_requests_count_their_queries(self):
+        url = reverse('survey_remarks', args=[self.survey.id])
+        expected = self.queries_of('survey_remarks', lambda: self.client.get(url))
+
+        async def sync_view_under_asgi():
+            await self.async_client.get(url)
+        self.assertEqual(self.queries_of('survey_remarks', sync_view_under_asgi), expected)
+
+        async def async_view():
+            response = await self.async_client.get(reverse('survey_statistics_with_id', args=[self.survey.id]))
+            self.assertEqual(response.status_code, 200)
+        with override_settings(ROOT_URLCONF=async_urlconf()):
+            self.assertGreater(self.queries_of('survey_statistics_with_id', async_view), 0)
+
+    async def test_queries_in_other_threads_are_observed(self):
+        # ASGI servers run sync code in executor threads with connections
+        # of their own; the request's context goes with it
+        recorder = QueryRecorder()
+
+        def query():
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            finally:
+                connection.close()
+        with observe_queries(recorder):
+            await sync_to_async(query, thread_sensitive=False)()
+        self.assertEqual(recorder.count, 1)
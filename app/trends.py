@@ -0,0 +1,235 @@
+# trends.py
+"""Answer counts and average ratings per question over time.
+
+A trend cuts a range of local dates (TIME_ZONE) into day, week (Monday to
+Sunday) or calendar month buckets. With the rollup backend, whole weeks and
+months are read from question_trend_bucket, one row per question and bucket,
+which app.rollup keeps up to date on every submission. Days, and the partial
+weeks or months at the ends of the range, are summed from the daily rows of
+question_star_rollup. The numpy backend bins the in-memory columns. Neither
+reads the answer table, so the cost follows the number of buckets, not the
+number of responses.
+"""
+from datetime import timedelta
+
+import numpy as np
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from .analytics import bucket_trend, get_survey_columns
+from .models import QuestionStarRollup, QuestionTrendBucket, SurveyQuestion
+from .rollup import TREND_BUCKET_GRANULARITIES, bucket_start
+
+GRANULARITIES = ('day', 'week', 'month')
+DEFAULT_GRANULARITY = 'week'
+# Buckets shown when the range has no start date
+DEFAULT_BUCKETS = {'day': 30, 'week': 12, 'month': 12}
+# And the most a range may have: a year of days, two years of weeks, ten of months
+MAX_BUCKETS = {'day': 366, 'week': 104, 'month': 120}
+
+
+def parse_granularity(value):
+    """The granularity named by a query parameter; empty means the default."""
+    if not value:
+        return DEFAULT_GRANULARITY
+    if value not in GRANULARITIES:
+        raise ValueError(f'Unknown granularity {value!r}; use {", ".join(GRANULARITIES)}.')
+    return value
+
+
+def _next_bucket_start(start, granularity):
+    # None for the bucket that holds date.max; there is no next one
+    try:
+        if granularity == 'week':
+            return start + timedelta(weeks=1)
+        if granularity == 'month':
+            return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return start + timedelta(days=1)
+    except OverflowError:
+        return None
+
+
+def bucket_count(start_date, end_date, granularity):
+    """Number of buckets trend_buckets() cuts the range into, without building them."""
+    if end_date < start_date:
+        return 0
+    if granularity == 'week':
+        return (bucket_start(end_date, 'week') - bucket_start(start_date, 'week')).days // 7 + 1
+    if granularity == 'month':
+        return (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+    return (end_date - start_date).days + 1
+
+
+def check_bucket_count(start_date, end_date, granularity):
+    """Raise ValueError if the range has more than MAX_BUCKETS[granularity] buckets."""
+    if bucket_count(start_date, end_date, granularity) > MAX_BUCKETS[granularity]:
+        raise ValueError(
+            f'At most {MAX_BUCKETS[granularity]} {granularity} buckets; '
+            f'shorten the range or use a coarser granularity.'
+        )
+
+
+def trend_buckets(start_date, end_date, granularity):
+    """(first day, last day) of every bucket from start_date to end_date, clipped to the range.
+
+    Raises ValueError beyond MAX_BUCKETS (see check_bucket_count).
+    """
+    check_bucket_count(start_date, end_date, granularity)
+    buckets = []
+    start = bucket_start(start_date, granularity)
+    while start is not None and start <= end_date:
+        following = _next_bucket_start(start, granularity)
+        last = end_date if following is None else min(following - timedelta(days=1), end_date)
+        buckets.append((max(start, start_date), last))
+        start = following
+    return buckets
+
+
+def default_start_date(end_date, granularity, count=None):
+    """Start of the range holding `count` (default DEFAULT_BUCKETS[granularity]) buckets up to end_date."""
+    start = bucket_start(end_date, granularity)
+    for _ in range((count or DEFAULT_BUCKETS[granularity]) - 1):
+        start = bucket_start(start - timedelta(days=1), granularity)
+    return start
+
+
+def trend_range(start_date=None, end_date=None, granularity=DEFAULT_GRANULARITY):
+    """Fill in an open range: it ends today and starts DEFAULT_BUCKETS buckets back."""
+    end_date = end_date or timezone.localdate()
+    return start_date or default_start_date(end_date, granularity), end_date
+
+
+def fit_trend_range(start_date=None, end_date=None, granularity=DEFAULT_GRANULARITY):
+    """(start_date, end_date, granularity) of a trend the statistics page can show.
+
+    A range with too many buckets is shown at the next coarser granularity
+    that fits; beyond MAX_BUCKETS months only the last ones are shown.
+    """
+    start_date, end_date = trend_range(start_date, end_date, granularity)
+    for coarser in GRANULARITIES[GRANULARITIES.index(granularity):]:
+        if bucket_count(start_date, end_date, coarser) <= MAX_BUCKETS[coarser]:
+            return start_date, end_date, coarser
+    return default_start_date(end_date, 'month', MAX_BUCKETS['month']), end_date, 'month'
+
+
+def _is_whole(bucket, granularity):
+    first, last = bucket
+    following = _next_bucket_start(first, granularity)
+    return first == bucket_start(first, granularity) and following is not None and last + timedelta(days=1) == following
+
+
+def rollup_trend(survey_id, question_ids, buckets, granularity):
+    """(counts, averages) arrays of shape (buckets, questions) from the trend buckets and daily rollup."""
+    shape = (len(buckets), len(question_ids))
+    index = {question_id: i for i, question_id in enumerate(question_ids)}
+    cells, answered, stars = [], [], []
+
+    def add(question_id, bucket, count, total):
+        if question_id in index:
+            cells.append(bucket * shape[1] + index[question_id])
+            answered.append(count)
+            stars.append(total)
+
+    # Whole buckets lie between the partial ones at the ends
+    whole = []
+    if granularity in TREND_BUCKET_GRANULARITIES:
+        whole = [i for i, bucket in enumerate(buckets) if _is_whole(bucket, granularity)]
+    if whole:
+        by_start = {buckets[i][0]: i for i in whole}
+        rows = QuestionTrendBucket.objects.filter(
+            survey_id=survey_id, granularity=granularity,
+            start__gte=buckets[whole[0]][0], start__lte=buckets[whole[-1]][0],
+        ).values_list('question_id', 'start', 'count', 'total')
+        for question_id, start, count, total in rows:
+            add(question_id, by_start[start], count, total)
+
+    days = [bucket for i, bucket in enumerate(buckets) if not whole or not whole[0] <= i <= whole[-1]]
+    if days:
+        first = buckets[0][0]
+        day_buckets = np.empty((buckets[-1][1] - first).days + 1, np.intp)
+        for i, (start, end) in enumerate(buckets):
+            day_buckets[(start - first).days:(end - first).days + 1] = i
+        # At most two ranges: all of it for days, else the partial buckets at the ends
+        merged = [list(days[0])]
+        for start, end in days[1:]:
+            if start == merged[-1][1] + timedelta(days=1):
+                merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        # The survey in every term lets each range use the (survey, date) index
+        ranges = Q()
+        for start, end in merged:
+            ranges |= Q(survey_id=survey_id, date__gte=start, date__lte=end)
+        rows = (
+            QuestionStarRollup.objects.filter(ranges)
+            .values_list('question_id', 'date')
+            .annotate(answered=Sum('count'), stars=Sum(F('count') * F('star_value')))
+            .order_by()
+        )
+        for question_id, date, count, total in rows:
+            add(question_id, day_buckets[(date - first).days], count, total)
+
+    cells = np.array(cells, np.intp)
+    counts = np.bincount(cells, weights=answered, minlength=shape[0] * shape[1]).astype(np.int64).reshape(shape)
+    totals = np.bincount(cells, weights=stars, minlength=shape[0] * shape[1]).reshape(shape)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        averages = totals / counts
+    return counts, averages
+
+
+def numpy_trend(survey_id, question_ids, buckets, granularity):
+    """rollup_trend() computed from the in-memory columns."""
+    shape = (len(buckets), len(question_ids))
+    counts, averages = np.zeros(shape, np.int64), np.full(shape, np.nan)
+    if not buckets:
+        return counts, averages
+    column_ids, column_counts, column_averages = bucket_trend(
+        get_survey_columns(survey_id), buckets[0][0], buckets[-1][1], [start for start, _ in buckets],
+    )
+    # The columns hold questions in the order they were first answered
+    index = {question_id: i for i, question_id in enumerate(column_ids)}
+    for i, question_id in enumerate(question_ids):
+        if question_id in index:
+            counts[:, i] = column_counts[:, index[question_id]]
+            averages[:, i] = column_averages[:, index[question_id]]
+    return counts, averages
+
+
+def get_survey_trend(survey, start_date=None, end_date=None, granularity=DEFAULT_GRANULARITY, questions=None):
+    """Per-bucket answer counts and averages of a survey's questions.
+
+    Returns (buckets, questions): the (first day, last day) of each bucket and
+    the questions, each with `trend` set to a (count, average) per bucket;
+    the average is None where nothing was answered. `questions` can be the
+    survey's questions already loaded, e.g. by question_star_counts().
+    """
+    start_date, end_date = trend_range(start_date, end_date, granularity)
+    buckets = trend_buckets(start_date, end_date, granularity)
+    if questions is None:
+        questions = list(SurveyQuestion.objects.filter(survey=survey))
+    question_ids = [question.id for question in questions]
+
+    trend = numpy_trend if settings.SURVEY_STATISTICS_BACKEND == 'numpy' else rollup_trend
+    counts, averages = trend(survey.id, question_ids, buckets, granularity)
+    for i, question in enumerate(questions):
+        question.trend = [
+            (int(count), None if np.isnan(average) else float(average))
+            for count, average in zip(counts[:, i], averages[:, i])
+        ]
+    return buckets, questions
+
+
+async def aget_survey_trend(survey, start_date=None, end_date=None, granularity=DEFAULT_GRANULARITY, questions=None):
+    return await sync_to_async(get_survey_trend)(survey, start_date, end_date, granularity, questions)
+
+
+def granularity_links(query):
+    """Query strings that switch the trend to each granularity, keeping the rest of `query`."""
+    links = []
+    for granularity in GRANULARITIES:
+        switched = query.copy()
+        switched['granularity'] = granularity
+        links.append((granularity, '?' + switched.urlencode()))
+    return links
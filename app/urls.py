@@ -1,5 +1,8 @@
 # urls.py
+from django.conf import settings
 from django.urls import path
+from . import async_views, views
+from .api import survey_responses_api, survey_statistics_api, survey_trend_api
 from .views import (
     SurveyListView,
     SurveyDetailView,
@@ -8,16 +11,22 @@ from .views import (
     SurveyQuestionCreateView,
     SurveyQuestionEditView, 
     survey_selection, 
-    survey_list, 
-    thank_you_page,
+    survey_journal_status,
     SurveyManagementView, 
     SurveyEditView,
-    survey_statistics,
+    survey_remarks,
     survey_pdf_report,
+    survey_pdf_report_status,
+    survey_export,
+    survey_qr_code,
+    survey_qr_codes_zip,
     
        
 )
 
+# Native async respondent and statistics views when served over ASGI
+respondent_views = async_views if settings.ASYNC_VIEWS else views
+
 urlpatterns = [
     path('surveys/list/', SurveyListView.as_view(), name='survey_list_view'),
     path('surveys/', SurveyDetailView.as_view(), name='survey_detail'),
@@ -27,10 +36,19 @@ urlpatterns = [
     path('surveys/add-question/', SurveyQuestionCreateView.as_view(), name='survey_question_create'),
     path('surveys/edit-question/<int:pk>/', SurveyQuestionEditView.as_view(), name='survey_question_edit'),
     path('survey/selection/', survey_selection, name='survey_selection'),
-    path('survey/list/<int:survey_id>/', survey_list, name='survey_list'),
-    path('thank-you/', thank_you_page, name='thank_you_page'),
+    path('survey/list/<int:survey_id>/', respondent_views.survey_list, name='survey_list'),
+    path('thank-you/', respondent_views.thank_you_page, name='thank_you_page'),
+    path('survey/journal/status/', survey_journal_status, name='survey_journal_status'),
     path('surveys/manage/', SurveyManagementView.as_view(), name='survey_management'),
     path('surveys/edit/<int:pk>/', SurveyEditView.as_view(), name='survey_edit'),
-    path('surveys/statistics/<int:survey_id>/', survey_statistics, name='survey_statistics_with_id'),
+    path('surveys/statistics/<int:survey_id>/', respondent_views.survey_statistics, name='survey_statistics_with_id'),
+    path('surveys/remarks/<int:survey_id>/', survey_remarks, name='survey_remarks'),
+    path('api/surveys/<int:survey_id>/statistics/', survey_statistics_api, name='survey_statistics_api'),
+    path('api/surveys/<int:survey_id>/trend/', survey_trend_api, name='survey_trend_api'),
+    path('api/surveys/<int:survey_id>/responses/', survey_responses_api, name='survey_responses_api'),
     path('surveys/pdf-report/<int:selected_survey_id>/', survey_pdf_report, name='survey_pdf_report_with_id'),
+    path('surveys/pdf-report/<int:selected_survey_id>/status/', survey_pdf_report_status, name='survey_pdf_report_status'),
+    path('surveys/export/<int:selected_survey_id>/', survey_export, name='survey_export_with_id'),
+    path('surveys/qr/<str:filename>', survey_qr_code, name='survey_qr_code'),
+    path('surveys/qr-codes.zip', survey_qr_codes_zip, name='survey_qr_codes_zip'),
 ]
@@ -3,19 +3,34 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.contrib import messages
 from django.urls import reverse_lazy, reverse
-from .models import Survey, SurveyQuestion, AnswerChoice, SurveyResponse, SurveyResponseAnswer
+from .models import Survey, SurveyQuestion
 from .forms import SurveyForm, SurveyQuestionForm, SurveyResponseForm
+from .ingest import get_answer_values, save_survey_response
+from .journal import append_submission, pending_entries, start_drainer
+from .remarks import get_remarks_page
+from .keyset import parse_cursor_params
+from .export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS
+from .reports import PdfReport, get_report_responses, get_report_status
+from .qr_assets import QR_FORMATS, get_survey_qr_urls, iter_qr_zip, qr_code_path
+from .analytics import question_star_counts
+from .trends import fit_trend_range, get_survey_trend, granularity_links, parse_granularity
+from .survey_cache import get_survey_definition
+from .page_cache import survey_form_response, thank_you_page_cached
+from .logs import sampled
+from .streaming import streaming_content
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
 from django.views import View
-from django.db.models import Count, Case, When, IntegerField, Sum, Avg
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.http import HttpResponse
-from django.template.loader import get_template
-from xhtml2pdf import pisa 
-from io import BytesIO
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from datetime import datetime, timedelta
 from django.utils import timezone
 from django.contrib.auth.decorators import login_required
 from allauth.account.views import LoginView as AllauthLoginView
+import logging
+
+logger = logging.getLogger(__name__)
 
 class CustomLoginView(AllauthLoginView):
     def get_success_url(self):
@@ -23,7 +38,9 @@ class CustomLoginView(AllauthLoginView):
     
 class SurveyListView(ListView):
     model = Survey
-    template_name = 'survey_list.html'
+    # survey_list.html is the respondent form; list the surveys to pick from
+    template_name = 'survey_selection.html'
+    context_object_name = 'surveys'
 
 class SurveyDetailView(View):
     template_name = 'survey_detail.html'
@@ -44,11 +61,13 @@ class SurveyDetailView(View):
             'selected_survey': selected_survey,
             'questions': questions,
             'form': form,
+            'qr_codes': get_survey_qr_urls(selected_survey.id) if selected_survey else None,
         }
         return render(request, self.template_name, context)
 
     def post(self, request, *args, **kwargs):
-        print(request.POST)
+        if sampled(logger):
+            logger.debug('survey question form posted', extra={'data': {'fields': sorted(request.POST.keys())}})
         surveys = Survey.objects.all()
         selected_survey = None
         questions = []
@@ -135,57 +154,60 @@ def survey_selection(request):
 
 def survey_list(request, survey_id=None):
     if request.method == 'POST':
-        print(request.POST)
         survey_id = request.POST.get('survey')
-        print(f"POST request - survey_id: {survey_id}")
 
-        # Get the selected survey
-        survey = Survey.objects.get(pk=survey_id)
-        questions = survey.surveyquestion_set.all()
-        form = SurveyResponseForm(request.POST, questions=questions)
+        # Get the selected survey and its questions from the definition cache
+        definition = get_survey_definition(survey_id)
+        form = SurveyResponseForm(request.POST, questions=definition.questions)
 
         if form.is_valid():
-            # Save the survey response
-            response = form.save(commit=False)
-            response.survey = survey
-            response.ip_address = request.META.get('REMOTE_ADDR')
-            response.save()
-            
-            # Set remarks for the response
-            response.remarks = form.cleaned_data.get('remarks')
-            response.save()
-
-            # Process each question and its answer
-            for question in questions:
-                answer_choice_value = form.cleaned_data.get(f'question_{question.id}')
-                try:
-                    answer_choice = AnswerChoice.objects.get(choice_value=answer_choice_value, question=question)
-                except AnswerChoice.DoesNotExist:
-                    print(f"AnswerChoice does not exist for question {question.id}.")
-
-                    # Check if answer_choice_value is not None before creating the AnswerChoice
-                    if answer_choice_value is not None:
-                        answer_choice = AnswerChoice.objects.create(choice_value=answer_choice_value, question=question)
-                    else:
-                        print("Invalid answer_choice_value. Skipping the creation of AnswerChoice.")
-                        continue
-
-                SurveyResponseAnswer.objects.create(response=response, question=question, answer=answer_choice)
+            if settings.SURVEY_WRITE_BEHIND:
+                # Journal the submission; the background drainer stores it
+                append_submission(
+                    definition.survey.id, get_answer_values(definition.questions, form.cleaned_data),
+                    form.cleaned_data.get('remarks'), request.META.get('REMOTE_ADDR'),
+                )
+                start_drainer()
+            else:
+                # Save the response, its remarks and every answer in one transaction
+                save_survey_response(
+                    definition.survey, definition.questions, form.cleaned_data,
+                    request.META.get('REMOTE_ADDR'), known_choice_ids=definition.choice_ids,
+                )
 
+            if sampled(logger):
+                logger.debug('survey response submitted', extra={'data': {
+                    'survey_id': definition.survey.id,
+                    'answers': len(definition.questions),
+                    'remarks_length': len(form.cleaned_data.get('remarks') or ''),
+                    'write_behind': settings.SURVEY_WRITE_BEHIND,
+                }})
             return redirect('thank_you_page')  # Redirect after processing the form
 
     elif survey_id is None:
-        print("Redirecting to survey_selection")
         return redirect('survey_selection')
 
-    # Render the page with the selected survey
-    survey = Survey.objects.get(pk=survey_id)
-    questions = survey.surveyquestion_set.all()
-    form = SurveyResponseForm(questions=questions)
-    return render(request, 'survey_list.html', {'survey': survey, 'questions': questions, 'form': form})
+    # Render the page with the selected survey, reusing the cached html
+    definition = get_survey_definition(survey_id)
+    return survey_form_response(request, definition)
 
+@cache_control(public=True, max_age=3600)
+@condition(
+    etag_func=lambda request: thank_you_page_cached()['etag'],
+    last_modified_func=lambda request: thank_you_page_cached()['last_modified'],
+)
 def thank_you_page(request):
-    return render(request, 'thank_you_page.html') 
+    # The same for every respondent, so it is rendered once and revalidated
+    # with ETag/Last-Modified
+    return HttpResponse(thank_you_page_cached()['content'])
+
+@staff_member_required
+def survey_journal_status(request):
+    # Queue depth of the write-behind submission journal
+    return JsonResponse({
+        'write_behind': settings.SURVEY_WRITE_BEHIND,
+        'pending': pending_entries(),
+    })
 
 class SurveyManagementView(View):
     template_name = 'survey_create.html'
@@ -225,276 +247,150 @@ class SurveyEditView(UpdateView):
     success_url = reverse_lazy('survey_management')
     
 
-def survey_statistics(request, survey_id=0):
-    # print(f"Survey ID: {survey_id}")
+def _parse_statistics_dates(start_date_str, end_date_str):
+    # Naive datetimes (midnight) for the given YYYY-MM-DD strings, or None
+    start_date = datetime.strptime(start_date_str, '%Y-%m-%d') if start_date_str else None
+    end_date = datetime.strptime(end_date_str, '%Y-%m-%d') if end_date_str else None
+    return start_date, end_date
+
+def _filter_statistics_responses(responses, start_date, end_date):
+    if start_date:
+        responses = responses.filter(timestamp__gte=timezone.make_aware(datetime.combine(start_date, datetime.min.time())))
+    if end_date:
+        responses = responses.filter(timestamp__lte=timezone.make_aware(datetime.combine(end_date, datetime.max.time())))
+    return responses
 
+def survey_statistics(request, survey_id=0):
     try:
         survey = Survey.objects.get(pk=survey_id)
     except Survey.DoesNotExist:
         messages.warning(request, 'Invalid survey ID. Please select a valid survey.')
         
         # Get the URL with preserved query parameters
-        redirect_url = reverse('survey_selection_with_id') + '?' + request.GET.urlencode()
+        redirect_url = reverse('survey_selection') + '?' + request.GET.urlencode()
         
         return redirect(redirect_url)
 
     responses = survey.get_responses()
-    
-    # Initialize start_date and end_date outside the try-except block
-    start_date = None
-    end_date = None
 
     # Filter responses based on the selected date range
     start_date_str = request.GET.get('start_date', '')
     end_date_str = request.GET.get('end_date', '')
 
     try:
-        if start_date_str:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            responses = responses.filter(timestamp__gte=timezone.make_aware(datetime.combine(start_date, datetime.min.time())))
-
-        if end_date_str:
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-            responses = responses.filter(timestamp__lte=timezone.make_aware(datetime.combine(end_date, datetime.max.time())))
+        start_date, end_date = _parse_statistics_dates(start_date_str, end_date_str)
     except ValueError:
         # Handle invalid date format gracefully, you may want to provide a message to the user
         messages.error(request, 'Invalid date format. Please use YYYY-MM-DD format.')
-        return redirect('survey_statistics', survey_id=survey_id)
-    
-   # Calculate star counts for each question
-    star_counts_annotations = {
-        f'star_counts_{i}': Count(
-            Case(
-                When(
-                    surveyresponseanswer__answer__choice_value=i,
-                    surveyresponseanswer__response__survey=survey,
-                    surveyresponseanswer__response__timestamp__date__range=(start_date, end_date),
-                    then=1
-                ),
-                output_field=IntegerField()
-            )
-        ) for i in range(1, 6)
-    }
-
-    question_counts = SurveyQuestion.objects.filter(survey=survey).annotate(**star_counts_annotations)
-    
-    # Calculate average rating for each question
-    question_averages = SurveyQuestion.objects.filter(survey=survey).annotate(avg_rating=Avg('surveyresponseanswer__answer__choice_value'))
-
-
-    # Fetch remarks directly from SurveyResponse model with annotations
-    remarks = SurveyResponseAnswer.objects.filter(
-        response__survey=survey,
-        response__timestamp__date__range=(start_date, end_date)
-    ).exclude(response__remarks__exact='').order_by('response__timestamp')
-    
-    # Extract unique remarks and their counts
-    unique_remarks = []
-
-    for response in remarks:
-        response_id = response.response.id
-        remark = response.response.remarks
-        timestamp = response.response.timestamp
-
-        existing_remark = next((item for item in unique_remarks if item['id'] == response_id), None)
-
-        if existing_remark:
-            existing_remark['count'] += 1
-            existing_remark['timestamps'].append(timestamp)
-        else:
-            unique_remarks.append({
-                'id': response_id,
-                'remark': remark,
-                'count': 1,
-                'timestamps': [timestamp],
-            })
-    # Sort unique remarks based on the first timestamp if it exists
-    unique_remarks.sort(key=lambda x: x.get('timestamps', [None])[0] if x.get('timestamps') and x.get('timestamps')[0] is not None else float('inf'))
-    
-    # Paginate unique_remarks
-    remarks_paginator = Paginator(unique_remarks, 5)
-    page = request.GET.get('page', 1)
-
+        return redirect('survey_statistics_with_id', survey_id=survey_id)
     try:
-        remarks_page = remarks_paginator.page(page)
-    except PageNotAnInteger:
-        remarks_page = remarks_paginator.page(1)
-    except EmptyPage:
-        remarks_page = remarks_paginator.page(remarks_paginator.num_pages)
+        granularity = parse_granularity(request.GET.get('granularity'))
+    except ValueError as exc:
+        messages.error(request, str(exc))
+        return redirect('survey_statistics_with_id', survey_id=survey_id)
+    responses = _filter_statistics_responses(responses, start_date, end_date)
+
+    # Star counts and average rating for each question from the configured statistics backend
+    question_counts = question_star_counts(
+        survey,
+        start_date.date() if start_date else None,
+        end_date.date() if end_date else None,
+    )
+    question_averages = question_counts
+
+    # Counts and averages per day, week or month, on the same questions
+    # A range with too many buckets is shown at a coarser granularity
+    trend_start, trend_end, granularity = fit_trend_range(
+        start_date.date() if start_date else None,
+        end_date.date() if end_date else None,
+        granularity,
+    )
+    trend_buckets, _ = get_survey_trend(survey, trend_start, trend_end, granularity, questions=question_counts)
+
+    # Remarks are counted, ordered and paginated by cursor in the database
+    remarks_page = get_remarks_page(responses, **parse_cursor_params(request.GET))
         
-    print(f"Page Info: {remarks_page.has_previous()}, {remarks_page.has_next()}, {remarks_page.number}, {remarks_page.paginator.num_pages}")
+    if sampled(logger):
+        logger.debug('survey statistics page', extra={'data': {
+            'survey_id': survey.id,
+            'start_date': start_date_str,
+            'end_date': end_date_str,
+            'after': request.GET.get('after'),
+            'before': request.GET.get('before'),
+        }})
 
     context = {
         'survey': survey,
         'responses': responses,
         'remarks_page': remarks_page,
+        'remarks_links': remarks_page.links(request.GET),
         'total_responses': responses.count(),
         'question_counts': question_counts,
         'question_averages': question_averages,
+        'trend_granularity': granularity,
+        'trend_buckets': trend_buckets,
+        'trend_start': trend_start,
+        'trend_end': trend_end,
+        'trend_links': granularity_links(request.GET),
         'start_date': start_date_str,  # Pass start_date to the context
         'end_date': end_date_str,  # Pass end_date to the context
-        'unique_remarks': unique_remarks,
     }
-    
-    # print(f"Total Remarks: {remarks.count()}")
-    # print(f"Remarks per Page: {remarks_paginator.per_page}")
-    # print("Remarks QuerySet:", remarks)
-    # print(f"Start Date: {start_date_str}, End Date: {end_date_str}")
 
     return render(request, 'survey_statistics.html', context)
 
-def render_to_pdf(template_src, context_dict):
-    template = get_template(template_src)
-    html = template.render(context_dict)
-    result = BytesIO()
-    pdf = pisa.pisaDocument(BytesIO(html.encode("UTF-8")), result)
-    if not pdf.err:
-        return HttpResponse(result.getvalue(), content_type='application/pdf')
-    return None
+def survey_remarks(request, survey_id):
+    survey = get_object_or_404(Survey, pk=survey_id)
+    try:
+        start_date, end_date = _parse_statistics_dates(request.GET.get('start_date', ''), request.GET.get('end_date', ''))
+    except ValueError:
+        return JsonResponse({'error': 'Invalid date format. Please use YYYY-MM-DD format.'}, status=400)
+
+    responses = _filter_statistics_responses(survey.get_responses(), start_date, end_date)
+    remarks_page = get_remarks_page(responses, **parse_cursor_params(request.GET))
+    links = remarks_page.links(request.GET)
+    return JsonResponse({
+        'remarks': [
+            {'id': row['id'], 'timestamp': row['timestamp'], 'remark': row['remark'], 'answers': row['count']}
+            for row in remarks_page
+        ],
+        # Absolute URLs of the neighbouring pages, with the date range kept
+        **{name: request.build_absolute_uri(request.path + link) if link else None for name, link in links.items()},
+    })
+
+def _parse_report_dates(request):
+    # Naive local datetimes covering whole days, or None when not given
+    start_date_str = request.GET.get('start_date', '')
+    end_date_str = request.GET.get('end_date', '')
+
+    start_date = datetime.strptime(start_date_str, '%Y-%m-%d') if start_date_str else None
+    end_date = None
+    if end_date_str:
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d') + timedelta(days=1) - timedelta(seconds=1)
+        end_date = end_date.replace(microsecond=999999)
+    return start_date, end_date
 
 def survey_pdf_report(request, selected_survey_id):
     survey = get_object_or_404(Survey, pk=selected_survey_id)
 
     # Get start_date and end_date from the request parameters
-    start_date_str = request.GET.get('start_date', '')
-    end_date_str = request.GET.get('end_date', '')
-    all_responses = None
     try:
-        if start_date_str:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        else:
-            start_date = None
-
-        if end_date_str:
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d') + timedelta(days=1) - timedelta(seconds=1)
-            end_date = end_date.replace(microsecond=999999)
-        else:
-            end_date = None
-
-    
-            # Reuse filtering logic from survey_statistics
-            # all_responses = SurveyResponse.get_survey_responses(start_date, end_date)   
-
-        
-            # Explicitly filter responses based on start_date and end_date
-            if start_date:
-                all_responses = all_responses.filter(timestamp__gte=start_date)
-
-            if end_date:
-                all_responses = all_responses.filter(timestamp__lte=end_date)
-        
-        all_responses = SurveyResponse.objects.filter(
-        survey=survey,
-        timestamp__gte=start_date,
-        timestamp__lte=end_date
-        )
-        
-             
-        print(all_responses) 
-           
+        start_date, end_date = _parse_report_dates(request)
     except ValueError as e:
-        print(f'Error parsing date: {e}')
-        # Print the generated SQL query for debugging (if all_responses is not None)
-        if all_responses is not None:
-            print(all_responses.query)
+        logger.info('invalid report date', extra={'data': {'survey_id': survey.id, 'error': str(e)}})
         # Handle invalid date format gracefully, you may want to provide a message to the user
         messages.error(request, 'Invalid date format. Please use YYYY-MM-DD format.')
         return redirect('survey_pdf_report_with_id', selected_survey_id=selected_survey_id)
-    
-    # Check if all_responses is not None before calculating total_responses
-    if all_responses is not None:
-        # Calculate total_responses using the explicitly filtered responses
-        total_responses = all_responses.count()
-        # Print the total_responses for debugging
-    else:
-        total_responses = 0
-    
-    print(f'Total Responses: {total_responses}')
-    print(f'Start Date: {start_date}')
-    print(f'End Date: {end_date}')
-    print(f'Start Date (Formatted): {start_date.strftime("%Y-%m-%d %H:%M:%S")}')
-    print(f'End Date (Formatted): {end_date.strftime("%Y-%m-%d %H:%M:%S")}')
-
-    question_counts = (
-        SurveyQuestion.objects.filter(survey=survey)
-        .annotate(
-            star_counts_1=Sum(
-                Case(
-                    When(
-                        surveyresponseanswer__answer__choice_value=1,
-                        surveyresponseanswer__response__timestamp__gte=start_date,
-                        surveyresponseanswer__response__timestamp__lte=end_date,
-                        then=1
-                    ),
-                    default=0,
-                    output_field=IntegerField()
-                )
-            ),
-            star_counts_2=Sum(
-                Case(
-                    When(
-                        surveyresponseanswer__answer__choice_value=2,
-                        surveyresponseanswer__response__timestamp__gte=start_date,
-                        surveyresponseanswer__response__timestamp__lte=end_date,
-                        then=1
-                    ),
-                    default=0,
-                    output_field=IntegerField()
-                )
-            ),
-            star_counts_3=Sum(
-                Case(
-                    When(
-                        surveyresponseanswer__answer__choice_value=3,
-                        surveyresponseanswer__response__timestamp__gte=start_date,
-                        surveyresponseanswer__response__timestamp__lte=end_date,
-                        then=1
-                    ),
-                    default=0,
-                    output_field=IntegerField()
-                )
-            ),
-            star_counts_4=Sum(
-                Case(
-                    When(
-                        surveyresponseanswer__answer__choice_value=4,
-                        surveyresponseanswer__response__timestamp__gte=start_date,
-                        surveyresponseanswer__response__timestamp__lte=end_date,
-                        then=1
-                    ),
-                    default=0,
-                    output_field=IntegerField()
-                )
-            ),
-            star_counts_5=Sum(
-                Case(
-                    When(
-                        surveyresponseanswer__answer__choice_value=5,
-                        surveyresponseanswer__response__timestamp__gte=start_date,
-                        surveyresponseanswer__response__timestamp__lte=end_date,
-                        then=1
-                    ),
-                    default=0,
-                    output_field=IntegerField()
-                )
-            ),
-        )
-    )
 
+    if sampled(logger):
+        logger.debug('survey pdf report', extra={'data': {'survey_id': survey.id, 'start_date': start_date, 'end_date': end_date}})
 
-    # Other data you want to include in the PDF context
-    context = {
-        'survey': survey,
-        'responses': all_responses,
-        'total_responses': total_responses,
-        'question_counts': question_counts,
-        'start_date': start_date,  
-        'end_date': end_date,
-    }
+    # Serve the cached file when this exact data has been rendered before,
+    # otherwise render it in the background and let the client poll
+    report = PdfReport(survey, start_date, end_date)
+    status = get_report_status(report)
 
-    pdf = render_to_pdf('survey_pdf_template.html', context)
-    if pdf:
-        response = HttpResponse(pdf, content_type='application/pdf')
+    if status == 'ready':
+        response = FileResponse(open(report.path, 'rb'), content_type='application/pdf')
         filename = f'{survey.name}_report.pdf'
         response['Content-Disposition'] = f'filename="{filename}"'
 
@@ -503,5 +399,63 @@ def survey_pdf_report(request, selected_survey_id):
             response['Content-Disposition'] = 'inline;' + response['Content-Disposition']
 
         return response
-    return HttpResponse('Error generating PDF', status=500)
 
+    if status == 'failed':
+        return HttpResponse('Error generating PDF', status=500)
+
+    context = {
+        'survey': survey,
+        'status_url': reverse('survey_pdf_report_status', kwargs={'selected_survey_id': survey.id}) + '?' + request.GET.urlencode(),
+        'download_url': request.get_full_path(),
+    }
+    return render(request, 'survey_pdf_pending.html', context, status=202)
+
+def survey_pdf_report_status(request, selected_survey_id):
+    survey = get_object_or_404(Survey, pk=selected_survey_id)
+    try:
+        start_date, end_date = _parse_report_dates(request)
+    except ValueError:
+        return JsonResponse({'status': 'failed', 'error': 'Invalid date format. Please use YYYY-MM-DD format.'}, status=400)
+
+    return JsonResponse({'status': get_report_status(PdfReport(survey, start_date, end_date))})
+
+def survey_export(request, selected_survey_id):
+    survey = get_object_or_404(Survey, pk=selected_survey_id)
+
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponse('Unsupported export format. Use csv or ndjson.', status=400)
+
+    try:
+        start_date, end_date = _parse_report_dates(request)
+    except ValueError:
+        return HttpResponse('Invalid date format. Please use YYYY-MM-DD format.', status=400)
+
+    # One line per response, streamed straight from the database cursor
+    content_type, iter_lines = EXPORT_FORMATS[export_format]
+    responses = get_report_responses(survey, start_date, end_date)
+    response = StreamingHttpResponse(
+        streaming_content(iter_lines(survey, responses), EXPORT_CHUNK_SIZE), content_type=content_type,
+    )
+    response['Content-Disposition'] = f'attachment; filename="{survey.name}_responses.{export_format}"'
+    return response
+
+@cache_control(public=True, max_age=31536000, immutable=True)
+def survey_qr_code(request, filename):
+    # The name carries a hash of the content, so it can be cached forever
+    path = qr_code_path(filename)
+    if path is None:
+        raise Http404('No such QR code.')
+    return FileResponse(open(path, 'rb'), content_type=QR_FORMATS[path.suffix[1:]])
+
+def survey_qr_codes_zip(request):
+    surveys = Survey.objects.order_by('id')
+    department = request.GET.get('department', '')
+    if department:
+        if not department.isdecimal():
+            return HttpResponse('Invalid department id.', status=400)
+        surveys = surveys.filter(department_id=int(department))
+
+    response = StreamingHttpResponse(streaming_content(iter_qr_zip(surveys)), content_type='application/zip')
+    response['Content-Disposition'] = 'attachment; filename="survey_qr_codes.zip"'
+    return response
@@ -0,0 +1,19 @@
+# worker_setup.py
+"""Initializer for process pools that run Django code in spawned processes.
+
+It is kept free of model imports: a spawned process unpickles the
+initializer, and so imports its module, before Django is set up.
+"""
+import django
+from django.db import connections
+
+
+def setup_worker(database_names):
+    """Set up Django, on the parent's databases, which may not be the ones in settings (benchmark scratch copies)."""
+    django.setup()
+    for alias, name in database_names.items():
+        connections[alias].settings_dict['NAME'] = name
+
+
+def database_names():
+    return {alias: connections[alias].settings_dict['NAME'] for alias in connections}